@@ -1,27 +1,60 @@
 import traceback
-from typing import List
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from enum import Enum
+from typing import Callable, List, Tuple
 
+import numpy as np
 import pandas as pd
-from gspread_formatting import set_column_widths
 from loguru import logger
-
+from pytz import utc
+
+from nfl_commish.batch_requests import (
+    add_sheet_request,
+    column_widths_requests,
+    format_request,
+    sheet_id_for_title,
+    update_values_request,
+)
+from nfl_commish.elimination import race_status, remaining_week_max_points
 from nfl_commish.game import (
     Game,
-    get_completed_games,
     get_the_odds_json,
-    get_this_weeks_games,
-    is_same_team,
     parse_the_odds_json,
     str_match_team_name,
 )
+from nfl_commish.game_store import GameStore
+from nfl_commish.game_table import GameTable
+from nfl_commish.scoring import game_rows, pick_matrix, score_week
 from nfl_commish.settings import Settings
+from nfl_commish.simulation import (
+    UNPICKED,
+    flat_home_win_probabilities,
+    h2h_home_win_probabilities,
+    simulate_league,
+    week_starts,
+)
+from nfl_commish.standings import (
+    SeasonStandings,
+    get_season_standings,
+    week_sheet_points,
+)
+from nfl_commish.state import read_league_state, record_week_games
 from nfl_commish.utils import (
     ALPHABET,
+    WriteBuffer,
+    batch_update_spreadsheet,
     catch_with_logging,
+    list_worksheet_names,
     open_sheet,
+    open_worksheet,
     read_worksheet_as_df,
-    update_cell,
+    read_worksheet_columns,
+    read_worksheets_as_dfs,
+    worksheet_cache_scope,
 )
+from nfl_commish.validation import validate_week_picks
 
 settings = Settings()
 
@@ -39,18 +72,28 @@ def get_current_week_num(
     Returns:
         int: The current week number
     """
+    # Use the persisted league state, if there is one
+    if settings.league_state_path is not None:
+        state = read_league_state(state_path=settings.league_state_path)
+        if state is not None:
+            return state.current_week_number
+
     # Get the names of the admin sheet's worksheets
-    sh = open_sheet(gspread_secret_path=gspread_secret_path, sheet_name=admin_sheet_name)
-    worksheet_names = [ws.title for ws in sh.worksheets()]
+    worksheet_names = list_worksheet_names(
+        gspread_secret_path=gspread_secret_path, sheet_name=admin_sheet_name
+    )
 
     # Find the max week number
     week_numbers = [int(name.split(" ")[1]) for name in worksheet_names if "Week" in name]
     week_number = max(week_numbers) if week_numbers else 1
 
-    # Determine whether all games are completed
-    worksheet_name = f"Week {week_number}"
-    ws = sh.worksheet(worksheet_name)
-    df = pd.DataFrame(ws.get_all_records())
+    # Determine whether all games are completed, reading only the columns we need
+    df = read_worksheet_columns(
+        gspread_secret_path=gspread_secret_path,
+        sheet_name=admin_sheet_name,
+        worksheet_name=f"Week {week_number}",
+        columns=["Game ID", "Winner"],
+    )
     winners = df["Winner"].values
     n_completed = sum([1 for winner in winners if winner])
 
@@ -60,6 +103,48 @@ def get_current_week_num(
     return week_number
 
 
+def sync_league_state(
+    week_number: int,
+    admin_sheet_name: str,
+    gspread_secret_path: str,
+) -> None:
+    """Record the week's games and which of them have a winner in the persisted league state, if
+    a league state path is configured. Reads only the Game ID and Winner columns of the admin week
+    (or the job's cached snapshot of it).
+
+    Args:
+        week_number (int): The week number to record
+        admin_sheet_name (str): Name of the admin google sheet
+        gspread_secret_path (str): Path to the gspread secret file
+    """
+    if settings.league_state_path is None:
+        return
+    try:
+        df = read_worksheet_columns(
+            gspread_secret_path=gspread_secret_path,
+            sheet_name=admin_sheet_name,
+            worksheet_name=f"Week {week_number}",
+            columns=["Game ID", "Winner"],
+        )
+        state = record_week_games(
+            state_path=settings.league_state_path,
+            week_number=week_number,
+            game_ids=[game_id for game_id in df["Game ID"] if game_id],
+            completed_game_ids=[
+                game_id for game_id, winner in zip(df["Game ID"], df["Winner"]) if winner
+            ],
+        )
+        logger.info(
+            f"Recorded league state for week {week_number} - {len(state.completed_game_ids)}/"
+            f"{len(state.game_ids)} games completed"
+        )
+    except Exception:
+        logger.error(
+            f"Failed to record league state for week {week_number}. "
+            f"Traceback:\n\n{traceback.format_exc()}"
+        )
+
+
 def init_user_week(
     user_sheet_name: str,
     this_weeks_games: List[Game],
@@ -82,18 +167,16 @@ def init_user_week(
     ]
     df = pd.DataFrame(records)
 
-    # Get spreadsheet object
-    sh = open_sheet(gspread_secret_path=gspread_secret_path, sheet_name=user_sheet_name)
-
-    # Write pandas DF to google sheets
+    # Build the new worksheet, its values and its formatting as a single batch of requests
     worksheet_name = f"Week {week_number}"
-    ws = sh.add_worksheet(title=worksheet_name, cols=len(df.columns), rows=len(df))
-    ws.update([df.columns.values.tolist()] + df.values.tolist())
-
-    # Update formatting
-    ws.format("A1:H1", {"textFormat": {"bold": True}})
-    set_column_widths(
-        ws,
+    sheet_id = sheet_id_for_title(worksheet_name)
+    batch_requests = [
+        add_sheet_request(sheet_id, worksheet_name, n_rows=len(df) + 1, n_cols=len(df.columns)),
+        update_values_request(sheet_id, [df.columns.values.tolist()] + df.values.tolist()),
+        format_request(sheet_id, "A1:H1", {"textFormat": {"bold": True}}),
+    ]
+    batch_requests += column_widths_requests(
+        sheet_id,
         [
             ("A", "65"),
             ("B", "155"),
@@ -106,6 +189,10 @@ def init_user_week(
         ],
     )
 
+    # Write the new worksheet to google sheets
+    sh = open_sheet(gspread_secret_path=gspread_secret_path, sheet_name=user_sheet_name)
+    batch_update_spreadsheet(sh, batch_requests)
+
 
 def init_admin_week(
     admin_sheet_name: str,
@@ -138,16 +225,22 @@ def init_admin_week(
         df[f"{player_name} Confidence"] = ""
         df[f"{player_name} Points"] = ""
 
-    # Get spreadsheet object
-    sh = open_sheet(gspread_secret_path=gspread_secret_path, sheet_name=admin_sheet_name)
-
-    # Write pandas DF to google sheets
+    # Create the worksheet with the week's values
     worksheet_name = f"Week {week_number}"
-    ws = sh.add_worksheet(title=worksheet_name, cols=len(df.columns), rows=len(df))
-    ws.update([df.columns.values.tolist()] + df.values.tolist())
+    sheet_id = sheet_id_for_title(worksheet_name)
+    batch_requests = [
+        add_sheet_request(sheet_id, worksheet_name, n_rows=len(df) + 1, n_cols=len(df.columns)),
+        update_values_request(sheet_id, [df.columns.values.tolist()] + df.values.tolist()),
+    ]
 
     # Format Header
-    ws.format("1:1", {"textFormat": {"bold": True}, "borders": {"bottom": {"style": "SOLID"}}})
+    batch_requests.append(
+        format_request(
+            sheet_id,
+            "1:1",
+            {"textFormat": {"bold": True}, "borders": {"bottom": {"style": "SOLID"}}},
+        )
+    )
 
     # Format column widths
     team_name_width = "155"
@@ -168,7 +261,7 @@ def init_admin_week(
         else:
             val = 22 + (7 * len(col_name))
             col_widths.append((ALPHABET[i], str(val)))
-    set_column_widths(ws, col_widths)
+    batch_requests += column_widths_requests(sheet_id, col_widths)
 
     # Format column borders
     to_border = ["G"]
@@ -177,10 +270,89 @@ def init_admin_week(
         to_border.append(ALPHABET[start_idx])
         start_idx += 3
     for col in to_border:
-        ws.format(f"{col}2:{col}", {"borders": {"right": {"style": "SOLID"}}})
-        ws.format(  # Special case for header to keep the bottom border
-            f"{col}1", {"borders": {"bottom": {"style": "SOLID"}, "right": {"style": "SOLID"}}}
+        batch_requests.append(
+            format_request(sheet_id, f"{col}2:{col}", {"borders": {"right": {"style": "SOLID"}}})
+        )
+        batch_requests.append(  # Special case for header to keep the bottom border
+            format_request(
+                sheet_id,
+                f"{col}1",
+                {"borders": {"bottom": {"style": "SOLID"}, "right": {"style": "SOLID"}}},
+            )
+        )
+
+    # Write the new worksheet to google sheets in a single request
+    sh = open_sheet(gspread_secret_path=gspread_secret_path, sheet_name=admin_sheet_name)
+    batch_update_spreadsheet(sh, batch_requests)
+
+
+class InitStatus(str, Enum):
+    SUCCESS = "success"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+
+def try_init_sheet_week(
+    init_fn: Callable, sheet_name: str, week_number: int, **init_kwargs
+) -> InitStatus:
+    """Initialize the week on one workbook, skipping it if the week's worksheet already exists and
+    logging (rather than raising) any other failure
+
+    Args:
+        init_fn (Callable): Function which initializes the week (init_admin_week or init_user_week)
+        sheet_name (str): Name of the google sheet being initialized, for logging
+        week_number (int): The week number to initialize
+        **init_kwargs: Keyword arguments for init_fn, other than week_number
+
+    Returns:
+        InitStatus: Whether the workbook was initialized, skipped or failed
+    """
+    try:
+        init_fn(week_number=week_number, **init_kwargs)
+        logger.info(f"Updated sheet {sheet_name} for week {week_number}")
+        return InitStatus.SUCCESS
+    except Exception as e:
+        if f'A sheet with the name "Week {week_number}" already exists.' in str(e):
+            logger.info(f"Sheet {sheet_name} for week {week_number} already exists - skipping")
+            return InitStatus.SKIPPED
+        logger.error(
+            f"Failed to initialize sheet {sheet_name} for week {week_number}:\n\n{str(e)}. "
+            f"Traceback:\n\n{traceback.format_exc()}"
         )
+        return InitStatus.FAILED
+
+
+def get_season_games(the_odds_api_key: str) -> List[Game]:
+    """Get the season's games, from the local game store if one is configured and fresh, and from
+    the-odds API otherwise
+
+    Args:
+        the_odds_api_key (str): The-odds API key
+
+    Returns:
+        List[Game]: The season's games
+    """
+    store = None
+    if settings.game_store_path is not None:
+        store = GameStore(path=settings.game_store_path)
+        age = store.age()
+        if age is not None and age < settings.game_store_max_age.total_seconds():
+            games = store.load()
+            logger.info(f"Loaded {len(games)} games from the game store ({age:.0f} seconds old)")
+            return games
+
+    # Fetch and parse the games, saving them for next time
+    the_odds_json = get_the_odds_json(
+        api_key=the_odds_api_key,
+        endpoint="events",
+        cache_dir=settings.the_odds_cache_dir,
+        max_age=settings.the_odds_cache_max_age,
+        base_url=settings.the_odds_base_url,
+    )
+    games = parse_the_odds_json(the_odds_json=the_odds_json)
+    if store is not None:
+        store.upsert(games=games)
+    return games
 
 
 def init_week(
@@ -191,54 +363,57 @@ def init_week(
     the_odds_api_key: str,
 ) -> list[Game]:
     # First get this weeks games
-    the_odds_json = get_the_odds_json(api_key=the_odds_api_key, endpoint="events")
-    games = parse_the_odds_json(the_odds_json=the_odds_json)
-    this_weeks_games = get_this_weeks_games(games=games)
+    games = get_season_games(the_odds_api_key=the_odds_api_key)
+    this_weeks_games = GameTable(games).this_week().to_games()
     logger.info(f"Got {len(this_weeks_games)} remaining games for week {week_number}")
 
-    # Update the admin sheet
-    try:
-        init_admin_week(
+    # Update the admin sheet first, then all of the user sheets at once
+    summary = {
+        admin_sheet_name: try_init_sheet_week(
+            init_fn=init_admin_week,
+            sheet_name=admin_sheet_name,
+            week_number=week_number,
             admin_sheet_name=admin_sheet_name,
             this_weeks_games=this_weeks_games,
-            week_number=week_number,
             gspread_secret_path=gspread_secret_path,
             player_names=player_names,
         )
-        logger.info(f"Updated admin sheet for week {week_number}")
-    except Exception as e:
-        if f'A sheet with the name "Week {week_number}" already exists.' in str(e):
-            logger.info(f"Admin sheet for week {week_number} already exists - skipping")
-        else:
-            logger.error(f"Failed to initialize admin sheet for week {week_number}:\n\n{str(e)}")
-
-    # Update each of the user sheets
-    for player_name in player_names:
-        user_sheet_name = f"{player_name} NFL Confidence '24-'25"
-        try:
-            init_user_week(
+    }
+    user_sheet_names = [f"{player_name} NFL Confidence '24-'25" for player_name in player_names]
+    with ThreadPoolExecutor(max_workers=max(1, settings.sheets_max_workers)) as executor:
+        futures = {
+            user_sheet_name: executor.submit(
+                try_init_sheet_week,
+                init_fn=init_user_week,
+                sheet_name=user_sheet_name,
+                week_number=week_number,
                 user_sheet_name=user_sheet_name,
                 this_weeks_games=this_weeks_games,
-                week_number=week_number,
                 gspread_secret_path=gspread_secret_path,
             )
-            logger.info(f"Updated user sheet {user_sheet_name} for week {week_number}")
-        except Exception as e:
-            if f'A sheet with the name "Week {week_number}" already exists.' in str(e):
-                logger.info(
-                    f"User sheet {user_sheet_name} for week {week_number} already exists - skipping"
-                )
-            else:
-                logger.error(
-                    f"Failed to initialize user sheet {user_sheet_name} "
-                    f"for week {week_number}:\n\n{str(e)}. "
-                    f"Traceback:\n\n{traceback.format_exc()}"
-                )
+            for user_sheet_name in user_sheet_names
+        }
+        summary.update({name: future.result() for name, future in futures.items()})
+
+    # Summarize the result for each workbook
+    counts = {status.value: list(summary.values()).count(status) for status in InitStatus}
+    logger.info(
+        f"Initialized week {week_number} - {counts}:\n"
+        + "\n".join(f"{name}: {status.value}" for name, status in summary.items())
+    )
+
+    # Persist the week's games so the current week can be found without reading the sheets
+    sync_league_state(
+        week_number=week_number,
+        admin_sheet_name=admin_sheet_name,
+        gspread_secret_path=gspread_secret_path,
+    )
 
     # Return the list of games for downstream use
     return this_weeks_games
 
 
+@worksheet_cache_scope()
 def copy_predictions_to_admin(
     week_number: int,
     admin_sheet_name: str,
@@ -258,20 +433,49 @@ def copy_predictions_to_admin(
             Defaults to None.
     """
     # Get the admin sheet
-    sh = open_sheet(gspread_secret_path=gspread_secret_path, sheet_name=admin_sheet_name)
     worksheet_name = f"Week {week_number}"
-    ws = sh.worksheet(worksheet_name)
-    df = pd.DataFrame(ws.get_all_records())
+    ws = open_worksheet(
+        gspread_secret_path=gspread_secret_path,
+        sheet_name=admin_sheet_name,
+        worksheet_name=worksheet_name,
+    )
+    df = read_worksheet_as_df(
+        gspread_secret_path=gspread_secret_path,
+        sheet_name=admin_sheet_name,
+        worksheet_name=worksheet_name,
+    )
 
-    # Get the user sheets
+    # Get the user sheets, reading them all at once
     logger.info(f"Copying week {week_number} picks to admin sheet for games: {game_ids}")
+    user_sheet_names = {
+        player_name: f"{player_name} NFL Confidence '24-'25" for player_name in player_names
+    }
+    user_dfs = read_worksheets_as_dfs(
+        gspread_secret_path=gspread_secret_path,
+        sheet_names=list(user_sheet_names.values()),
+        worksheet_name=worksheet_name,
+        max_workers=settings.sheets_max_workers,
+    )
+
+    # Check every player's picks for the week, logging any problems before they are locked in.
+    # This only warns, so it must never stop the picks from being locked in.
+    report = catch_with_logging(
+        fn=validate_week_picks,
+        args={
+            "user_dfs": {
+                name: user_dfs[sheet_name] for name, sheet_name in user_sheet_names.items()
+            },
+            "game_ids": df["Game ID"].tolist(),
+            "required_game_ids": game_ids,
+        },
+        error_log_template="Failed to validate week picks: {}",
+    )
+    if report is not None:
+        report.log()
+
+    buffer = WriteBuffer()
     for player_name in player_names:
-        user_sheet_name = f"{player_name} NFL Confidence '24-'25"
-        user_df = read_worksheet_as_df(
-            gspread_secret_path=gspread_secret_path,
-            sheet_name=user_sheet_name,
-            worksheet_name=worksheet_name,
-        )
+        user_df = user_dfs[user_sheet_names[player_name]]
 
         # Find the predicted winner and confidence for each game
         for _, row in user_df.iterrows():
@@ -310,61 +514,97 @@ def copy_predictions_to_admin(
                 )
                 continue
 
-            # Update the admin sheet
-            update_cell(ws, admin_row_idx + 2, pred_col_idx + 1, pred)
-            update_cell(ws, admin_row_idx + 2, conf_col_idx + 1, conf)
+            # Queue the update to the admin sheet
+            buffer.update_cell(ws, admin_row_idx + 2, pred_col_idx + 1, pred)
+            buffer.update_cell(ws, admin_row_idx + 2, conf_col_idx + 1, conf)
 
+    # Write all of the picks to the admin sheet at once
+    buffer.flush()
 
+
+@worksheet_cache_scope()
 def update_admin_total_scores_from_week_scores(
     week_number: int,
     admin_sheet_name: str,
     player_names: List[str],
     gspread_secret_path: str,
 ) -> None:
-    """Copy the current point total from the week sheet to the scores/total sheet, within the
-    admin sheet.
-
-    TODO: TEST THIS FUNCTION
+    """Write the week's point totals from the season standings to the Scores sheet, within the
+    admin sheet. The week sheet and the Scores sheet are only read the first time they are needed
+    by this process - after that, the standings are kept up to date by
+    update_admin_with_completed_games. The row is only written if it changed.
     """
-    # Get the week sheet as a DF
-    worksheet_name = f"Week {week_number}"
-    week_df = read_worksheet_as_df(
-        gspread_secret_path=gspread_secret_path,
-        sheet_name=admin_sheet_name,
-        worksheet_name=worksheet_name,
+    standings = get_season_standings(
+        admin_sheet_name=admin_sheet_name, player_names=player_names, n_weeks=settings.max_weeks
     )
+    with standings.lock:
+        # Load the week's points, if the standings do not have them yet
+        if not standings.has_week(week_number):
+            week_df = read_worksheet_as_df(
+                gspread_secret_path=gspread_secret_path,
+                sheet_name=admin_sheet_name,
+                worksheet_name=f"Week {week_number}",
+            )
+            standings.load_week(
+                week_number=week_number,
+                points=week_sheet_points(df=week_df, player_names=player_names),
+            )
 
-    # Get the scores sheet as a DF
-    sh = open_sheet(gspread_secret_path=gspread_secret_path, sheet_name=admin_sheet_name)
-    scores_ws = sh.worksheet("Scores")
-    scores_df = read_worksheet_as_df(
-        gspread_secret_path=gspread_secret_path,
-        sheet_name=admin_sheet_name,
-        worksheet_name="Scores",
-    )
+        # Get the scores sheet, and its layout and earlier weeks' totals the first time around
+        scores_ws = open_worksheet(
+            gspread_secret_path=gspread_secret_path,
+            sheet_name=admin_sheet_name,
+            worksheet_name="Scores",
+        )
+        if standings.score_columns is None:
+            scores_df = read_worksheet_as_df(
+                gspread_secret_path=gspread_secret_path,
+                sheet_name=admin_sheet_name,
+                worksheet_name="Scores",
+            )
+            standings.load_scores(scores_df=scores_df)
+        if not standings.row_changed(week_number):
+            logger.info(f"Week {week_number} totals unchanged")
+            return
 
-    # For each player, get the sum of their scores for the week
-    for player_name in player_names:
-        week_score = pd.to_numeric(
-            week_df[f"{player_name} Points"], errors="coerce", downcast="integer"
-        ).sum()
-        week_score = int(week_score)  # Cast from int64
+        # Write each player's total for the week in one call
+        buffer = WriteBuffer()
         row_idx = week_number + 1
-        col_idx = scores_df.columns.get_loc(player_name) + 1
-        update_cell(scores_ws, row_idx, col_idx, week_score)
+        for player_name, week_score in standings.week_totals(week_number).items():
+            buffer.update_cell(scores_ws, row_idx, standings.score_columns[player_name], week_score)
+        buffer.flush()
+        standings.mark_written(week_number)
+        logger.info(f"Standings after week {week_number}:\n{standings.summary()}")
 
 
+@worksheet_cache_scope()
 def update_admin_with_completed_games(
     week_number: int,
     admin_sheet_name: str,
     player_names: List[str],
     gspread_secret_path: str,
     the_odds_api_key: str,
-) -> None:
+) -> List[str]:
+    """Fill in the winner and player points of every newly completed game for a given week, then
+    update the player totals
+
+    Args:
+        week_number (int): The week number to update
+        admin_sheet_name (str): The name of the admin google sheet
+        player_names (List[str]): List of player names
+        gspread_secret_path (str): Path to the gspread secret file
+        the_odds_api_key (str): API key for the-odds API
+
+    Returns:
+        List[str]: IDs of the week's games which still do not have a winner
+    """
     # Get the admin sheet
-    sh = open_sheet(gspread_secret_path=gspread_secret_path, sheet_name=admin_sheet_name)
     worksheet_name = f"Week {week_number}"
-    ws = sh.worksheet(worksheet_name)
+    ws = open_worksheet(
+        gspread_secret_path=gspread_secret_path,
+        sheet_name=admin_sheet_name,
+        worksheet_name=worksheet_name,
+    )
     df = read_worksheet_as_df(
         gspread_secret_path=gspread_secret_path,
         sheet_name=admin_sheet_name,
@@ -378,47 +618,54 @@ def update_admin_with_completed_games(
             to_update.append(row["Game ID"])
 
     # Get a list of completed games
-    the_odds_json = get_the_odds_json(api_key=the_odds_api_key, endpoint="scores")
+    the_odds_json = get_the_odds_json(
+        api_key=the_odds_api_key,
+        endpoint="scores",
+        cache_dir=settings.the_odds_cache_dir,
+        max_age=settings.the_odds_cache_max_age,
+        base_url=settings.the_odds_base_url,
+    )
     games = parse_the_odds_json(the_odds_json=the_odds_json)
-    completed_games = get_completed_games(games=games)
+    if settings.game_store_path is not None:
+        GameStore(path=settings.game_store_path).upsert(games=games)
 
-    # Keep only those with an ID we want to update
-    completed_games = list(filter(lambda x: x.id in to_update, completed_games))
+    # Keep only the completed games with an ID we want to update
+    completed_games = GameTable(games).completed().select(to_update).to_games()
     logger.info(f"Updating {len(completed_games)} games for week {week_number}")
 
-    # For each game, update the winner and each of the players results
-    for game in completed_games:
-        row_idx = df[df["Game ID"] == game.id].index[0]
-        winner_col_idx = df.columns.get_loc("Winner")
-        update_cell(ws, row_idx + 2, winner_col_idx + 1, game.winner.value)
-
-        # Update each player's points
-        for player_name in player_names:
+    # Score every player's picks for the completed games at once
+    points = score_week(df=df, player_names=player_names, games=completed_games)
+    rows = game_rows(df=df, games=completed_games)
 
-            # Classify the user's pick into one of the 2 standardized team names
-            pred = df.iloc[row_idx][f"{player_name} Predicted"]
-            conf = df.iloc[row_idx][f"{player_name} Confidence"]
-            if not pred or not conf:
-                logger.warning(f"Player {player_name} missing prediction for game {game.id}")
-                pred = settings.missed_pred_str
-            else:
-                pred = catch_with_logging(
-                    fn=str_match_team_name,
-                    args={
-                        "str_to_classify": pred,
-                        "candidate_labels": [game.home_team.value, game.away_team.value],
-                    },
-                )
-
-            # Get the point value
-            points = 0
-            if pred is not None and is_same_team(pred, game.winner.value):
-                points = int(conf)
-
-            # Update the points in the admin sheet
-            points_col_idx = df.columns.get_loc(f"{player_name} Points")
-            update_cell(ws, row_idx + 2, points_col_idx + 1, points)
-            logger.info(f"Updated {player_name} for game {game.id} with {points} points")
+    # Keep the season standings up to date with the newly scored games. The week is re-synced from
+    # the sheet already read above, so manual corrections are picked up without another read.
+    standings = get_season_standings(
+        admin_sheet_name=admin_sheet_name, player_names=player_names, n_weeks=settings.max_weeks
+    )
+    with standings.lock:
+        standings.load_week(
+            week_number=week_number, points=week_sheet_points(df=df, player_names=player_names)
+        )
+        standings.apply_game_points(week_number=week_number, points=points)
+
+    # Update the winner and each of the players results
+    buffer = WriteBuffer()
+    winner_col_idx = df.columns.get_loc("Winner")
+    points_col_idxs = [df.columns.get_loc(f"{name} Points") for name in player_names]
+    for game, row_idx in zip(completed_games, rows.tolist()):
+        buffer.update_cell(ws, row_idx + 2, winner_col_idx + 1, game.winner.value)
+        for player_name, points_col_idx in zip(player_names, points_col_idxs):
+            player_points = int(points.at[game.id, player_name])
+            buffer.update_cell(ws, row_idx + 2, points_col_idx + 1, player_points)
+        logger.info(f"Updated game {game.id} with points {points.loc[game.id].to_dict()}")
+
+    # Write all of the winners and points to the admin sheet at once
+    buffer.flush()
+    sync_league_state(
+        week_number=week_number,
+        admin_sheet_name=admin_sheet_name,
+        gspread_secret_path=gspread_secret_path,
+    )
 
     # Copy the current point totals over from the week sheet to the score/totals sheet
     update_admin_total_scores_from_week_scores(
@@ -427,3 +674,241 @@ def update_admin_with_completed_games(
         player_names=player_names,
         gspread_secret_path=gspread_secret_path,
     )
+
+    # Report the games which are still waiting for a winner
+    completed_ids = {game.id for game in completed_games}
+    pending_ids = [game_id for game_id in to_update if game_id not in completed_ids]
+
+    # Work out who can still win, and estimate everyone's chances from here
+    catch_with_logging(
+        fn=log_race_status,
+        args={
+            "week_number": week_number,
+            "player_names": player_names,
+            "df": df,
+            "games": games,
+            "pending_ids": pending_ids,
+            "standings": standings,
+        },
+        error_log_template="Failed to work out the race status: {}",
+    )
+    if settings.simulation_trials > 0:
+        catch_with_logging(
+            fn=log_league_outlook,
+            args={
+                "week_number": week_number,
+                "player_names": player_names,
+                "df": df,
+                "games": games,
+                "pending_ids": pending_ids,
+                "standings": standings,
+                "the_odds_api_key": the_odds_api_key,
+            },
+            error_log_template="Failed to simulate the league outlook: {}",
+        )
+    return pending_ids
+
+
+def remaining_week_picks(
+    df: pd.DataFrame, player_names: List[str], games: List[Game], pending_ids: List[str]
+) -> Tuple[List[Game], np.ndarray, np.ndarray]:
+    """The week's games without a winner yet, with the picks already copied to the admin sheet
+
+    Args:
+        df (pd.DataFrame): The admin week sheet
+        player_names (List[str]): List of player names
+        games (List[Game]): Games from the-odds API scores endpoint
+        pending_ids (List[str]): IDs of the week's games which do not have a winner yet
+
+    Returns:
+        Tuple[List[Game], np.ndarray, np.ndarray]: The games, and the team code and confidence of
+            each player's pick, each of shape (n_players, n_games). Games no player has picked
+            yet are UNPICKED.
+    """
+    week_games = GameTable(games).select(pending_ids).to_games()
+    picked = [
+        game
+        for game, row in zip(week_games, game_rows(df=df, games=week_games).tolist())
+        if any(df[f"{name} Predicted"].iloc[row] for name in player_names)
+    ]
+    picks = np.full((len(player_names), len(week_games)), UNPICKED, dtype=np.int16)
+    confidences = np.zeros((len(player_names), len(week_games)), dtype=np.int64)
+    if picked:
+        idx = [week_games.index(game) for game in picked]
+        picks[:, idx], confidences[:, idx] = pick_matrix(
+            df=df, player_names=player_names, games=picked
+        )
+    return week_games, picks, confidences
+
+
+def week_used_ranks(df: pd.DataFrame, player_names: List[str]) -> List[List[int]]:
+    """Confidences each player has already used this week, on played or picked games
+
+    Args:
+        df (pd.DataFrame): The admin week sheet
+        player_names (List[str]): List of player names
+
+    Returns:
+        List[List[int]]: Used confidences of each player
+    """
+    return [
+        pd.to_numeric(df[f"{name} Confidence"], errors="coerce").dropna().astype(int).tolist()
+        for name in player_names
+    ]
+
+
+def later_season_games(df: pd.DataFrame, games: List[Game]) -> List[Game]:
+    """Games after this week which have not started yet, so have no picks
+
+    Args:
+        df (pd.DataFrame): The admin week sheet
+        games (List[Game]): Games from the-odds API scores endpoint
+
+    Returns:
+        List[Game]: The games
+    """
+    week_ids = set(df["Game ID"])
+    now = datetime.now(tz=utc)
+    return [
+        game
+        for game in games
+        if not game.completed and game.id not in week_ids and game.commence_time > now
+    ]
+
+
+def log_race_status(
+    week_number: int,
+    player_names: List[str],
+    df: pd.DataFrame,
+    games: List[Game],
+    pending_ids: List[str],
+    standings: SeasonStandings,
+) -> None:
+    """Log which players have clinched, or been eliminated from, first place for the week and the
+    season, over every outcome of the remaining games
+
+    Args:
+        week_number (int): The week number
+        player_names (List[str]): List of player names
+        df (pd.DataFrame): The admin week sheet
+        games (List[Game]): Games from the-odds API scores endpoint
+        pending_ids (List[str]): IDs of the week's games which do not have a winner yet
+        standings (SeasonStandings): The season standings
+    """
+    week_games, picks, confidences = remaining_week_picks(
+        df=df, player_names=player_names, games=games, pending_ids=pending_ids
+    )
+    is_picked = (picks != UNPICKED).any(axis=0)
+    picked_games = [game for game, flag in zip(week_games, is_picked) if flag]
+
+    # Players can still score their unused ranks on games they have not picked yet
+    week_extra = [
+        remaining_week_max_points(
+            n_games=len(df), used_ranks=used_ranks, n_open=int((~is_picked).sum())
+        )
+        for used_ranks in week_used_ranks(df=df, player_names=player_names)
+    ]
+
+    # And the most possible in every later week
+    later_games = later_season_games(df=df, games=games)
+    later_extra = sum(
+        remaining_week_max_points(n_games=n_games)
+        for n_games in Counter(week_starts(later_games)).values()
+    )
+
+    with standings.lock:
+        week_points = standings.week_points[week_number - 1].copy()
+        season_points = standings.season_totals
+    races = [
+        (f"Week {week_number}", week_points, week_extra),
+        ("Season", season_points, [extra + later_extra for extra in week_extra]),
+    ]
+    for label, current_points, max_extra_points in races:
+        status = race_status(
+            player_names=player_names,
+            current_points=current_points,
+            games=picked_games,
+            picks=picks[:, is_picked],
+            confidences=confidences[:, is_picked],
+            max_extra_points=max_extra_points,
+        )
+        logger.info(
+            f"{label} race - clinched: {status.clinched}, eliminated: {status.eliminated}, "
+            f"alive: {status.alive}"
+        )
+
+
+def the_odds_calls_per_score_poll() -> int:
+    """Number of the-odds API calls made by each update_admin_with_completed_games: the scores
+    call, plus an odds call for the league outlook if it uses bookmaker odds
+
+    Returns:
+        int: Number of calls
+    """
+    return 1 + int(settings.simulation_trials > 0 and settings.simulation_use_odds)
+
+
+def log_league_outlook(
+    week_number: int,
+    player_names: List[str],
+    df: pd.DataFrame,
+    games: List[Game],
+    pending_ids: List[str],
+    standings: SeasonStandings,
+    the_odds_api_key: str,
+) -> None:
+    """Simulate the rest of the week and the season, and log each player's chance of winning each
+
+    Args:
+        week_number (int): The week number
+        player_names (List[str]): List of player names
+        df (pd.DataFrame): The admin week sheet
+        games (List[Game]): Games from the-odds API scores endpoint
+        pending_ids (List[str]): IDs of the week's games which do not have a winner yet
+        standings (SeasonStandings): The season standings
+        the_odds_api_key (str): API key for the-odds API
+    """
+    week_games, picks, confidences = remaining_week_picks(
+        df=df, player_names=player_names, games=games, pending_ids=pending_ids
+    )
+    later_games = later_season_games(df=df, games=games)
+    season_games = week_games + later_games
+    if settings.simulation_use_odds:
+        the_odds_json = get_the_odds_json(
+            api_key=the_odds_api_key,
+            endpoint="odds",
+            cache_dir=settings.the_odds_cache_dir,
+            max_age=settings.the_odds_cache_max_age,
+            base_url=settings.the_odds_base_url,
+        )
+        probabilities = h2h_home_win_probabilities(games=season_games, the_odds_json=the_odds_json)
+    else:
+        probabilities = flat_home_win_probabilities(games=season_games)
+
+    with standings.lock:
+        week_points = standings.week_points[week_number - 1].copy()
+        season_points = standings.season_totals
+    outlooks = [
+        (f"Week {week_number}", week_points, week_games, picks, confidences),
+        (
+            "Season",
+            season_points,
+            season_games,
+            np.hstack([picks, np.full((len(player_names), len(later_games)), UNPICKED)]),
+            np.hstack([confidences, np.zeros((len(player_names), len(later_games)))]),
+        ),
+    ]
+    for label, current_points, outlook_games, outlook_picks, outlook_confidences in outlooks:
+        result = simulate_league(
+            player_names=player_names,
+            current_points=current_points,
+            games=outlook_games,
+            home_win_probabilities=probabilities[: len(outlook_games)],
+            picks=outlook_picks,
+            confidences=outlook_confidences,
+            n_week_games=len(df) if week_games else None,
+            used_ranks=week_used_ranks(df=df, player_names=player_names) if week_games else None,
+            n_trials=settings.simulation_trials,
+            n_workers=settings.simulation_workers,
+        )
+        logger.info(f"{label} outlook from {result.n_trials} trials:\n{result.summary()}")
@@ -0,0 +1,161 @@
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from gspread.utils import a1_to_rowcol
+
+from nfl_commish.utils import ALPHABET
+
+
+def sheet_id_for_title(title: str) -> int:
+    """Deterministic worksheet ID for a new worksheet title, so that every request in a batch can
+    refer to the worksheet before it exists
+
+    Args:
+        title (str): Worksheet title
+
+    Returns:
+        int: Positive 31-bit worksheet ID
+    """
+    return zlib.crc32(title.encode()) & 0x7FFFFFFF
+
+
+def grid_range(sheet_id: int, a1_range: str) -> Dict[str, int]:
+    """Convert an A1-style range (e.g. "A1:H1", "1:1", "G2:G", "G1") into a GridRange. Omitted
+    rows or columns leave that side of the range unbounded.
+
+    Args:
+        sheet_id (int): Worksheet ID
+        a1_range (str): A1-style range
+
+    Returns:
+        Dict[str, int]: GridRange with 0-based, end-exclusive indices
+    """
+    start, _, end = a1_range.partition(":")
+    end = end or start
+    start_row, start_col = _parse_a1_bound(start)
+    end_row, end_col = _parse_a1_bound(end)
+    range_dict = {"sheetId": sheet_id}
+    if start_row is not None:
+        range_dict["startRowIndex"] = start_row - 1
+    if end_row is not None:
+        range_dict["endRowIndex"] = end_row
+    if start_col is not None:
+        range_dict["startColumnIndex"] = start_col - 1
+    if end_col is not None:
+        range_dict["endColumnIndex"] = end_col
+    return range_dict
+
+
+def _parse_a1_bound(bound: str) -> Tuple[Optional[int], Optional[int]]:
+    """Parse one side of an A1 range into 1-based (row, col), either of which may be None"""
+    if bound.isdigit():
+        return int(bound), None
+    if bound.isalpha():
+        return None, ALPHABET.index(bound.upper()) + 1
+    return a1_to_rowcol(bound)
+
+
+def add_sheet_request(sheet_id: int, title: str, n_rows: int, n_cols: int) -> Dict:
+    """Request to add a new worksheet
+
+    Args:
+        sheet_id (int): ID to give the new worksheet
+        title (str): Worksheet title
+        n_rows (int): Number of rows
+        n_cols (int): Number of columns
+
+    Returns:
+        Dict: addSheet request
+    """
+    return {
+        "addSheet": {
+            "properties": {
+                "sheetId": sheet_id,
+                "title": title,
+                "gridProperties": {"rowCount": n_rows, "columnCount": n_cols},
+            }
+        }
+    }
+
+
+def update_values_request(sheet_id: int, values: List[List[Any]]) -> Dict:
+    """Request to write a grid of raw values starting at cell A1
+
+    Args:
+        sheet_id (int): Worksheet ID
+        values (List[List[Any]]): Rows of values. None and empty strings leave the cell empty.
+
+    Returns:
+        Dict: updateCells request
+    """
+    rows = [
+        {"values": [{"userEnteredValue": _cell_value(value)} for value in row]} for row in values
+    ]
+    return {
+        "updateCells": {
+            "rows": rows,
+            "fields": "userEnteredValue",
+            "start": {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": 0},
+        }
+    }
+
+
+def _cell_value(value: Any) -> Dict[str, Any]:
+    """Convert a python value to an ExtendedValue"""
+    if value is None or value == "":
+        return {}
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, (int, float)):
+        return {"numberValue": value}
+    return {"stringValue": str(value)}
+
+
+def format_request(sheet_id: int, a1_range: str, cell_format: Dict) -> Dict:
+    """Request to apply a cell format to a range, like gspread's Worksheet.format
+
+    Args:
+        sheet_id (int): Worksheet ID
+        a1_range (str): A1-style range to format
+        cell_format (Dict): CellFormat fields to set (e.g. {"textFormat": {"bold": True}})
+
+    Returns:
+        Dict: repeatCell request
+    """
+    return {
+        "repeatCell": {
+            "range": grid_range(sheet_id, a1_range),
+            "cell": {"userEnteredFormat": cell_format},
+            "fields": ",".join(f"userEnteredFormat.{key}" for key in cell_format),
+        }
+    }
+
+
+def column_widths_requests(sheet_id: int, widths: List[Tuple[str, str]]) -> List[Dict]:
+    """Requests to set column widths, like gspread_formatting's set_column_widths
+
+    Args:
+        sheet_id (int): Worksheet ID
+        widths (List[Tuple[str, str]]): List of (column letter, width in pixels)
+
+    Returns:
+        List[Dict]: One updateDimensionProperties request per column
+    """
+    requests = []
+    for col, width in widths:
+        col_idx = ALPHABET.index(col)
+        requests.append(
+            {
+                "updateDimensionProperties": {
+                    "range": {
+                        "sheetId": sheet_id,
+                        "dimension": "COLUMNS",
+                        "startIndex": col_idx,
+                        "endIndex": col_idx + 1,
+                    },
+                    "properties": {"pixelSize": int(width)},
+                    "fields": "pixelSize",
+                }
+            }
+        )
+    return requests
@@ -0,0 +1,190 @@
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+
+from nfl_commish.game import Game
+from nfl_commish.game_table import TEAM_CODES
+from nfl_commish.validation import MAX_CONFIDENCE
+
+
+class RaceStatus(BaseModel):
+    player_names: List[str]
+    clinched: List[str]  # Guaranteed at least a share of first place
+    eliminated: List[str]  # Cannot finish first, even tied
+
+    @property
+    def alive(self) -> List[str]:
+        """Players who can still finish first but have not clinched"""
+        decided = set(self.clinched) | set(self.eliminated)
+        return [name for name in self.player_names if name not in decided]
+
+
+def remaining_week_max_points(
+    n_games: int, used_ranks: Sequence[int] = (), n_open: Optional[int] = None
+) -> int:
+    """Most points a player can still score from a week's games without picks, using the highest
+    confidences from 17 - n to 16 which are not already used
+
+    Args:
+        n_games (int): Number of games in the week
+        used_ranks (Sequence[int], optional): Confidences already used on picked games. Defaults
+            to none.
+        n_open (Optional[int], optional): Number of games without picks. Defaults to every game.
+
+    Returns:
+        int: Maximum points
+    """
+    n_open = n_games if n_open is None else n_open
+    ranks = np.setdiff1d(np.arange(MAX_CONFIDENCE + 1 - n_games, MAX_CONFIDENCE + 1), used_ranks)
+    return int(np.sort(ranks)[::-1][:n_open].sum())
+
+
+def outcome_points(
+    games: List[Game], picks: np.ndarray, confidences: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Each player's points from each game if the home team wins, and if the away team wins
+
+    Args:
+        games (List[Game]): The games
+        picks (np.ndarray): Team code of each player's pick, shape (n_players, n_games), as from
+            scoring.pick_matrix
+        confidences (np.ndarray): Confidence of each pick, same shape as picks
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Points if the home team wins and if the away team wins,
+            each of shape (n_players, n_games)
+    """
+    home_codes = np.array([TEAM_CODES[game.home_team.value] for game in games], dtype=np.int16)
+    away_codes = np.array([TEAM_CODES[game.away_team.value] for game in games], dtype=np.int16)
+    confidences = np.asarray(confidences, dtype=np.int64).reshape(np.shape(picks))
+    home_points = np.where(picks == home_codes[np.newaxis, :], confidences, 0)
+    away_points = np.where(picks == away_codes[np.newaxis, :], confidences, 0)
+    return home_points, away_points
+
+
+def _can_finish_first(
+    player: int, gaps: np.ndarray, home_deltas: np.ndarray, away_deltas: np.ndarray
+) -> bool:
+    """Whether some outcome of the games leaves every other player at or below the player.
+
+    Games are branched on one at a time, most decisive first, keeping a frontier of the distinct
+    point gaps (others minus the player) reachable so far. A branch is pruned as soon as some
+    gap cannot be closed even by the best results for the player in the games left (lower bound),
+    and the search stops as soon as some branch wins whatever happens in the games left (upper
+    bound).
+
+    Args:
+        player (int): Index of the player
+        gaps (np.ndarray): Each player's points minus the player's, shape (n_players,)
+        home_deltas (np.ndarray): Change in each gap if the home team wins each game, shape
+            (n_games, n_players)
+        away_deltas (np.ndarray): Change in each gap if the away team wins each game
+
+    Returns:
+        bool: Whether the player can finish first (ties included)
+    """
+    others = np.arange(len(gaps)) != player
+    home_deltas, away_deltas = home_deltas[:, others], away_deltas[:, others]
+    order = np.argsort(-np.abs(home_deltas - away_deltas).sum(axis=1), kind="stable")
+    home_deltas, away_deltas = home_deltas[order], away_deltas[order]
+
+    # Best and worst case change in each gap from game k onwards
+    zeros = np.zeros((1, home_deltas.shape[1]), dtype=np.int64)
+    best_left = np.vstack(
+        [np.cumsum(np.minimum(home_deltas, away_deltas)[::-1], axis=0)[::-1], zeros]
+    )
+    worst_left = np.vstack(
+        [np.cumsum(np.maximum(home_deltas, away_deltas)[::-1], axis=0)[::-1], zeros]
+    )
+
+    frontier = gaps[others][np.newaxis, :]
+    for k in range(len(home_deltas) + 1):
+        if (frontier + worst_left[k] <= 0).all(axis=1).any():
+            return True
+        frontier = frontier[(frontier + best_left[k] <= 0).all(axis=1)]
+        if len(frontier) == 0 or k == len(home_deltas):
+            return False
+        frontier = np.unique(
+            np.vstack([frontier + home_deltas[k], frontier + away_deltas[k]]), axis=0
+        )
+    return False
+
+
+@lru_cache(maxsize=256)
+def _race_status(
+    current_points: Tuple[int, ...],
+    max_extra_points: Tuple[int, ...],
+    home_points: Tuple[Tuple[int, ...], ...],
+    away_points: Tuple[Tuple[int, ...], ...],
+) -> Tuple[Tuple[bool, ...], Tuple[bool, ...]]:
+    """Clinched and eliminated flags of each player, for a hashable standings state"""
+    current = np.array(current_points, dtype=np.int64)
+    extra = np.array(max_extra_points, dtype=np.int64)
+    home = np.array(home_points, dtype=np.int64).reshape(len(current), -1)
+    away = np.array(away_points, dtype=np.int64).reshape(len(current), -1)
+
+    # Clinched: no other player can get strictly ahead. Each rival can be checked on their own,
+    # since the result of each game which is best for a rival can be taken independently.
+    # rival_swing[player, rival] is the most the rival can gain on the player over the games
+    rival_swing = np.maximum(
+        home[np.newaxis, :, :] - home[:, np.newaxis, :],
+        away[np.newaxis, :, :] - away[:, np.newaxis, :],
+    ).sum(axis=2)
+    rival_best = current[np.newaxis, :] + extra[np.newaxis, :] - current[:, np.newaxis]
+    rival_best = rival_best + rival_swing
+    np.fill_diagonal(rival_best, np.iinfo(np.int64).min)
+    clinched = (rival_best <= 0).all(axis=1)
+
+    # Eliminated: no single outcome of the games puts the player level with or ahead of everyone,
+    # even with the player's most and the others' fewest extra points
+    eliminated = []
+    for player in range(len(current)):
+        gaps = current - current[player] - extra[player]
+        home_deltas = (home - home[player]).T
+        away_deltas = (away - away[player]).T
+        eliminated.append(not _can_finish_first(player, gaps, home_deltas, away_deltas))
+    return tuple(clinched.tolist()), tuple(eliminated)
+
+
+def race_status(
+    player_names: List[str],
+    current_points: Sequence[int],
+    games: List[Game],
+    picks: np.ndarray,
+    confidences: np.ndarray,
+    max_extra_points: Optional[Sequence[int]] = None,
+) -> RaceStatus:
+    """Exactly which players have clinched, or been eliminated from, first place (of the week or
+    the season, depending on the points and games given), over every outcome of the remaining
+    games. Results are cached per standings state.
+
+    Args:
+        player_names (List[str]): List of player names
+        current_points (Sequence[int]): Each player's points so far
+        games (List[Game]): The remaining games with picks
+        picks (np.ndarray): Team code of each player's pick, shape (n_players, n_games), as from
+            scoring.pick_matrix
+        confidences (np.ndarray): Confidence of each pick, same shape as picks
+        max_extra_points (Optional[Sequence[int]], optional): Most points each player can still
+            score outside these games, e.g. from games without picks yet (see
+            remaining_week_max_points). Defaults to none.
+
+    Returns:
+        RaceStatus: The players who have clinched and who are eliminated
+    """
+    home_points, away_points = outcome_points(games=games, picks=picks, confidences=confidences)
+    if max_extra_points is None:
+        max_extra_points = [0] * len(player_names)
+    clinched, eliminated = _race_status(
+        current_points=tuple(int(points) for points in current_points),
+        max_extra_points=tuple(int(points) for points in max_extra_points),
+        home_points=tuple(map(tuple, home_points.tolist())),
+        away_points=tuple(map(tuple, away_points.tolist())),
+    )
+    return RaceStatus(
+        player_names=player_names,
+        clinched=[name for name, flag in zip(player_names, clinched) if flag],
+        eliminated=[name for name, flag in zip(player_names, eliminated) if flag],
+    )
@@ -0,0 +1,177 @@
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from loguru import logger
+
+SPORT_PATH = "/v4/sports/americanfootball_nfl"
+
+
+class FakeOddsApiServer:
+    """Local stand-in for the-odds API, serving the events and scores endpoints from JSON fixture
+    files, so the pipelines can be load and soak tested without spending quota.
+
+    Like the real API, every response carries x-requests-used/remaining/last quota headers, the
+    events endpoint is free, the scores endpoint costs 1 (2 with daysFrom), and requests without an
+    apiKey or without quota left are rejected with a 401. Responses have an ETag and conditional
+    requests are answered with a 304. Latency and errors can be injected.
+    """
+
+    def __init__(
+        self,
+        events_path: str,
+        scores_path: str,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        quota: int = 500,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            events_path (str): Path to the events JSON fixture
+            scores_path (str): Path to the scores JSON fixture
+            host (str, optional): Host to bind. Defaults to "127.0.0.1".
+            port (int, optional): Port to bind. If 0, a free port is picked. Defaults to 0.
+            quota (int, optional): Monthly request quota. Defaults to 500.
+            latency (float, optional): Seconds to wait before every response. Defaults to 0.
+            error_rate (float, optional): Fraction of requests answered with error_status instead.
+                Defaults to 0.
+            error_status (int, optional): Status code of injected errors, e.g. 429 or 503. Defaults
+                to 500.
+            seed (Optional[int], optional): Seed for the injected errors. Defaults to None.
+        """
+        self.bodies: Dict[str, bytes] = {}
+        for endpoint, path in [("events", events_path), ("scores", scores_path)]:
+            with open(path, "rb") as f:
+                self.bodies[endpoint] = json.dumps(json.load(f)).encode()
+        self.quota = quota
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests_used = 0
+        self.request_log: List[Dict] = []
+        self._failures: List[int] = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to pass to get_the_odds_json"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def fail_next(self, *statuses: int) -> None:
+        """Answer the next requests with the given error statuses, in order
+
+        Args:
+            statuses (int): Status codes, e.g. fail_next(429, 503)
+        """
+        with self._lock:
+            self._failures.extend(statuses)
+
+    def start(self) -> "FakeOddsApiServer":
+        """Serve requests on a background thread"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Fake the-odds API serving at {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeOddsApiServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def respond(self, path: str, query: str, if_none_match: Optional[str]) -> tuple:
+        """Build the response to a GET request
+
+        Args:
+            path (str): Request path
+            query (str): Request query string
+            if_none_match (Optional[str]): If-None-Match request header
+
+        Returns:
+            tuple: Status code, headers and body
+        """
+        if self.latency > 0:
+            time.sleep(self.latency)
+        params = parse_qs(query)
+        endpoint = path.rstrip("/").rsplit("/", 1)[-1]
+        if not path.startswith(SPORT_PATH) or endpoint not in self.bodies:
+            return 404, {}, _error_body("Unknown endpoint")
+        if "apiKey" not in params:
+            return 401, {}, _error_body("Missing API key")
+
+        with self._lock:
+            self.request_log.append({"endpoint": endpoint, "params": params})
+            if self._failures:
+                status = self._failures.pop(0)
+            elif self.error_rate > 0 and self._random.random() < self.error_rate:
+                status = self.error_status
+            else:
+                status = None
+            if status is not None:
+                return status, {}, _error_body("Injected error")
+
+            # Charge the quota like the real API
+            cost = 0 if endpoint == "events" else (2 if "daysFrom" in params else 1)
+            if self.requests_used + cost > self.quota:
+                return 401, {}, _error_body("Usage quota has been reached")
+            self.requests_used += cost
+            headers = {
+                "x-requests-used": str(self.requests_used),
+                "x-requests-remaining": str(self.quota - self.requests_used),
+                "x-requests-last": str(cost),
+            }
+
+        body = self.bodies[endpoint]
+        headers["ETag"] = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        if if_none_match == headers["ETag"]:
+            return 304, headers, b""
+        headers["Content-Type"] = "application/json"
+        return 200, headers, body
+
+    def _make_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, like the real API
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                status, headers, body = server.respond(
+                    path=url.path, query=url.query, if_none_match=self.headers.get("If-None-Match")
+                )
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(f"Fake the-odds API: {format % args}")
+
+        return Handler
+
+
+def _error_body(message: str) -> bytes:
+    return json.dumps({"message": message}).encode()
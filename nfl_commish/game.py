@@ -1,22 +1,42 @@
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+import time as time_module
 from datetime import date, datetime, time, timedelta
-from enum import Enum
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import IO, Dict, Iterator, List, Optional, Tuple, Union
 
-import numpy as np
 import requests
 from loguru import logger
-from pydantic import BaseModel, computed_field, field_validator
+from pydantic import BaseModel, ConfigDict, TypeAdapter, computed_field, field_validator
 from pytz import timezone, utc
-
-from nfl_commish.utils import add_timezone, convert_team_name, get_valid_team_names
-
-
-# Create an enum of valid team names
-class StrEnum(str, Enum):
-    pass
-
-
-TeamNameEnum = StrEnum("TeamNameEnum", [(name, name) for name in get_valid_team_names()])
+from tenacity import (
+    after_log,
+    before_sleep_log,
+    retry,
+    retry_if_exception,
+    wait_exponential,
+)
+
+from nfl_commish.quota import the_odds_budget
+from nfl_commish.teams import (
+    TeamNameEnum,
+    classify_pick,
+    resolve_team,
+)
+from nfl_commish.utils import add_timezone, convert_team_name
+
+EASTERN = timezone("US/Eastern")
+THE_ODDS_BASE_URL = "https://api.the-odds-api.com"
+
+# Shared HTTP session (keep-alive connections) for the-odds API, and per-request locks so that
+# concurrent jobs wait for one request rather than each spending quota
+_the_odds_session = requests.Session()
+_the_odds_locks: Dict[str, threading.Lock] = {}
+_the_odds_locks_lock = threading.Lock()
 
 
 class TeamScore(BaseModel):
@@ -29,7 +49,12 @@ class TeamScore(BaseModel):
         return convert_team_name(name=value)
 
 
-class Game(BaseModel, extra="allow"):
+GAME_CACHED_FIELDS = ("local_commence_time", "local_date", "local_time", "winner")
+
+
+class Game(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="allow")
+
     id: str
     home_team: TeamNameEnum
     away_team: TeamNameEnum
@@ -37,23 +62,31 @@ class Game(BaseModel, extra="allow"):
     completed: Optional[bool] = None
     scores: Optional[List[TeamScore]] = None
 
+    # Derived fields are computed on first access and then cached on the instance. Games are
+    # frozen, and copies drop the cached values, so they never go stale.
+    def model_copy(self, *, update: Optional[Dict] = None, deep: bool = False) -> "Game":
+        copied = super().model_copy(update=update, deep=deep)
+        for name in GAME_CACHED_FIELDS:
+            copied.__dict__.pop(name, None)
+        return copied
+
     @computed_field
-    @property
-    def local_date(self) -> date:  # In EST
-        return self.commence_time.astimezone(timezone("US/Eastern")).date()
+    @cached_property
+    def local_commence_time(self) -> datetime:  # In EST
+        return self.commence_time.astimezone(EASTERN)
 
     @computed_field
-    @property
-    def local_time(self) -> time:  # In EST
-        return self.commence_time.astimezone(timezone("US/Eastern")).time()
+    @cached_property
+    def local_date(self) -> date:  # In EST
+        return self.local_commence_time.date()
 
     @computed_field
-    @property
-    def local_commence_time(self) -> datetime:  # In EST
-        return self.commence_time.astimezone(timezone("US/Eastern"))
+    @cached_property
+    def local_time(self) -> time:  # In EST
+        return self.local_commence_time.time()
 
     @computed_field
-    @property
+    @cached_property
     def winner(self) -> Optional[TeamNameEnum]:
         if self.completed and self.scores is not None:
             return max(self.scores, key=lambda x: x.score).name
@@ -75,42 +108,141 @@ class Game(BaseModel, extra="allow"):
         return value.replace(tzinfo=utc)
 
 
-def get_the_odds_json(api_key: str, endpoint: str) -> List[Dict]:
-    """Make request to the-odds API for bookmaker odds
+def get_the_odds_json(
+    api_key: str,
+    endpoint: str,
+    cache_dir: Optional[str] = None,
+    max_age: timedelta = timedelta(minutes=5),
+    base_url: str = THE_ODDS_BASE_URL,
+) -> List[Dict]:
+    """Make request to the-odds API for bookmaker odds. If a cache directory is given, responses
+    are cached on disk and reused (without spending API quota) while younger than max_age.
 
     Args:
         api_key (str): The-odds API key
-        endpoint (str): The API endpoint to hit. Must be one of 'events' or 'scores'
+        endpoint (str): The API endpoint to hit. Must be one of 'events', 'scores' or 'odds' (h2h
+            market, decimal prices)
+        cache_dir (Optional[str], optional): Directory for cached responses. If None, responses are
+            not cached. Defaults to None.
+        max_age (timedelta, optional): How long a cached response stays fresh. Defaults to 5
+            minutes.
+        base_url (str, optional): Base URL of the API, e.g. a local fake server for testing.
+            Defaults to THE_ODDS_BASE_URL.
 
     Returns:
         List[Dict]: The-odds response JSON
     """
     # Validate the input
-    if endpoint not in ["events", "scores"]:
-        raise ValueError(f"Endpoint must be one of 'events' or 'scores', got '{endpoint}'")
+    if endpoint not in ["events", "scores", "odds"]:
+        raise ValueError(f"Endpoint must be one of 'events', 'scores' or 'odds', got '{endpoint}'")
 
-    # Send the request
-    url = f"https://api.the-odds-api.com/v4/sports/americanfootball_nfl/{endpoint}/"
+    # Build the request
+    url = f"{base_url.rstrip('/')}/v4/sports/americanfootball_nfl/{endpoint}/"
     params = {
         "regions": "us",
         "apiKey": api_key,
     }
     if endpoint == "scores":
         params["daysFrom"] = 3
-    resp = requests.get(url, params)
+    elif endpoint == "odds":
+        params["markets"] = "h2h"
+        params["oddsFormat"] = "decimal"
+    if cache_dir is None:
+        return _request_the_odds(url=url, params=params, endpoint=endpoint).json()
+
+    # Only one request per endpoint and params at a time, so concurrent jobs share the response
+    key_params = {k: v for k, v in params.items() if k != "apiKey"}
+    cache_key = hashlib.sha256(
+        json.dumps({"url": url, "params": key_params}, sort_keys=True).encode()
+    ).hexdigest()[:16]
+    with _the_odds_locks_lock:
+        lock = _the_odds_locks.setdefault(cache_key, threading.Lock())
+    with lock:
+        # Use the cached response while it is fresh
+        cache_path = os.path.join(cache_dir, f"{endpoint}-{cache_key}.json")
+        cached = _read_the_odds_cache(cache_path)
+        if cached is not None:
+            age = time_module.time() - cached["fetched_at"]
+            if age < max_age.total_seconds():
+                logger.info(f"Using cached '{endpoint}' response from {age:.0f} seconds ago")
+                return cached["data"]
+
+        # Otherwise make a conditional request, reusing the cached body if it has not changed
+        headers = {}
+        if cached is not None and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        resp = _request_the_odds(url=url, params=params, endpoint=endpoint, headers=headers)
+        if resp.status_code == 304:
+            logger.info(f"'{endpoint}' response not modified - reusing cached response")
+            data = cached["data"]
+        else:
+            data = resp.json()
+        os.makedirs(cache_dir, exist_ok=True)
+        _write_the_odds_cache(
+            cache_path,
+            {"fetched_at": time_module.time(), "etag": resp.headers.get("etag"), "data": data},
+        )
+        return data
+
+
+def is_retryable_the_odds_error(e: BaseException) -> bool:
+    """Whether a failed the-odds API request is worth retrying: rate limits, server errors and
+    network errors are, while other client errors (e.g. a bad API key or no quota left) are not
+
+    Args:
+        e (BaseException): The raised exception
+
+    Returns:
+        bool: True if the request should be retried
+    """
+    if isinstance(e, requests.exceptions.HTTPError) and e.response is not None:
+        return e.response.status_code == 429 or e.response.status_code >= 500
+    return isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+@retry(
+    wait=wait_exponential(max=90),
+    retry=retry_if_exception(is_retryable_the_odds_error),
+    before_sleep=before_sleep_log(logger, logging.INFO),
+    after=after_log(logger, logging.INFO),
+)
+def _request_the_odds(
+    url: str, params: Dict, endpoint: str, headers: Optional[Dict] = None
+) -> requests.Response:
+    """Send a request to the-odds API on the shared session and log the API quota, with retries
+    on rate limits and server errors"""
+    resp = _the_odds_session.get(url, params=params, headers=headers)
     resp.raise_for_status()
 
-    # Log API quota from headers
-    requests_used = resp.headers["x-requests-used"]
-    requests_remaining = resp.headers["x-requests-remaining"]
-    used_by_last_call = resp.headers["x-requests-last"]
-    logger.info(
-        f"Hit '{endpoint}' endpoint - {requests_used} requests used, {requests_remaining} "
-        f"remaining, {used_by_last_call} used by last call"
-    )
+    # Record and log API quota from headers
+    quota = the_odds_budget.record(resp.headers)
+    if quota is not None:
+        logger.info(
+            f"Hit '{endpoint}' endpoint - {quota.requests_used} requests used, "
+            f"{quota.requests_remaining} remaining, {quota.used_by_last_call} used by last call"
+        )
+    return resp
+
+
+def _read_the_odds_cache(cache_path: str) -> Optional[Dict]:
+    """Read a cached the-odds response, or None if it is missing or unreadable"""
+    try:
+        with open(cache_path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_the_odds_cache(cache_path: str, cached: Dict) -> None:
+    """Atomically write a cached the-odds response"""
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(cached, f)
+    os.replace(tmp_path, cache_path)
 
-    # Return the JSON response
-    return resp.json()
+
+# Validates a whole list of games in one call into pydantic-core
+_games_adapter = TypeAdapter(List[Game])
 
 
 def parse_the_odds_json(the_odds_json: List[Dict]) -> List[Game]:
@@ -122,7 +254,83 @@ def parse_the_odds_json(the_odds_json: List[Dict]) -> List[Game]:
     Returns:
         List[Game]: the-odds API response parsed into a list of Game objects
     """
-    return [Game(**game) for game in the_odds_json]
+    return _games_adapter.validate_python(the_odds_json)
+
+
+def iter_parse_the_odds_file(
+    source: Union[str, os.PathLike, IO],
+    chunk_size: int = 1 << 16,
+    batch_size: int = 256,
+) -> Iterator[Game]:
+    """Lazily parse a the-odds JSON dump (a JSON list of games, like the events or scores API
+    responses) into Game objects. The file is read in chunks and games are validated in batches,
+    so memory stays bounded no matter how large the file is.
+
+    Args:
+        source (Union[str, os.PathLike, IO]): Path to the JSON file, or an open text or binary file
+        chunk_size (int, optional): Number of characters (or bytes) to read at a time. Defaults to
+            64 KiB.
+        batch_size (int, optional): Number of games to validate at a time. Defaults to 256.
+
+    Yields:
+        Game: Each game, in file order
+
+    Raises:
+        ValueError: If the file is not a JSON list of games
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "r", encoding="utf-8") as f:
+            yield from iter_parse_the_odds_file(f, chunk_size=chunk_size, batch_size=batch_size)
+        return
+    if isinstance(source.read(0), bytes):
+        source = io.TextIOWrapper(source, encoding="utf-8")
+
+    batch = []
+    for game_json in _iter_json_list(source, chunk_size=chunk_size):
+        batch.append(game_json)
+        if len(batch) == batch_size:
+            yield from _games_adapter.validate_python(batch)
+            batch = []
+    yield from _games_adapter.validate_python(batch)
+
+
+def _iter_json_list(f: IO[str], chunk_size: int) -> Iterator:
+    """Incrementally decode the items of a top-level JSON list from a text file"""
+    decoder = json.JSONDecoder()
+    buffer, pos, at_eof, started = "", 0, False, False
+    while True:
+        # Skip whitespace and item separators, reading more of the file when the buffer runs out
+        while pos < len(buffer) and buffer[pos] in " \t\r\n" + ("," if started else ""):
+            pos += 1
+        if pos == len(buffer):
+            if at_eof:
+                raise ValueError("Unexpected end of the-odds JSON file")
+            chunk = f.read(chunk_size)
+            at_eof = len(chunk) == 0
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+
+        # Open and close the list
+        if not started:
+            if buffer[pos] != "[":
+                raise ValueError("the-odds JSON file is not a list")
+            started = True
+            pos += 1
+            continue
+        if buffer[pos] == "]":
+            return
+
+        # Decode the next item, or read more if it is cut off at the end of the buffer
+        try:
+            item, pos = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if at_eof:
+                raise
+            chunk = f.read(chunk_size)
+            at_eof = len(chunk) == 0
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+        yield item
 
 
 def filter_games_by_date(
@@ -143,18 +351,15 @@ def filter_games_by_date(
     return [game for game in games if after < game.commence_time < before]
 
 
-def get_this_weeks_games(games: List[Game]) -> List[Game]:
-    """Filter games list to only those between now and the coming Tuesday (since Monday Night
-    Football is the last game of the week)
-
-    Args:
-        games (List[Game]): List of games
+def get_this_week_window() -> Tuple[datetime, datetime]:
+    """Get the time window for this week's games - between now and the coming Tuesday (since
+    Monday Night Football is the last game of the week)
 
     Returns:
-        List[Game]: Filtered list of games
+        Tuple[datetime, datetime]: The start (now) and end (the coming Tuesday) of the window
     """
     # Compute the number of days until Tuesday
-    now = datetime.now(tz=timezone("US/Eastern"))
+    now = datetime.now(tz=EASTERN)
     today = now.weekday()
     tuesday = 1  # Tuesday has int value 1 in datetime
     days_til_tuesday = (tuesday - today) % 7
@@ -162,18 +367,12 @@ def get_this_weeks_games(games: List[Game]) -> List[Game]:
     # If today is Tuesday, get a week from today
     if days_til_tuesday == 0:
         days_til_tuesday = 7
-
-    # Keep only games between now and the coming Tuesday
-    next_tuesday = now + timedelta(days=days_til_tuesday)
-    return filter_games_by_date(
-        games=games,
-        after=now,
-        before=next_tuesday,
-    )
+    return now, now + timedelta(days=days_til_tuesday)
 
 
-def get_completed_games(games: List[Game]) -> List[Game]:
-    """Filter games to only include those which have already completed
+def get_this_weeks_games(games: List[Game]) -> List[Game]:
+    """Filter games list to only those between now and the coming Tuesday (since Monday Night
+    Football is the last game of the week)
 
     Args:
         games (List[Game]): List of games
@@ -181,12 +380,19 @@ def get_completed_games(games: List[Game]) -> List[Game]:
     Returns:
         List[Game]: Filtered list of games
     """
-    return [game for game in games if game.completed]
+    # Keep only games between now and the coming Tuesday
+    now, next_tuesday = get_this_week_window()
+    return filter_games_by_date(
+        games=games,
+        after=now,
+        before=next_tuesday,
+    )
 
 
 def is_same_team(team1: str, team2: str) -> bool:
-    """Check if two team names are the same. If they share any words, they are the same (e.g.
-    'Patriots' == 'new-england-patriots')
+    """Check if two team names are the same, matching the first against the team resolved from
+    the second just as picks are classified (e.g. 'Patriots' == 'new-england-patriots', 'KC' ==
+    'kansas-city-chiefs')
 
     Args:
         team1 (str): First team name
@@ -195,24 +401,29 @@ def is_same_team(team1: str, team2: str) -> bool:
     Returns:
         bool: True if the team names are the same, False otherwise
     """
-    ignore_words = {"new", "san", "las", "los", "city", "bay"}
-    synonyms = {"fran": "francisco", "buccs": "buccaneers"}
-    team1_words = set(convert_team_name(team1).split("-")) - ignore_words
-    team2_words = set(convert_team_name(team2).split("-")) - ignore_words
-    team1_words = {synonyms.get(word, word) for word in team1_words}
-    team2_words = {synonyms.get(word, word) for word in team2_words}
-    return len(team1_words.intersection(team2_words)) > 0
+    return classify_pick(pick=team1, candidates=[team2]) is not None
 
 
 def str_match_team_name(str_to_classify: str, candidate_labels: List[str]) -> str:
-    matches = [is_same_team(team1=str_to_classify, team2=cand) for cand in candidate_labels]
-    n_matches = sum(matches)
-    if n_matches == 1:  # Exactly one of the candidates match
-        top_idx = np.argmax(matches)
-        return candidate_labels[top_idx]
+    """Classify a free-text team name (e.g. a player's pick) into one of the candidate labels
+
+    Args:
+        str_to_classify (str): Free-text team name
+        candidate_labels (List[str]): Candidate team names
+
+    Returns:
+        str: The candidate label with the most matching words
+
+    Raises:
+        ValueError: If no single candidate matches best
+    """
+    team = classify_pick(pick=str_to_classify, candidates=candidate_labels)
+    for label in candidate_labels:
+        if team is not None and resolve_team(label) == team:
+            return label
 
     # Otherwise, raise a ValueError
     raise ValueError(
-        f"Failed to classify '{str_to_classify}' into {candidate_labels} - matched "
-        f"{n_matches} candidates"
+        f"Failed to classify '{str_to_classify}' into {candidate_labels} - no single candidate "
+        "matched best"
     )
@@ -0,0 +1,106 @@
+import json
+import sqlite3
+import time
+from contextlib import closing
+from datetime import datetime
+from typing import List, Optional
+
+from nfl_commish.game import Game, TeamNameEnum, TeamScore
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id TEXT PRIMARY KEY,
+    commence_time TEXT NOT NULL,
+    home_team TEXT NOT NULL,
+    away_team TEXT NOT NULL,
+    completed INTEGER,
+    scores TEXT
+);
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class GameStore:
+    """Local SQLite store of validated Game records, so that games can be reloaded after a restart
+    without an API call or re-validation
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Path to the SQLite database file. Created if it does not exist.
+        """
+        self.path = path
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def upsert(self, games: List[Game]) -> None:
+        """Insert new games and update existing ones (e.g. rescheduled or completed games)
+
+        Args:
+            games (List[Game]): Validated games to store
+        """
+        rows = [
+            (
+                game.id,
+                game.commence_time.isoformat(),
+                game.home_team.value,
+                game.away_team.value,
+                None if game.completed is None else int(game.completed),
+                (
+                    None
+                    if game.scores is None
+                    else json.dumps([[score.name.value, score.score] for score in game.scores])
+                ),
+            )
+            for game in games
+        ]
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("INSERT OR REPLACE INTO games VALUES (?, ?, ?, ?, ?, ?)", rows)
+            conn.execute(
+                "INSERT OR REPLACE INTO metadata VALUES ('updated_at', ?)", (str(time.time()),)
+            )
+
+    def load(self) -> List[Game]:
+        """Load every stored game, ordered by commence time. Records were validated before they
+        were stored, so they are constructed without re-validation.
+
+        Returns:
+            List[Game]: The stored games
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT * FROM games ORDER BY commence_time, id").fetchall()
+        return [
+            Game.model_construct(
+                id=game_id,
+                commence_time=datetime.fromisoformat(commence_time),
+                home_team=TeamNameEnum(home_team),
+                away_team=TeamNameEnum(away_team),
+                completed=None if completed is None else bool(completed),
+                scores=(
+                    None
+                    if scores is None
+                    else [
+                        TeamScore.model_construct(name=TeamNameEnum(name), score=score)
+                        for name, score in json.loads(scores)
+                    ]
+                ),
+            )
+            for game_id, commence_time, home_team, away_team, completed, scores in rows
+        ]
+
+    def age(self) -> Optional[float]:
+        """Seconds since the store was last updated
+
+        Returns:
+            Optional[float]: Seconds since the last upsert, or None if the store is empty
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT value FROM metadata WHERE key = 'updated_at'").fetchone()
+        return None if row is None else time.time() - float(row[0])
@@ -0,0 +1,141 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from nfl_commish.game import Game, TeamNameEnum, get_this_week_window
+
+# Integer codes for each team, in alphabetical order of the standardized team names
+TEAM_NAMES = sorted(team.value for team in TeamNameEnum)
+TEAM_CODES: Dict[str, int] = {name: code for code, name in enumerate(TEAM_NAMES)}
+NO_TEAM = -1
+
+
+class GameTable:
+    """Columnar table of games, with vectorized filters over commence time and completion. Filters
+    return new tables which share the underlying Game objects.
+
+    Columns:
+        id: Game ID
+        commence_time: Kickoff time (UTC)
+        completed: Whether the game is completed (False if unknown)
+        home_team, away_team: Team codes (see TEAM_CODES)
+        home_score, away_score: Scores (NaN if not available)
+        winner: Team code of the winner, or NO_TEAM if the game is not completed
+    """
+
+    def __init__(self, games: Iterable[Game]):
+        """
+        Args:
+            games (Iterable[Game]): The games in the table
+        """
+        games = list(games)
+        self._games = np.empty(len(games), dtype=object)  # Assigned one by one, since pydantic
+        for row, game in enumerate(games):  # models are iterable and numpy would unpack them
+            self._games[row] = game
+        self.df = self._build_df(self._games)
+        self._index = {game_id: row for row, game_id in enumerate(self.df["id"])}
+
+    @staticmethod
+    def _build_df(games: np.ndarray) -> pd.DataFrame:
+        home_scores = np.full(len(games), np.nan)
+        away_scores = np.full(len(games), np.nan)
+        for row, game in enumerate(games):
+            for score in game.scores or []:
+                if score.name == game.home_team:
+                    home_scores[row] = score.score
+                elif score.name == game.away_team:
+                    away_scores[row] = score.score
+        return pd.DataFrame(
+            {
+                "id": [game.id for game in games],
+                "commence_time": pd.to_datetime([game.commence_time for game in games], utc=True),
+                "completed": np.array([bool(game.completed) for game in games], dtype=bool),
+                "home_team": np.array(
+                    [TEAM_CODES[game.home_team.value] for game in games], dtype=np.int16
+                ),
+                "away_team": np.array(
+                    [TEAM_CODES[game.away_team.value] for game in games], dtype=np.int16
+                ),
+                "home_score": home_scores,
+                "away_score": away_scores,
+                "winner": np.array(
+                    [
+                        NO_TEAM if game.winner is None else TEAM_CODES[game.winner.value]
+                        for game in games
+                    ],
+                    dtype=np.int16,
+                ),
+            }
+        )
+
+    def _take(self, rows: np.ndarray) -> "GameTable":
+        """New table with only the given rows, from a boolean mask or an array of row indices"""
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        table = GameTable.__new__(GameTable)
+        table._games = self._games[rows]
+        table.df = self.df.iloc[rows].reset_index(drop=True)
+        table._index = {game_id: row for row, game_id in enumerate(table.df["id"])}
+        return table
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def to_games(self) -> List[Game]:
+        """The games in the table, in table order
+
+        Returns:
+            List[Game]: The games
+        """
+        return list(self._games)
+
+    def filter_by_date(
+        self, after: Optional[datetime] = None, before: Optional[datetime] = None
+    ) -> "GameTable":
+        """Keep only games with a commence_time strictly between after and before
+
+        Args:
+            after (Optional[datetime], optional): Lower bound. If None, unbounded. Defaults to None.
+            before (Optional[datetime], optional): Upper bound. If None, unbounded. Defaults to
+                None.
+
+        Returns:
+            GameTable: The filtered table
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if after is not None:
+            mask &= (self.df["commence_time"] > pd.Timestamp(after)).to_numpy()
+        if before is not None:
+            mask &= (self.df["commence_time"] < pd.Timestamp(before)).to_numpy()
+        return self._take(mask)
+
+    def this_week(self) -> "GameTable":
+        """Keep only games between now and the coming Tuesday
+
+        Returns:
+            GameTable: The filtered table
+        """
+        now, next_tuesday = get_this_week_window()
+        return self.filter_by_date(after=now, before=next_tuesday)
+
+    def completed(self) -> "GameTable":
+        """Keep only games which have completed
+
+        Returns:
+            GameTable: The filtered table
+        """
+        return self._take(self.df["completed"].to_numpy())
+
+    def select(self, game_ids: Iterable[str]) -> "GameTable":
+        """Keep only the games with the given IDs, in table order. Unknown IDs are ignored.
+
+        Args:
+            game_ids (Iterable[str]): Game IDs to keep
+
+        Returns:
+            GameTable: The filtered table
+        """
+        rows = sorted({self._index[game_id] for game_id in game_ids if game_id in self._index})
+        return self._take(np.array(rows, dtype=np.int64))
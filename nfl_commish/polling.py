@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from nfl_commish.game import Game
+
+
+def expected_end_groups(
+    games: List[Game],
+    now: datetime,
+    expected_duration: timedelta = timedelta(hours=3, minutes=15),
+    group_window: timedelta = timedelta(minutes=30),
+) -> List[datetime]:
+    """Poll times for the games expected to end after now. Games expected to end within
+    group_window of each other share one poll, at the latest of their expected end times.
+
+    Args:
+        games (List[Game]): Games still waiting for a winner
+        now (datetime): Current time
+        expected_duration (timedelta, optional): Expected time from kickoff to final score.
+            Defaults to 3h15m.
+        group_window (timedelta, optional): Width of each group of expected end times. Defaults to
+            30 minutes.
+
+    Returns:
+        List[datetime]: One poll time per group, sorted
+    """
+    groups = []
+    group_start = None
+    for end in sorted({game.commence_time + expected_duration for game in games}):
+        if end <= now:
+            continue
+        if group_start is None or end > group_start + group_window:
+            group_start = end
+            groups.append(end)
+        else:
+            groups[-1] = end
+    return groups
+
+
+def next_poll_time(
+    pending_games: List[Game],
+    now: datetime,
+    polls_left: int,
+    n_overtime_polls: int = 0,
+    expected_duration: timedelta = timedelta(hours=3, minutes=15),
+    overtime_interval: timedelta = timedelta(minutes=15),
+    max_overtime_interval: timedelta = timedelta(hours=1),
+    final_delay: timedelta = timedelta(hours=5),
+) -> Optional[datetime]:
+    """Decide when to next poll the-odds API for scores, within a budget of polls for the week.
+
+    One poll is always kept back for final_delay after the latest pending kickoff, when every game
+    has surely ended, so the week's last games are scored even if they run long. The other polls
+    are placed at the expected end of each group of games. If there are fewer of them than groups,
+    the earliest groups are merged into later polls. Games still live after their expected end
+    are polled again after overtime_interval, backing off exponentially while they stay live -
+    but only with polls to spare.
+
+    Args:
+        pending_games (List[Game]): This week's games which do not have a winner yet
+        now (datetime): Current time
+        polls_left (int): Number of polls left in this week's budget
+        n_overtime_polls (int, optional): Number of consecutive polls which found games still live
+            after their expected end. Defaults to 0.
+        expected_duration (timedelta, optional): Expected time from kickoff to final score.
+            Defaults to 3h15m.
+        overtime_interval (timedelta, optional): Wait before re-polling games which run long.
+            Defaults to 15 minutes.
+        max_overtime_interval (timedelta, optional): Longest wait between polls of games which run
+            long. Defaults to 1 hour.
+        final_delay (timedelta, optional): Time after the latest kickoff for the final poll.
+            Defaults to 5 hours.
+
+    Returns:
+        Optional[datetime]: Time of the next poll, or None if no more polls are needed (or left)
+    """
+    if len(pending_games) == 0 or polls_left <= 0:
+        return None
+
+    # The final poll, kept back for when every game has surely ended
+    final_poll = max(game.commence_time for game in pending_games) + final_delay
+    final_poll = max(final_poll, now + overtime_interval)
+    n_group_polls = polls_left - 1
+
+    # One poll at the end of each group before the final poll, keeping the latest groups if there
+    # are too few polls
+    groups = [
+        end
+        for end in expected_end_groups(
+            games=pending_games, now=now, expected_duration=expected_duration
+        )
+        if end < final_poll
+    ]
+    if len(groups) > n_group_polls:
+        groups = groups[-n_group_polls:] if n_group_polls > 0 else []
+    n_spare = n_group_polls - len(groups)
+    is_overtime = any(game.commence_time + expected_duration <= now for game in pending_games)
+    if not is_overtime:
+        return groups[0] if groups else final_poll
+
+    # Re-poll games running long before the next group (or the final poll) only with polls to
+    # spare, backing off while they stay live
+    backoff = min(overtime_interval * 2**n_overtime_polls, max_overtime_interval)
+    next_poll = groups[0] if groups else final_poll
+    if n_spare > 0:
+        return min(next_poll, now + backoff)
+    return next_poll
@@ -0,0 +1,199 @@
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import List, Mapping, Optional
+
+from loguru import logger
+from pydantic import BaseModel
+from pytz import utc
+
+
+class OddsApiQuota(BaseModel):
+    requests_used: int
+    requests_remaining: int
+    used_by_last_call: int
+    max_cost_per_call: int  # Most expensive single call seen, used to project future spend
+    updated_at: datetime
+
+
+class QuotaProjection(BaseModel):
+    n_month_calls: int
+    month_cost: int
+    n_season_calls: int
+    season_cost: int
+    requests_remaining: Optional[int]
+
+    @property
+    def is_tight(self) -> bool:
+        return self.requests_remaining is not None and self.month_cost > self.requests_remaining
+
+
+class OddsApiBudget:
+    """Process-wide record of the-odds API quota, taken from the x-requests-* response headers and
+    optionally persisted to a JSON file. The quota resets at the start of each month.
+    """
+
+    def __init__(self):
+        self.state_path: Optional[str] = None
+        self._quota: Optional[OddsApiQuota] = None
+        self._lock = threading.Lock()
+
+    def load(self, state_path: str) -> None:
+        """Persist the quota to the given file from now on, restoring any quota already recorded
+        there this month
+
+        Args:
+            state_path (str): Path to the quota JSON file
+        """
+        with self._lock:
+            self.state_path = state_path
+            if not os.path.exists(state_path):
+                return
+            try:
+                with open(state_path, "r") as f:
+                    quota = OddsApiQuota.model_validate_json(f.read())
+            except ValueError:
+                logger.warning(f"Ignoring invalid the-odds quota file at {state_path}")
+                return
+            if _month(quota.updated_at) == _month(datetime.now(tz=utc)):
+                if self._quota is None or quota.updated_at > self._quota.updated_at:
+                    self._quota = quota
+
+    def record(self, headers: Mapping[str, str]) -> Optional[OddsApiQuota]:
+        """Record the quota from a the-odds API response's headers
+
+        Args:
+            headers (Mapping[str, str]): Response headers
+
+        Returns:
+            Optional[OddsApiQuota]: The recorded quota, or None if the headers had no quota
+        """
+        try:
+            used = int(float(headers["x-requests-used"]))
+            remaining = int(float(headers["x-requests-remaining"]))
+            last = int(float(headers["x-requests-last"]))
+        except (KeyError, ValueError):
+            return None
+        with self._lock:
+            now = datetime.now(tz=utc)
+            max_cost = last
+            if self._quota is not None and _month(self._quota.updated_at) == _month(now):
+                max_cost = max(last, self._quota.max_cost_per_call)
+            self._quota = OddsApiQuota(
+                requests_used=used,
+                requests_remaining=remaining,
+                used_by_last_call=last,
+                max_cost_per_call=max_cost,
+                updated_at=now,
+            )
+            if self.state_path is not None:
+                tmp_path = f"{self.state_path}.tmp"
+                with open(tmp_path, "w") as f:
+                    f.write(self._quota.model_dump_json(indent=4))
+                os.replace(tmp_path, self.state_path)
+            return self._quota
+
+    @property
+    def quota(self) -> Optional[OddsApiQuota]:
+        """The most recently recorded quota, or None if nothing has been recorded this month"""
+        with self._lock:
+            if self._quota is None or _month(self._quota.updated_at) != _month(
+                datetime.now(tz=utc)
+            ):
+                return None
+            return self._quota.model_copy()
+
+    def project_spend(
+        self, call_times: List[datetime], now: Optional[datetime] = None
+    ) -> QuotaProjection:
+        """Project the quota spent by the planned API calls over the rest of the month and season.
+        Each call is assumed to cost as much as the most expensive call seen this month.
+
+        Args:
+            call_times (List[datetime]): Times of all planned API calls for the rest of the season
+            now (Optional[datetime], optional): Current time. Defaults to the current time.
+
+        Returns:
+            QuotaProjection: Projected spend, compared against the remaining quota
+        """
+        now = now or datetime.now(tz=utc)
+        quota = self.quota
+        cost_per_call = max(quota.max_cost_per_call, 1) if quota is not None else 1
+        future_calls = [t for t in call_times if t >= now]
+        n_month_calls = sum(1 for t in future_calls if _month(t) == _month(now))
+        return QuotaProjection(
+            n_month_calls=n_month_calls,
+            month_cost=n_month_calls * cost_per_call,
+            n_season_calls=len(future_calls),
+            season_cost=len(future_calls) * cost_per_call,
+            requests_remaining=quota.requests_remaining if quota is not None else None,
+        )
+
+
+def _month(dt: datetime) -> tuple:
+    """The (year, month) of a datetime in UTC"""
+    dt = dt.astimezone(utc)
+    return dt.year, dt.month
+
+
+# Process-wide budget, updated by every the-odds API request
+the_odds_budget = OddsApiBudget()
+
+
+def get_the_odds_quota() -> Optional[OddsApiQuota]:
+    """Get the most recently recorded the-odds API quota for this process
+
+    Returns:
+        Optional[OddsApiQuota]: The quota, or None if nothing has been recorded this month
+    """
+    return the_odds_budget.quota
+
+
+def plan_polls_within_budget(
+    poll_times: List[datetime],
+    n_future_weeks: int,
+    calls_per_poll: int = 1,
+    budget: Optional[OddsApiBudget] = None,
+    now: Optional[datetime] = None,
+) -> List[datetime]:
+    """Merge a week's scoring polls as much as needed for the projected spend to fit within the
+    remaining monthly quota. Future weeks are assumed to poll at the same times. Polls are first
+    merged into the latest poll of each day, then into the latest poll of the week - later polls
+    still pick up every game completed before them.
+
+    Args:
+        poll_times (List[datetime]): This week's planned scoring poll times
+        n_future_weeks (int): Number of weeks left in the season after this one
+        calls_per_poll (int, optional): Number of the-odds API calls made by each poll (e.g. the
+            scores call plus an odds call for the league outlook). Defaults to 1.
+        budget (Optional[OddsApiBudget], optional): The budget to plan against. Defaults to the
+            process-wide budget.
+        now (Optional[datetime], optional): Current time. Defaults to the current time.
+
+    Returns:
+        List[datetime]: The (possibly merged) poll times, sorted
+    """
+    budget = budget or the_odds_budget
+    poll_times = sorted(poll_times)
+    latest_per_day = {}
+    for poll_time in poll_times:
+        latest_per_day[poll_time.date()] = poll_time
+    candidates = [poll_times, sorted(latest_per_day.values()), poll_times[-1:]]
+    for times in candidates:
+        season_times = [
+            t + timedelta(weeks=k)
+            for t in times
+            for k in range(n_future_weeks + 1)
+            for _ in range(calls_per_poll)
+        ]
+        projection = budget.project_spend(call_times=season_times, now=now)
+        logger.info(
+            f"Projected the-odds spend for {len(times)} polls per week, {calls_per_poll} calls "
+            f"each - {projection.month_cost} "
+            f"this month, {projection.season_cost} this season, "
+            f"{projection.requests_remaining} remaining"
+        )
+        if not projection.is_tight:
+            return times
+        logger.warning(f"the-odds quota is tight - merging {len(times)} scoring polls")
+    return candidates[-1]
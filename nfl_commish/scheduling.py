@@ -1,16 +1,130 @@
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.date import DateTrigger
 from loguru import logger
+from pytz import utc
 
 from nfl_commish.admin import (
     copy_predictions_to_admin,
     get_current_week_num,
     init_week,
+    the_odds_calls_per_score_poll,
     update_admin_with_completed_games,
 )
+from nfl_commish.game import Game
+from nfl_commish.polling import next_poll_time
+from nfl_commish.quota import plan_polls_within_budget, the_odds_budget
+
+
+def poll_scores(
+    scheduler: BackgroundScheduler,
+    week_number: int,
+    admin_sheet_name: str,
+    player_names: List[str],
+    gspread_secret_path: str,
+    the_odds_api_key: str,
+    pending_games: List[Game],
+    polls_left: int,
+    n_overtime_polls: int = 0,
+    expected_game_duration: timedelta = timedelta(hours=3, minutes=15),
+    overtime_poll_interval: timedelta = timedelta(minutes=15),
+    scoring_timedelta: timedelta = timedelta(hours=5),
+):
+    """Update the admin sheet with completed games, then schedule the next poll for the games
+    still waiting for a winner (see next_poll_time). Stops once every game has a winner.
+    """
+    try:
+        pending_ids = update_admin_with_completed_games(
+            week_number=week_number,
+            admin_sheet_name=admin_sheet_name,
+            player_names=player_names,
+            gspread_secret_path=gspread_secret_path,
+            the_odds_api_key=the_odds_api_key,
+        )
+        pending_games = [game for game in pending_games if game.id in pending_ids]
+    except Exception as e:
+        logger.error(f"Failed to update scores for week {week_number}, will poll again: {e}")
+    polls_left -= 1
+
+    # Back off while games stay live past their expected end
+    now = datetime.now(tz=utc)
+    if any(game.commence_time + expected_game_duration <= now for game in pending_games):
+        n_overtime_polls += 1
+    else:
+        n_overtime_polls = 0
+    schedule_score_poll(
+        scheduler=scheduler,
+        week_number=week_number,
+        admin_sheet_name=admin_sheet_name,
+        player_names=player_names,
+        gspread_secret_path=gspread_secret_path,
+        the_odds_api_key=the_odds_api_key,
+        pending_games=pending_games,
+        polls_left=polls_left,
+        n_overtime_polls=n_overtime_polls,
+        expected_game_duration=expected_game_duration,
+        overtime_poll_interval=overtime_poll_interval,
+        scoring_timedelta=scoring_timedelta,
+    )
+
+
+def schedule_score_poll(
+    scheduler: BackgroundScheduler,
+    week_number: int,
+    admin_sheet_name: str,
+    player_names: List[str],
+    gspread_secret_path: str,
+    the_odds_api_key: str,
+    pending_games: List[Game],
+    polls_left: int,
+    n_overtime_polls: int = 0,
+    expected_game_duration: timedelta = timedelta(hours=3, minutes=15),
+    overtime_poll_interval: timedelta = timedelta(minutes=15),
+    scoring_timedelta: timedelta = timedelta(hours=5),
+):
+    """Schedule the next adaptive score poll for the given pending games, if one is needed"""
+    poll_time = next_poll_time(
+        pending_games=pending_games,
+        now=datetime.now(tz=utc),
+        polls_left=polls_left,
+        n_overtime_polls=n_overtime_polls,
+        expected_duration=expected_game_duration,
+        overtime_interval=overtime_poll_interval,
+        final_delay=scoring_timedelta,
+    )
+    if poll_time is None:
+        if len(pending_games) > 0:
+            logger.warning(
+                f"No score polls left for week {week_number} - "
+                f"{len(pending_games)} games still without a winner"
+            )
+        else:
+            logger.info(f"Every game in week {week_number} has a winner - stopping score polls")
+        return
+    scheduler.add_job(
+        poll_scores,
+        DateTrigger(poll_time),
+        [
+            scheduler,
+            week_number,
+            admin_sheet_name,
+            player_names,
+            gspread_secret_path,
+            the_odds_api_key,
+            pending_games,
+            polls_left,
+            n_overtime_polls,
+            expected_game_duration,
+            overtime_poll_interval,
+            scoring_timedelta,
+        ],
+    )
+    logger.info(
+        f"Scheduled score poll at {poll_time} for {len(pending_games)} pending games "
+        f"({polls_left} polls left this week)"
+    )
 
 
 def schedule_commish_tasks(
@@ -22,7 +136,15 @@ def schedule_commish_tasks(
     copy_timedelta: timedelta = timedelta(minutes=5),
     scoring_timedelta: timedelta = timedelta(hours=5),
     max_weeks: int = 18,
+    the_odds_budget_path: Optional[str] = None,
+    adaptive_scoring: bool = True,
+    expected_game_duration: timedelta = timedelta(hours=3, minutes=15),
+    overtime_poll_interval: timedelta = timedelta(minutes=15),
 ):
+    # Restore the-odds API quota recorded by previous runs
+    if the_odds_budget_path is not None:
+        the_odds_budget.load(state_path=the_odds_budget_path)
+
     # First determine the current week number
     week_number = get_current_week_num(
         admin_sheet_name=admin_sheet_name,
@@ -73,10 +195,35 @@ def schedule_commish_tasks(
     for game in this_weeks_games:
         rounded_start_times.add(game.local_commence_time.replace(minute=0, second=0, microsecond=0))
 
+    # Merge the scoring polls if the-odds API quota would not last the month
+    poll_times = plan_polls_within_budget(
+        poll_times=[start_time + scoring_timedelta for start_time in rounded_start_times],
+        n_future_weeks=max_weeks - week_number,
+        calls_per_poll=the_odds_calls_per_score_poll(),
+    )
+
+    # Poll adaptively around expected game ends, spending no more polls than the fixed schedule
+    if adaptive_scoring:
+        schedule_score_poll(
+            scheduler=scheduler,
+            week_number=week_number,
+            admin_sheet_name=admin_sheet_name,
+            player_names=player_names,
+            gspread_secret_path=gspread_secret_path,
+            the_odds_api_key=the_odds_api_key,
+            pending_games=this_weeks_games,
+            polls_left=len(poll_times),
+            expected_game_duration=expected_game_duration,
+            overtime_poll_interval=overtime_poll_interval,
+            scoring_timedelta=scoring_timedelta,
+        )
+        poll_times = []
+
     # Schedule the tasks to update the admin sheet with completed games for each rounded start time
-    logger.info(f"Scheduling tasks to update scores {scoring_timedelta} after kickoff")
-    for start_time in rounded_start_times:
-        date_trigger = DateTrigger(start_time + scoring_timedelta)
+    if len(poll_times) > 0:
+        logger.info(f"Scheduling tasks to update scores {scoring_timedelta} after kickoff")
+    for poll_time in poll_times:
+        date_trigger = DateTrigger(poll_time)
         scheduler.add_job(
             update_admin_with_completed_games,
             date_trigger,
@@ -90,7 +237,7 @@ def schedule_commish_tasks(
         )
         logger.info(
             f"Scheduled task to update scores {scoring_timedelta} after (rounded) "
-            f"{start_time} kickoff"
+            f"{poll_time - scoring_timedelta} kickoff"
         )
 
     # Schedule this same task for next week on tuesday at 2 am
@@ -113,6 +260,11 @@ def schedule_commish_tasks(
             the_odds_api_key,
             copy_timedelta,
             scoring_timedelta,
+            max_weeks,
+            the_odds_budget_path,
+            adaptive_scoring,
+            expected_game_duration,
+            overtime_poll_interval,
         ],
     )
     logger.info(f"Scheduled next week's scheduler to run at {next_week}")
@@ -0,0 +1,118 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from nfl_commish.game import Game
+from nfl_commish.game_table import NO_TEAM, TEAM_CODES
+from nfl_commish.teams import classify_pick
+
+
+def game_rows(df: pd.DataFrame, games: List[Game]) -> np.ndarray:
+    """Positional row of each game in a week sheet
+
+    Args:
+        df (pd.DataFrame): The week sheet, with a "Game ID" column
+        games (List[Game]): Games to find
+
+    Returns:
+        np.ndarray: Row position of each game (the first, if a game ID appears more than once)
+
+    Raises:
+        KeyError: If a game is not in the sheet
+    """
+    rows: Dict[str, int] = {}
+    for row, game_id in enumerate(df["Game ID"]):
+        rows.setdefault(game_id, row)
+    return np.array([rows[game.id] for game in games], dtype=np.int64)
+
+
+def pick_matrix(
+    df: pd.DataFrame, player_names: List[str], games: List[Game]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Load every player's picks for the given games into players x games matrices. Picks are
+    classified into one of each game's two teams. Missing picks and picks which cannot be
+    classified score no points.
+
+    Args:
+        df (pd.DataFrame): The week sheet, with "Game ID", "<player> Predicted" and
+            "<player> Confidence" columns
+        player_names (List[str]): List of player names
+        games (List[Game]): Games to load the picks of
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Team code of each pick (NO_TEAM if it scores no points) and
+            its confidence, each of shape (n_players, n_games)
+    """
+    rows = game_rows(df=df, games=games)
+    picks = np.full((len(player_names), len(games)), NO_TEAM, dtype=np.int16)
+    confidences = np.zeros((len(player_names), len(games)), dtype=np.int64)
+    for i, player_name in enumerate(player_names):
+        preds = df[f"{player_name} Predicted"].to_numpy()[rows]
+        confs = pd.to_numeric(df[f"{player_name} Confidence"], errors="coerce").to_numpy()[rows]
+        for j, game in enumerate(games):
+            pred, conf = preds[j], confs[j]
+            if not pred or np.isnan(conf) or conf == 0:
+                logger.warning(f"Player {player_name} missing prediction for game {game.id}")
+                continue
+            team = classify_pick(
+                pick=str(pred), candidates=(game.home_team.value, game.away_team.value)
+            )
+            if team is None:
+                logger.error(
+                    f"Failed to classify {player_name}'s pick '{pred}' into "
+                    f"{[game.home_team.value, game.away_team.value]} for game {game.id}"
+                )
+                continue
+            picks[i, j] = TEAM_CODES[team.value]
+            confidences[i, j] = int(conf)
+    return picks, confidences
+
+
+def winner_codes(games: List[Game]) -> np.ndarray:
+    """Team code of each game's winner
+
+    Args:
+        games (List[Game]): The games
+
+    Returns:
+        np.ndarray: Winner team codes, NO_TEAM for games without a winner
+    """
+    return np.array(
+        [NO_TEAM if game.winner is None else TEAM_CODES[game.winner.value] for game in games],
+        dtype=np.int16,
+    )
+
+
+def score_picks(picks: np.ndarray, confidences: np.ndarray, winners: np.ndarray) -> np.ndarray:
+    """Points for every pick - its confidence if it picked the winner, otherwise 0
+
+    Args:
+        picks (np.ndarray): Team codes of the picks, shape (n_players, n_games)
+        confidences (np.ndarray): Confidences of the picks, shape (n_players, n_games)
+        winners (np.ndarray): Team codes of the winners, shape (n_games,)
+
+    Returns:
+        np.ndarray: Points, shape (n_players, n_games)
+    """
+    correct = (picks == winners[np.newaxis, :]) & (winners != NO_TEAM)[np.newaxis, :]
+    return np.where(correct, confidences, 0)
+
+
+def score_week(df: pd.DataFrame, player_names: List[str], games: List[Game]) -> pd.DataFrame:
+    """Score every player's picks for the given completed games
+
+    Args:
+        df (pd.DataFrame): The week sheet
+        player_names (List[str]): List of player names
+        games (List[Game]): Completed games to score
+
+    Returns:
+        pd.DataFrame: Points, indexed by game ID with a column per player
+    """
+    picks, confidences = pick_matrix(df=df, player_names=player_names, games=games)
+    points = score_picks(picks=picks, confidences=confidences, winners=winner_codes(games))
+    return pd.DataFrame(
+        points.T, index=pd.Index([game.id for game in games], name="Game ID"), columns=player_names
+    )
@@ -13,6 +13,20 @@ class Settings(BaseSettings):
     scoring_timedelta: timedelta = timedelta(hours=5)
     max_weeks: int = 18
     missed_pred_str: str = "missed"
+    sheets_max_workers: int = 8
+    league_state_path: Optional[str] = None
+    the_odds_base_url: str = "https://api.the-odds-api.com"
+    the_odds_cache_dir: Optional[str] = None
+    the_odds_cache_max_age: timedelta = timedelta(minutes=5)
+    the_odds_budget_path: Optional[str] = None
+    game_store_path: Optional[str] = None
+    game_store_max_age: timedelta = timedelta(days=1)
+    adaptive_scoring: bool = True
+    expected_game_duration: timedelta = timedelta(hours=3, minutes=15)
+    overtime_poll_interval: timedelta = timedelta(minutes=15)
+    simulation_trials: int = 0  # Trials for the week and season outlook after scoring, 0 for none
+    simulation_use_odds: bool = False  # Bookmaker h2h odds instead of coin flips (uses API quota)
+    simulation_workers: int = 1  # Processes for the outlook simulation, 1 to run in the job thread
 
     # Settings config
     model_config = SettingsConfigDict(extra="ignore", env_file=".env")
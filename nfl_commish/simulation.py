@@ -0,0 +1,327 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from nfl_commish.game import Game
+from nfl_commish.game_table import TEAM_CODES
+from nfl_commish.utils import convert_team_name
+from nfl_commish.validation import MAX_CONFIDENCE
+
+UNPICKED = -2  # Pick team code for games which players have not picked yet
+
+
+class SimulationResult(BaseModel):
+    player_names: List[str]
+    n_trials: int
+    win_probabilities: Dict[str, float]  # Ties for first are broken at random
+    position_probabilities: Dict[str, List[float]]  # Chance of each finish, 1st place first
+    expected_points: Dict[str, float]
+
+    def summary(self) -> pd.DataFrame:
+        """Outcome table, ordered by chance of winning
+
+        Returns:
+            pd.DataFrame: Win probability, expected points and expected finish per player
+        """
+        positions = np.arange(1, len(self.player_names) + 1)
+        return pd.DataFrame(
+            {
+                "Win %": [100 * self.win_probabilities[name] for name in self.player_names],
+                "Expected Points": [self.expected_points[name] for name in self.player_names],
+                "Expected Finish": [
+                    float(np.dot(self.position_probabilities[name], positions))
+                    for name in self.player_names
+                ],
+            },
+            index=pd.Index(self.player_names, name="Player"),
+        ).sort_values("Win %", ascending=False)
+
+
+def flat_home_win_probabilities(games: List[Game]) -> np.ndarray:
+    """Every game is a coin flip
+
+    Args:
+        games (List[Game]): The games
+
+    Returns:
+        np.ndarray: Home team win probability of each game
+    """
+    return np.full(len(games), 0.5)
+
+
+def h2h_home_win_probabilities(
+    games: List[Game], the_odds_json: List[Dict], default: float = 0.5
+) -> np.ndarray:
+    """Home team win probabilities implied by the-odds API h2h (moneyline) market, in decimal
+    format. Each bookmaker's implied probabilities are normalized to remove the bookmaker margin,
+    then averaged across bookmakers.
+
+    Args:
+        games (List[Game]): The games
+        the_odds_json (List[Dict]): the-odds API odds response with the h2h market
+        default (float, optional): Probability for games without odds. Defaults to 0.5.
+
+    Returns:
+        np.ndarray: Home team win probability of each game
+    """
+    probabilities = {}
+    for event in the_odds_json:
+        home, away = convert_team_name(event["home_team"]), convert_team_name(event["away_team"])
+        event_probabilities = []
+        for bookmaker in event.get("bookmakers", []):
+            for market in bookmaker.get("markets", []):
+                if market["key"] != "h2h":
+                    continue
+                prices = {convert_team_name(o["name"]): o["price"] for o in market["outcomes"]}
+                if prices.get(home, 0) > 0 and prices.get(away, 0) > 0:
+                    home_implied, away_implied = 1 / prices[home], 1 / prices[away]
+                    event_probabilities.append(home_implied / (home_implied + away_implied))
+        if event_probabilities:
+            probabilities[event["id"]] = probabilities[(home, away)] = np.mean(event_probabilities)
+    return np.array(
+        [
+            probabilities.get(game.id, probabilities.get((game.home_team, game.away_team), default))
+            for game in games
+        ]
+    )
+
+
+def week_starts(games: List[Game]) -> List:
+    """The Tuesday (Eastern) starting the NFL week of each game"""
+    return [game.local_date - timedelta(days=(game.local_date.weekday() - 1) % 7) for game in games]
+
+
+def unpicked_confidences(games: List[Game], home_win_probabilities: np.ndarray) -> np.ndarray:
+    """Confidences players are assumed to give games they have not picked yet: within each week,
+    the most lopsided game gets the highest rank, down to 17 - n for the closest of n games
+
+    Args:
+        games (List[Game]): The games
+        home_win_probabilities (np.ndarray): Home team win probability of each game
+
+    Returns:
+        np.ndarray: Confidence of each game
+    """
+    confidences = np.zeros(len(games), dtype=np.int64)
+    weeks = np.array(week_starts(games), dtype=object)
+    lopsidedness = np.abs(np.asarray(home_win_probabilities) - 0.5)
+    for week in dict.fromkeys(weeks.tolist()):
+        idx = np.flatnonzero(weeks == week)
+        order = idx[np.argsort(lopsidedness[idx], kind="stable")]
+        confidences[order] = np.arange(MAX_CONFIDENCE + 1 - len(idx), MAX_CONFIDENCE + 1)
+    return confidences
+
+
+def _simulate_chunk(
+    seed: np.random.SeedSequence,
+    n_trials: int,
+    base_points: np.ndarray,
+    known_probabilities: np.ndarray,
+    known_weights: np.ndarray,
+    exact_probabilities: np.ndarray,
+    exact_confidences: np.ndarray,  # Per player, shape (n_players, n_exact_games)
+    approx_probabilities: np.ndarray,
+    approx_confidences: np.ndarray,
+) -> tuple:
+    """Simulate a chunk of trials
+
+    Returns:
+        tuple: Finish position counts (n_players x n_players) and the sum of points per player
+    """
+    rng = np.random.default_rng(seed)
+    n_players = len(base_points)
+    points = np.tile(base_points.astype(np.float32), (n_trials, 1))
+
+    # Picked games: a player's points are linear in the home team results
+    if len(known_probabilities) > 0:
+        home_wins = rng.random((n_trials, len(known_probabilities)), dtype=np.float32)
+        home_wins = (home_wins < known_probabilities).astype(np.float32)
+        points += home_wins @ known_weights
+
+    # Unpicked games: each player picks the home team with its win probability, so is correct
+    # with the probability of the result which happened
+    if len(exact_probabilities) > 0:
+        home_wins = rng.random((n_trials, len(exact_probabilities)), dtype=np.float32)
+        home_wins = home_wins < exact_probabilities
+        p_correct = np.where(home_wins, exact_probabilities, 1 - exact_probabilities)
+        draws = rng.random((n_trials, n_players, len(exact_probabilities)), dtype=np.float32)
+        correct = (draws < p_correct[:, np.newaxis, :]).astype(np.float32)
+        points += np.einsum("tpg,pg->tp", correct, exact_confidences)
+
+    # Later unpicked weeks: given the results, a player's points are a sum of many independent
+    # picks, so are drawn from a normal distribution instead of pick by pick. The variance,
+    # sum(c^2 p (1 - p)), is the same whichever team won each game.
+    if len(approx_probabilities) > 0:
+        home_wins = rng.random((n_trials, len(approx_probabilities)), dtype=np.float32)
+        home_wins = home_wins < approx_probabilities
+        p_correct = np.where(home_wins, approx_probabilities, 1 - approx_probabilities)
+        mean = p_correct @ approx_confidences
+        std = np.sqrt(
+            np.sum(approx_confidences**2 * approx_probabilities * (1 - approx_probabilities))
+        )
+        noise = rng.standard_normal((n_trials, n_players), dtype=np.float32)
+        points += np.rint(mean[:, np.newaxis] + std * noise)
+
+    # Rank the players in each trial, breaking ties at random
+    scores = points + rng.random(points.shape, dtype=np.float32) * 0.5
+    order = np.argsort(-scores, axis=1)
+    positions = np.empty_like(order)
+    positions[np.arange(n_trials)[:, np.newaxis], order] = np.arange(n_players)
+    players = np.broadcast_to(np.arange(n_players), positions.shape)
+    counts = np.bincount(
+        (players * n_players + positions).ravel(), minlength=n_players * n_players
+    ).reshape(n_players, n_players)
+    return counts, points.sum(axis=0, dtype=np.float64)
+
+
+def simulate_league(
+    player_names: List[str],
+    current_points: Sequence[int],
+    games: List[Game],
+    home_win_probabilities: np.ndarray,
+    picks: Optional[np.ndarray] = None,
+    confidences: Optional[np.ndarray] = None,
+    n_week_games: Optional[int] = None,
+    used_ranks: Optional[Sequence[Sequence[int]]] = None,
+    n_trials: int = 1_000_000,
+    n_workers: Optional[int] = None,
+    chunk_size: int = 20_000,
+    seed: Optional[int] = None,
+) -> SimulationResult:
+    """Monte Carlo simulation of the remaining games, to estimate each player's chance of winning
+    (the week or the season, depending on the points and games given) and of each finish.
+
+    Games are simulated independently from their home team win probabilities. Picked games score
+    their confidence for a correct pick. For games not picked yet, each player is assumed to pick
+    the home team with its win probability and to give confidences as in unpicked_confidences (or
+    their unused ranks, in a partly picked or partly played week). The earliest unpicked week is
+    simulated pick by pick, and each player's points in later weeks are drawn from their normal
+    approximation. Trials run in chunks of vectorized NumPy draws, spread across a process pool.
+
+    Args:
+        player_names (List[str]): List of player names
+        current_points (Sequence[int]): Each player's points so far
+        games (List[Game]): The remaining games
+        home_win_probabilities (np.ndarray): Home team win probability of each game (see
+            flat_home_win_probabilities and h2h_home_win_probabilities)
+        picks (Optional[np.ndarray], optional): Team code of each player's pick, shape (n_players,
+            n_games), as from scoring.pick_matrix. Games which are UNPICKED for every player are
+            simulated. If None, every game is unpicked. Defaults to None.
+        confidences (Optional[np.ndarray], optional): Confidence of each pick, same shape as
+            picks. Defaults to None.
+        n_week_games (Optional[int], optional): Number of games in the week of the first game,
+            including those already played. Defaults to the number of its games given.
+        used_ranks (Optional[Sequence[Sequence[int]]], optional): Confidences each player has
+            already used in the week of the first game, e.g. on games already played. Defaults to
+            None.
+        n_trials (int, optional): Number of trials. Defaults to 1,000,000.
+        n_workers (Optional[int], optional): Number of processes. If 1, trials run in this process.
+            Defaults to the number of CPUs.
+        chunk_size (int, optional): Number of trials per chunk. Defaults to 20,000.
+        seed (Optional[int], optional): Random seed, for reproducible results. Defaults to None.
+
+    Returns:
+        SimulationResult: Each player's win probability, finish distribution and expected points
+    """
+    n_players = len(player_names)
+    probabilities = np.asarray(home_win_probabilities, dtype=np.float32)
+    if picks is None:
+        picks = np.full((n_players, len(games)), UNPICKED, dtype=np.int16)
+        confidences = np.zeros((n_players, len(games)), dtype=np.int64)
+    is_unpicked = (picks == UNPICKED).all(axis=0)
+
+    # Picked games: points = base + home_wins @ weights, where a home pick gains its confidence
+    # when the home team wins, and an away pick loses it from a base of all away picks winning
+    known = np.flatnonzero(~is_unpicked)
+    home_codes = np.array([TEAM_CODES[game.home_team.value] for game in games], dtype=np.int16)
+    away_codes = np.array([TEAM_CODES[game.away_team.value] for game in games], dtype=np.int16)
+    picked_home = picks[:, known] == home_codes[known]
+    picked_away = picks[:, known] == away_codes[known]
+    known_confidences = np.asarray(confidences)[:, known].astype(np.float32)
+    known_weights = (known_confidences * (picked_home.astype(np.float32) - picked_away)).T
+    base_points = np.asarray(current_points, dtype=np.float32) + (
+        known_confidences * picked_away
+    ).sum(axis=1)
+
+    # Unpicked games: the earliest week is simulated pick by pick, later weeks approximately
+    unknown = np.flatnonzero(is_unpicked)
+    unknown_games = [games[i] for i in unknown]
+    unknown_confidences = unpicked_confidences(unknown_games, probabilities[unknown])
+    unknown_weeks = np.array(week_starts(unknown_games), dtype=object)
+    is_exact = unknown_weeks == (min(unknown_weeks) if len(unknown_weeks) else None)
+    exact, approx = unknown[is_exact], unknown[~is_exact]
+    exact_confidences = np.tile(unknown_confidences[is_exact], (n_players, 1)).astype(np.float32)
+    if len(exact) > 0:
+        # In a partly picked or partly played week, each player gives the unpicked games their
+        # unused ranks, with the highest on the most lopsided game
+        game_weeks = np.array(week_starts(games), dtype=object)
+        in_week = game_weeks == unknown_weeks[is_exact][0]
+        picked_in_week = in_week & ~is_unpicked
+        is_first_week = unknown_weeks[is_exact][0] == week_starts(games[:1])[0]
+        if not is_first_week:
+            n_week_games, used_ranks = None, None
+        if picked_in_week.any() or n_week_games is not None or used_ranks is not None:
+            n_week = in_week.sum() if n_week_games is None else n_week_games
+            ranks = np.arange(MAX_CONFIDENCE + 1 - n_week, MAX_CONFIDENCE + 1)
+            order = np.argsort(unknown_confidences[is_exact], kind="stable")
+            n_unpicked = len(order)
+            for i in range(n_players):
+                spent = np.asarray(confidences)[i, picked_in_week]
+                if used_ranks is not None:
+                    spent = np.concatenate([spent, np.asarray(used_ranks[i], dtype=np.int64)])
+                unused = np.setdiff1d(ranks, spent)
+                unused = np.concatenate([np.zeros(n_unpicked), unused])[-n_unpicked:]
+                exact_confidences[i, order] = unused
+    approx_confidences = unknown_confidences[~is_exact].astype(np.float32)
+
+    # Run the trials in chunks, each with its own random stream
+    chunk_sizes = [chunk_size] * (n_trials // chunk_size)
+    if n_trials % chunk_size:
+        chunk_sizes.append(n_trials % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    args = [
+        (
+            chunk_seed,
+            size,
+            base_points,
+            probabilities[known],
+            known_weights,
+            probabilities[exact],
+            exact_confidences,
+            probabilities[approx],
+            approx_confidences,
+        )
+        for chunk_seed, size in zip(seeds, chunk_sizes)
+    ]
+    n_workers = n_workers or os.cpu_count() or 1
+    if n_workers == 1 or len(args) == 1:
+        results = [_simulate_chunk(*chunk_args) for chunk_args in args]
+    else:
+        # Spawn rather than fork workers, as this may run from a scheduler thread
+        with ProcessPoolExecutor(
+            max_workers=min(n_workers, len(args)), mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            results = list(executor.map(_simulate_chunk, *zip(*args)))
+    counts = sum(result[0] for result in results)
+    point_sums = sum(result[1] for result in results)
+
+    position_probabilities = counts / n_trials
+    return SimulationResult(
+        player_names=player_names,
+        n_trials=n_trials,
+        win_probabilities={
+            name: float(position_probabilities[i, 0]) for i, name in enumerate(player_names)
+        },
+        position_probabilities={
+            name: position_probabilities[i].tolist() for i, name in enumerate(player_names)
+        },
+        expected_points={
+            name: float(point_sums[i] / n_trials) for i, name in enumerate(player_names)
+        },
+    )
@@ -0,0 +1,188 @@
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class SeasonStandings:
+    """In-process season standings: points per week and player, kept up to date by applying the
+    change in points of each newly scored game. Season totals, ranks, gaps to the leader and
+    weekly highs are all derived from the same weeks x players array.
+    """
+
+    def __init__(self, player_names: List[str], n_weeks: int = 18):
+        """
+        Args:
+            player_names (List[str]): List of player names
+            n_weeks (int, optional): Number of weeks in the season. Defaults to 18.
+        """
+        self.player_names = list(player_names)
+        self.week_points = np.zeros((n_weeks, len(player_names)), dtype=np.int64)
+        self.score_columns: Optional[Dict[str, int]] = None  # 1-based Scores worksheet columns
+        self._game_points: Dict[str, Tuple[int, np.ndarray]] = {}
+        self._loaded_weeks = set()
+        self._written_rows: Dict[int, np.ndarray] = {}
+        self.lock = threading.RLock()
+
+    def has_week(self, week_number: int) -> bool:
+        """Whether the points of every game in the week have been loaded"""
+        return week_number in self._loaded_weeks
+
+    def load_scores(self, scores_df: pd.DataFrame) -> None:
+        """Seed the weekly totals from the Scores worksheet (one row per week, one column per
+        player), for weeks which have not been loaded game by game
+
+        Args:
+            scores_df (pd.DataFrame): The Scores worksheet
+        """
+        self.score_columns = {
+            name: scores_df.columns.get_loc(name) + 1 for name in self.player_names
+        }
+        totals = scores_df[self.player_names].apply(pd.to_numeric, errors="coerce").fillna(0)
+        for week_idx, row in enumerate(totals.to_numpy(dtype=np.int64)[: len(self.week_points)]):
+            if not self.has_week(week_idx + 1):
+                self.week_points[week_idx] = row
+                self._written_rows[week_idx + 1] = row.copy()
+
+    def load_week(self, week_number: int, points: pd.DataFrame) -> None:
+        """Replace a week's points with the points of each of its games
+
+        Args:
+            week_number (int): The week number
+            points (pd.DataFrame): Points indexed by game ID, with a column per player
+        """
+        self._game_points = {
+            game_id: entry
+            for game_id, entry in self._game_points.items()
+            if entry[0] != week_number
+        }
+        self.week_points[week_number - 1] = 0
+        self._loaded_weeks.add(week_number)
+        self.apply_game_points(week_number=week_number, points=points)
+
+    def apply_game_points(self, week_number: int, points: pd.DataFrame) -> np.ndarray:
+        """Apply the points of newly scored (or re-scored) games, only adding the change from the
+        points already applied for each game
+
+        Args:
+            week_number (int): The week number
+            points (pd.DataFrame): Points indexed by game ID, with a column per player
+
+        Returns:
+            np.ndarray: Change in each player's week total
+        """
+        grid = points[self.player_names].to_numpy(dtype=np.int64)
+        delta = np.zeros(len(self.player_names), dtype=np.int64)
+        for game_id, game_points in zip(points.index, grid):
+            previous = self._game_points.get(game_id)
+            if previous is not None:
+                delta -= previous[1]
+                self.week_points[previous[0] - 1] -= previous[1]
+            delta += game_points
+            self.week_points[week_number - 1] += game_points
+            self._game_points[game_id] = (week_number, game_points)
+        return delta
+
+    def week_totals(self, week_number: int) -> Dict[str, int]:
+        """Each player's points for a week"""
+        return dict(zip(self.player_names, self.week_points[week_number - 1].tolist()))
+
+    def row_changed(self, week_number: int) -> bool:
+        """Whether a week's totals differ from those last written to the Scores worksheet"""
+        written = self._written_rows.get(week_number)
+        return written is None or not np.array_equal(written, self.week_points[week_number - 1])
+
+    def mark_written(self, week_number: int) -> None:
+        """Record that a week's totals were written to the Scores worksheet"""
+        self._written_rows[week_number] = self.week_points[week_number - 1].copy()
+
+    @property
+    def season_totals(self) -> np.ndarray:
+        """Each player's season total"""
+        return self.week_points.sum(axis=0)
+
+    @property
+    def ranks(self) -> np.ndarray:
+        """Each player's season rank, with tied players sharing the best rank (1, 2, 2, 4)"""
+        totals = self.season_totals
+        return (totals[np.newaxis, :] > totals[:, np.newaxis]).sum(axis=1) + 1
+
+    @property
+    def gaps_to_leader(self) -> np.ndarray:
+        """Points each player is behind the season leader"""
+        totals = self.season_totals
+        return totals.max(initial=0) - totals
+
+    @property
+    def weekly_highs(self) -> np.ndarray:
+        """Highest player score of each week"""
+        return self.week_points.max(axis=1, initial=0)
+
+    @property
+    def weekly_high_counts(self) -> np.ndarray:
+        """Number of weeks each player had (or shared) the high score, ignoring scoreless weeks"""
+        highs = self.weekly_highs
+        is_high = (self.week_points == highs[:, np.newaxis]) & (highs[:, np.newaxis] > 0)
+        return is_high.sum(axis=0)
+
+    def summary(self) -> pd.DataFrame:
+        """Standings table, ordered by rank
+
+        Returns:
+            pd.DataFrame: Total, rank, gap to the leader and number of weekly highs per player
+        """
+        return pd.DataFrame(
+            {
+                "Total": self.season_totals,
+                "Rank": self.ranks,
+                "Gap": self.gaps_to_leader,
+                "Weekly Highs": self.weekly_high_counts,
+            },
+            index=pd.Index(self.player_names, name="Player"),
+        ).sort_values(["Rank", "Player"])
+
+
+def week_sheet_points(df: pd.DataFrame, player_names: List[str]) -> pd.DataFrame:
+    """Points already written to a week sheet, as a grid
+
+    Args:
+        df (pd.DataFrame): The week sheet, with "Game ID" and "<player> Points" columns
+        player_names (List[str]): List of player names
+
+    Returns:
+        pd.DataFrame: Points indexed by game ID, with a column per player (0 where blank)
+    """
+    points = pd.DataFrame(
+        {
+            name: pd.to_numeric(df[f"{name} Points"], errors="coerce").fillna(0).astype(np.int64)
+            for name in player_names
+        }
+    )
+    points.index = pd.Index(df["Game ID"], name="Game ID")
+    return points
+
+
+_standings: Dict[str, SeasonStandings] = {}
+_standings_lock = threading.Lock()
+
+
+def get_season_standings(
+    admin_sheet_name: str, player_names: List[str], n_weeks: int = 18
+) -> SeasonStandings:
+    """Get this process's standings for an admin sheet, creating them if needed
+
+    Args:
+        admin_sheet_name (str): The name of the admin google sheet
+        player_names (List[str]): List of player names
+        n_weeks (int, optional): Number of weeks in the season. Defaults to 18.
+
+    Returns:
+        SeasonStandings: The standings
+    """
+    with _standings_lock:
+        standings = _standings.get(admin_sheet_name)
+        if standings is None or standings.player_names != list(player_names):
+            standings = SeasonStandings(player_names=player_names, n_weeks=n_weeks)
+            _standings[admin_sheet_name] = standings
+        return standings
@@ -0,0 +1,88 @@
+import os
+import threading
+from datetime import datetime
+from typing import List, Optional
+
+from loguru import logger
+from pydantic import BaseModel
+from pytz import utc
+
+_state_lock = threading.Lock()
+
+
+class LeagueState(BaseModel):
+    week_number: int
+    game_ids: List[str] = []
+    completed_game_ids: List[str] = []
+    updated_at: datetime
+
+    @property
+    def is_week_complete(self) -> bool:
+        return len(self.game_ids) > 0 and set(self.game_ids) <= set(self.completed_game_ids)
+
+    @property
+    def current_week_number(self) -> int:
+        return self.week_number + 1 if self.is_week_complete else self.week_number
+
+
+def read_league_state(state_path: str) -> Optional[LeagueState]:
+    """Read the league state file, if it exists
+
+    Args:
+        state_path (str): Path to the league state JSON file
+
+    Returns:
+        Optional[LeagueState]: The league state, or None if there is no (valid) state file
+    """
+    if not os.path.exists(state_path):
+        return None
+    try:
+        with open(state_path, "r") as f:
+            return LeagueState.model_validate_json(f.read())
+    except ValueError:
+        logger.warning(f"Ignoring invalid league state file at {state_path}")
+        return None
+
+
+def write_league_state(state: LeagueState, state_path: str) -> None:
+    """Atomically write the league state file
+
+    Args:
+        state (LeagueState): The league state to write
+        state_path (str): Path to the league state JSON file
+    """
+    tmp_path = f"{state_path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(state.model_dump_json(indent=4))
+    os.replace(tmp_path, state_path)
+
+
+def record_week_games(
+    state_path: str, week_number: int, game_ids: List[str], completed_game_ids: List[str]
+) -> LeagueState:
+    """Record the games of a week, and which of them are completed. Games already recorded for the
+    same week are kept, so restarting mid-week never forgets a game.
+
+    Args:
+        state_path (str): Path to the league state JSON file
+        week_number (int): The week number
+        game_ids (List[str]): IDs of the week's games
+        completed_game_ids (List[str]): IDs of the week's games which have a winner
+
+    Returns:
+        LeagueState: The updated league state
+    """
+    with _state_lock:
+        state = read_league_state(state_path)
+        if state is None or state.week_number != week_number:
+            state = LeagueState(week_number=week_number, updated_at=datetime.now(tz=utc))
+        state.game_ids = _merge_ids(state.game_ids, game_ids)
+        state.completed_game_ids = _merge_ids(state.completed_game_ids, completed_game_ids)
+        state.updated_at = datetime.now(tz=utc)
+        write_league_state(state=state, state_path=state_path)
+        return state
+
+
+def _merge_ids(existing: List[str], new: List[str]) -> List[str]:
+    """Merge two lists of IDs, keeping the order of first appearance"""
+    return list(dict.fromkeys(existing + new))
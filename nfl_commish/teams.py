@@ -0,0 +1,304 @@
+import re
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+from nfl_commish.utils import get_valid_team_names
+
+
+# Create an enum of valid team names
+class StrEnum(str, Enum):
+    pass
+
+
+TeamNameEnum = StrEnum("TeamNameEnum", [(name, name) for name in sorted(get_valid_team_names())])
+
+# Words shared by several teams' cities, which say nothing about the team on their own
+IGNORE_WORDS = frozenset({"new", "san", "las", "los", "city", "bay"})
+
+# Alternative words for a word in a team's name, matched anywhere in a pick
+WORD_ALIASES = {
+    "fran": "francisco",
+    "frisco": "francisco",
+    "niners": "49ers",
+    "philly": "philadelphia",
+    "bucs": "buccaneers",
+    "buccs": "buccaneers",
+    "pats": "patriots",
+    "hawks": "seahawks",
+    "jags": "jaguars",
+    "fins": "dolphins",
+    "cards": "cardinals",
+}
+
+# Standard abbreviations, only matched as the whole pick (e.g. "KC", "k.c.")
+ABBREVIATIONS = {
+    "ari": "arizona-cardinals",
+    "atl": "atlanta-falcons",
+    "bal": "baltimore-ravens",
+    "buf": "buffalo-bills",
+    "car": "carolina-panthers",
+    "chi": "chicago-bears",
+    "cin": "cincinnati-bengals",
+    "cle": "cleveland-browns",
+    "dal": "dallas-cowboys",
+    "den": "denver-broncos",
+    "det": "detroit-lions",
+    "gb": "green-bay-packers",
+    "hou": "houston-texans",
+    "ind": "indianapolis-colts",
+    "jac": "jacksonville-jaguars",
+    "jax": "jacksonville-jaguars",
+    "kc": "kansas-city-chiefs",
+    "lac": "los-angeles-chargers",
+    "lar": "los-angeles-rams",
+    "lv": "las-vegas-raiders",
+    "lvr": "las-vegas-raiders",
+    "mia": "miami-dolphins",
+    "min": "minnesota-vikings",
+    "ne": "new-england-patriots",
+    "no": "new-orleans-saints",
+    "nyg": "new-york-giants",
+    "nyj": "new-york-jets",
+    "phi": "philadelphia-eagles",
+    "pit": "pittsburgh-steelers",
+    "sea": "seattle-seahawks",
+    "sf": "san-francisco-49ers",
+    "tb": "tampa-bay-buccaneers",
+    "ten": "tennessee-titans",
+    "was": "washington-commanders",
+    "wsh": "washington-commanders",
+}
+
+
+def _build_word_index() -> Dict[str, FrozenSet[TeamNameEnum]]:
+    """Map every word which identifies a team (from its name, or an alias) to the teams using it"""
+    index: Dict[str, set] = {}
+    for team in TeamNameEnum:
+        for word in set(team.value.split("-")) - IGNORE_WORDS:
+            index.setdefault(word, set()).add(team)
+    for alias, word in WORD_ALIASES.items():
+        index.setdefault(alias, set()).update(index[word])
+    return {word: frozenset(teams) for word, teams in index.items()}
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Edit distance between two strings (insertions, deletions and substitutions)
+
+    Args:
+        a (str): First string
+        b (str): Second string
+
+    Returns:
+        int: Minimum number of single-character edits to turn a into b
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b))
+            )
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    """Burkhard-Keller tree of words, for finding every word within an edit distance of a query
+    without comparing against each one
+    """
+
+    def __init__(self, words: Iterable[str]):
+        """
+        Args:
+            words (Iterable[str]): Words to index
+        """
+        self.root: Optional[Tuple[str, Dict[int, tuple]]] = None
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        """Add a word to the tree
+
+        Args:
+            word (str): The word
+        """
+        if self.root is None:
+            self.root = (word, {})
+            return
+        node = self.root
+        while True:
+            distance = levenshtein(word, node[0])
+            if distance == 0:
+                return
+            if distance not in node[1]:
+                node[1][distance] = (word, {})
+                return
+            node = node[1][distance]
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """Find every word within max_distance edits of the query
+
+        Args:
+            word (str): The query
+            max_distance (int): Maximum edit distance
+
+        Returns:
+            List[Tuple[int, str]]: (distance, word) pairs, nearest first
+        """
+        matches = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node_word, children = stack.pop()
+            distance = levenshtein(word, node_word)
+            if distance <= max_distance:
+                matches.append((distance, node_word))
+            for child_distance, child in children.items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+        return sorted(matches)
+
+
+_word_index = _build_word_index()
+_word_tree = BKTree(sorted(_word_index))
+_abbreviation_index = {abbrev: TeamNameEnum(name) for abbrev, name in ABBREVIATIONS.items()}
+
+
+def max_typo_distance(word: str) -> int:
+    """Number of typos tolerated in a word: none for very short words, 1 for short words and 2 for
+    longer ones (e.g. "Packres" for "Packers")"""
+    if len(word) < 4:
+        return 0
+    return 1 if len(word) <= 5 else 2
+
+
+@lru_cache(maxsize=4096)
+def _similar_words(word: str) -> List[Tuple[int, str]]:
+    """Known team words within the tolerated number of typos of an unknown word, nearest first"""
+    max_distance = max_typo_distance(word)
+    if max_distance == 0:
+        return []
+    return _word_tree.search(word, max_distance=max_distance)
+
+
+@lru_cache(maxsize=4096)
+def team_match_counts(text: str) -> Dict[TeamNameEnum, int]:
+    """Count how many words of a free-text team name (e.g. a player's pick) identify each team.
+    A whole-text abbreviation matches only its team. The result is cached, so it must not be
+    modified.
+
+    Args:
+        text (str): Free-text team name, e.g. "Saints", "new orleans", "KC" or "Niners"
+
+    Returns:
+        Dict[TeamNameEnum, int]: Number of matching words for every team with at least one
+    """
+    words = re.findall(r"[a-z0-9]+", text.lower())
+    abbrev_team = _abbreviation_index.get("".join(words))
+    if abbrev_team is not None:
+        return {abbrev_team: 1}
+    counts: Dict[TeamNameEnum, int] = {}
+    for word in words:
+        for team in _word_index.get(word, ()):
+            counts[team] = counts.get(team, 0) + 1
+    return counts
+
+
+def best_matching_teams(text: str) -> FrozenSet[TeamNameEnum]:
+    """The teams with the most matching words for a free-text team name
+
+    Args:
+        text (str): Free-text team name
+
+    Returns:
+        FrozenSet[TeamNameEnum]: The best matching teams. Empty if no team matches at all.
+    """
+    counts = team_match_counts(text)
+    if len(counts) == 0:
+        return frozenset()
+    top = max(counts.values())
+    return frozenset(team for team, count in counts.items() if count == top)
+
+
+def fuzzy_match_counts(text: str, candidates: FrozenSet[TeamNameEnum]) -> Dict[TeamNameEnum, int]:
+    """Like team_match_counts, but words which identify no team also count towards the candidates
+    with the nearest word within a few typos (see max_typo_distance)
+
+    Args:
+        text (str): Free-text team name, e.g. "Packres" or "Steelrs"
+        candidates (FrozenSet[TeamNameEnum]): Teams which typos may be matched to
+
+    Returns:
+        Dict[TeamNameEnum, int]: Number of matching words for every candidate with at least one
+    """
+    counts = {team: count for team, count in team_match_counts(text).items() if team in candidates}
+    for word in re.findall(r"[a-z0-9]+", text.lower()):
+        if word in _word_index:
+            continue
+        nearest = None
+        for distance, similar_word in _similar_words(word):
+            if nearest is not None and distance > nearest:
+                break
+            for team in _word_index[similar_word] & candidates:
+                nearest = distance
+                counts[team] = counts.get(team, 0) + 1
+    return counts
+
+
+def _unique_best(counts: Dict[TeamNameEnum, int]) -> Optional[TeamNameEnum]:
+    """The team with the most matching words, or None if there is no single one"""
+    if len(counts) == 0:
+        return None
+    top = max(counts.values())
+    best = [team for team, count in counts.items() if count == top]
+    return best[0] if len(best) == 1 else None
+
+
+@lru_cache(maxsize=4096)
+def _classify_pick(
+    pick: str, candidates: Optional[FrozenSet[TeamNameEnum]]
+) -> Optional[TeamNameEnum]:
+    counts = team_match_counts(pick)
+    if candidates is None:
+        return _unique_best(counts)
+    team = _unique_best({team: count for team, count in counts.items() if team in candidates})
+    if team is None:
+        team = _unique_best(fuzzy_match_counts(pick, candidates))
+        if team is not None:
+            logger.info(f"Matched pick '{pick}' to {team.value} allowing for typos")
+    return team
+
+
+def resolve_team(name: str) -> Optional[TeamNameEnum]:
+    """Resolve a free-text team name to a single team
+
+    Args:
+        name (str): Free-text team name
+
+    Returns:
+        Optional[TeamNameEnum]: The team, or None if no single team matches best
+    """
+    return _classify_pick(name, None)
+
+
+def classify_pick(pick: str, candidates: Optional[Iterable[str]] = None) -> Optional[TeamNameEnum]:
+    """Classify a player's free-text pick as one of the candidate teams. The candidate with the
+    most matching words wins, and ties are unresolved, so results never depend on candidate order.
+    If that does not settle it, words with a few typos (e.g. "Packres") also count towards the
+    candidates. Results are memoized.
+
+    Args:
+        pick (str): The player's pick, e.g. "Saints", "new orleans", "KC" or "Niners"
+        candidates (Optional[Iterable[str]], optional): Names of the candidate teams, e.g. the two
+            teams in a game. If None, every team is a candidate. Defaults to None.
+
+    Returns:
+        Optional[TeamNameEnum]: The picked team, or None if no single candidate matches best
+    """
+    if candidates is not None:
+        candidates = frozenset(team for team in map(resolve_team, candidates) if team is not None)
+    return _classify_pick(pick, candidates)
@@ -1,17 +1,110 @@
 import json
 import logging
 import os
+import threading
+import time
 import traceback
-from typing import Any, Callable, Dict, Set
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 import gspread
 import pandas as pd
+import requests
 import yaml
+from gspread.utils import (
+    ValueInputOption,
+    ValueRenderOption,
+    numericise,
+    rowcol_to_a1,
+)
 from loguru import logger
 from pydantic import BaseModel
-from tenacity import after_log, before_sleep_log, retry, wait_exponential
+from tenacity import (
+    after_log,
+    before_sleep_log,
+    retry,
+    retry_if_exception,
+    wait_exponential,
+)
 
 ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+SPREADSHEET_CACHE_TTL = 600  # Seconds to reuse an opened spreadsheet handle
+
+# Process-wide pool of authorized gspread clients (keyed by secret path) and opened spreadsheets
+# (keyed by secret path and sheet name)
+_clients: Dict[str, gspread.Client] = {}
+_spreadsheet_keys: Dict[Tuple[str, str], str] = {}
+_spreadsheets: Dict[Tuple[str, str], Tuple[gspread.Spreadsheet, float]] = {}
+_pool_lock = threading.Lock()
+
+
+class TokenBucket:
+    """Thread-safe token bucket for pacing API requests ahead of a per-minute quota. The bucket
+    holds up to `burst` tokens and refills at a rate which keeps any one-minute window, bursts
+    included, within `requests_per_minute`.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        burst: float = 10,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            requests_per_minute (float): Quota of requests per minute
+            burst (float, optional): Number of requests that may be sent back to back. Defaults
+                to 10.
+            clock (Callable[[], float], optional): Monotonic clock in seconds. Defaults to
+                time.monotonic.
+            sleep (Callable[[float], None], optional): Sleep function. Defaults to time.sleep.
+        """
+        if not 0 < burst < requests_per_minute:
+            raise ValueError(
+                f"Burst must be between 0 and requests_per_minute ({requests_per_minute}), "
+                f"got {burst}"
+            )
+        self.requests_per_minute = requests_per_minute
+        self.burst = burst
+        self.refill_per_second = (requests_per_minute - burst) / 60
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = burst
+        self._last_refill = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Take tokens from the bucket, sleeping until they are available. Tokens are reserved
+        before sleeping, so concurrent callers queue up in order.
+
+        Args:
+            tokens (float, optional): Number of tokens (requests) to take. Defaults to 1.
+
+        Returns:
+            float: Number of seconds spent waiting
+        """
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._last_refill
+            self._tokens = min(self.burst, self._tokens + elapsed * self.refill_per_second)
+            self._last_refill = now
+            self._tokens -= tokens
+            wait = max(0.0, -self._tokens / self.refill_per_second)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+# Shared limiters for every Google Sheets call in this module, modelling the per-user per-minute
+# read and write quotas of the Sheets API
+SHEETS_READ_REQUESTS_PER_MINUTE = 60
+SHEETS_WRITE_REQUESTS_PER_MINUTE = 60
+sheets_read_limiter = TokenBucket(requests_per_minute=SHEETS_READ_REQUESTS_PER_MINUTE)
+sheets_write_limiter = TokenBucket(requests_per_minute=SHEETS_WRITE_REQUESTS_PER_MINUTE)
 
 
 @retry(
@@ -28,6 +121,7 @@ def update_cell(ws: gspread.worksheet, row: int, col: int, value: Any) -> None:
         col (int): Column index to update
         value (Any): Value to insert
     """
+    sheets_write_limiter.acquire()
     ws.update_cell(row, col, value)
 
 
@@ -36,18 +130,352 @@ def update_cell(ws: gspread.worksheet, row: int, col: int, value: Any) -> None:
     before_sleep=before_sleep_log(logger, logging.INFO),
     after=after_log(logger, logging.INFO),
 )
-def open_sheet(gspread_secret_path: str, sheet_name: str) -> gspread.worksheet:
-    """Open the given spreadsheet object, with retries to avoid rate limiting and 500 errors
+def batch_update_cells(ws: gspread.worksheet, cells: Dict[Tuple[int, int], Any]) -> None:
+    """Update many cell values in a single request, with retries to avoid write rate limiting
+
+    Args:
+        ws (gspread.worksheet): gspread worksheet object
+        cells (Dict[Tuple[int, int], Any]): Map from (row, col) indices to the value to insert
+    """
+    data = [
+        {"range": rowcol_to_a1(row, col), "values": [[value]]}
+        for (row, col), value in cells.items()
+    ]
+    sheets_write_limiter.acquire()
+    ws.batch_update(data, value_input_option=ValueInputOption.user_entered)
+
+
+def is_retryable_error(e: BaseException) -> bool:
+    """Whether a failed Sheets call is worth retrying: rate limits, server errors and network
+    errors are, while client errors (e.g. a worksheet which already exists) and bad arguments are
+    not
+
+    Args:
+        e (BaseException): The raised exception
+
+    Returns:
+        bool: True if the call should be retried
+    """
+    if isinstance(e, gspread.exceptions.APIError):
+        status_code = e.response.status_code
+        return status_code == 429 or status_code >= 500
+    return isinstance(e, (requests.exceptions.RequestException, ConnectionError, TimeoutError))
+
+
+@retry(
+    wait=wait_exponential(max=90),
+    retry=retry_if_exception(is_retryable_error),
+    before_sleep=before_sleep_log(logger, logging.INFO),
+    after=after_log(logger, logging.INFO),
+)
+def batch_update_spreadsheet(sh: gspread.Spreadsheet, batch_requests: List[Dict]) -> None:
+    """Send a list of requests as a single spreadsheet batchUpdate, with retries to avoid write
+    rate limiting
+
+    Args:
+        sh (gspread.Spreadsheet): gspread spreadsheet object
+        batch_requests (List[Dict]): Sheets API requests (e.g. from nfl_commish.batch_requests)
+    """
+    sheets_write_limiter.acquire()
+    sh.batch_update({"requests": batch_requests})
+
+
+class WriteBuffer:
+    """Gather cell writes per worksheet and flush them as one batch update per worksheet. Later
+    writes to the same cell overwrite earlier ones.
+
+    Example:
+        buffer = WriteBuffer()
+        buffer.update_cell(ws, 2, 3, "value")
+        buffer.flush()
+    """
+
+    def __init__(self):
+        self._worksheets: Dict[Tuple[str, int], gspread.worksheet] = {}
+        self._cells: Dict[Tuple[str, int], Dict[Tuple[int, int], Any]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(cells) for cells in self._cells.values())
+
+    def update_cell(self, ws: gspread.worksheet, row: int, col: int, value: Any) -> None:
+        """Queue a cell value to be written on the next flush
+
+        Args:
+            ws (gspread.worksheet): gspread worksheet object
+            row (int): Row index to update
+            col (int): Column index to update
+            value (Any): Value to insert
+        """
+        key = (ws.spreadsheet_id, ws.id)
+        self._worksheets[key] = ws
+        self._cells.setdefault(key, {})[(row, col)] = value
+
+    def flush(self) -> None:
+        """Write all queued cells, one batch update (with retries) per worksheet. Inside a
+        worksheet_cache_scope, cells which already hold the queued value in the job's snapshot are
+        not sent.
+        """
+        cache = _worksheet_cache.get()
+        for key in list(self._cells):
+            ws = self._worksheets.pop(key)
+            cells = self._cells.pop(key)
+            if cache is not None:
+                n_queued = len(cells)
+                cells = cache.changed_cells(ws.spreadsheet.title, ws.title, cells)
+                if n_queued > len(cells):
+                    logger.info(
+                        f"Skipping {n_queued - len(cells)} unchanged cells in worksheet "
+                        f"'{ws.title}'"
+                    )
+            if not cells:
+                continue
+            batch_update_cells(ws, cells)
+            if cache is not None:
+                cache.update_cells(ws.spreadsheet.title, ws.title, cells)
+            logger.info(f"Wrote {len(cells)} cells to worksheet '{ws.title}'")
+
+
+@retry(
+    wait=wait_exponential(max=90),
+    before_sleep=before_sleep_log(logger, logging.INFO),
+    after=after_log(logger, logging.INFO),
+)
+def open_sheet(
+    gspread_secret_path: str, sheet_name: str, ttl: float = SPREADSHEET_CACHE_TTL
+) -> gspread.worksheet:
+    """Open the given spreadsheet object, with retries to avoid rate limiting and 500 errors.
+
+    Clients are authorized once per secret file and shared by the whole process, so their HTTP
+    sessions and tokens are reused. Opened spreadsheets are reused for `ttl` seconds, after which
+    they are re-opened by key rather than looked up by name again.
 
     Args:
         gspread_secret_path (str): Path to the spread secret file
         sheet_name (str): Google sheet name to open
+        ttl (float, optional): Seconds to reuse a previously opened spreadsheet. Defaults to
+            SPREADSHEET_CACHE_TTL.
 
     Returns:
         gspread.worksheet: Gspread workshet object
     """
-    gc = gspread.service_account(filename=gspread_secret_path)
-    return gc.open(sheet_name)
+    cache_key = (gspread_secret_path, sheet_name)
+    with _pool_lock:
+        cached = _spreadsheets.get(cache_key)
+        spreadsheet_key = _spreadsheet_keys.get(cache_key)
+    if cached is not None and time.monotonic() - cached[1] < ttl:
+        return cached[0]
+
+    # Re-open by key if we already know it, falling back to a lookup by name
+    gc = get_client(gspread_secret_path=gspread_secret_path)
+    sh = None
+    if spreadsheet_key is not None:
+        try:
+            sheets_read_limiter.acquire()
+            sh = gc.open_by_key(spreadsheet_key)
+        except gspread.SpreadsheetNotFound:
+            logger.info(f"Spreadsheet '{sheet_name}' no longer found by key - looking up by name")
+    if sh is None:
+        sheets_read_limiter.acquire()
+        sh = gc.open(sheet_name)
+
+    with _pool_lock:
+        _spreadsheet_keys[cache_key] = sh.id
+        _spreadsheets[cache_key] = (sh, time.monotonic())
+    return sh
+
+
+def get_client(gspread_secret_path: str) -> gspread.Client:
+    """Get the process-wide gspread client for the given secret file, authorizing it on first use
+
+    Args:
+        gspread_secret_path (str): Path to the spread secret file
+
+    Returns:
+        gspread.Client: Authorized gspread client
+    """
+    with _pool_lock:
+        if gspread_secret_path not in _clients:
+            _clients[gspread_secret_path] = gspread.service_account(filename=gspread_secret_path)
+        return _clients[gspread_secret_path]
+
+
+class WorksheetCache:
+    """Snapshots of worksheet contents and handles, keyed by (sheet name, worksheet name). Cell
+    writes flushed through a WriteBuffer are applied to the cached snapshots, so they stay valid
+    for the rest of the job.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        """
+        Args:
+            ttl (Optional[float], optional): Seconds a snapshot stays valid. If None, snapshots
+                are valid for the whole scope. Defaults to None.
+        """
+        self.ttl = ttl
+        self._snapshots: Dict[Tuple[str, str], Tuple[pd.DataFrame, float]] = {}
+        self._worksheets: Dict[Tuple[str, str], gspread.worksheet] = {}
+        self._lock = threading.Lock()
+
+    def get(self, sheet_name: str, worksheet_name: str) -> Optional[pd.DataFrame]:
+        """Get a copy of the cached worksheet snapshot, or None if missing or expired"""
+        with self._lock:
+            cached = self._snapshots.get((sheet_name, worksheet_name))
+            if cached is None:
+                return None
+            if self.ttl is not None and time.monotonic() - cached[1] >= self.ttl:
+                del self._snapshots[(sheet_name, worksheet_name)]
+                return None
+            return cached[0].copy()
+
+    def put(self, sheet_name: str, worksheet_name: str, df: pd.DataFrame) -> None:
+        """Store a snapshot of the worksheet contents"""
+        with self._lock:
+            self._snapshots[(sheet_name, worksheet_name)] = (df.copy(), time.monotonic())
+
+    def get_worksheet(self, sheet_name: str, worksheet_name: str) -> Optional[gspread.worksheet]:
+        """Get the cached worksheet handle, or None if missing"""
+        with self._lock:
+            return self._worksheets.get((sheet_name, worksheet_name))
+
+    def put_worksheet(self, sheet_name: str, ws: gspread.worksheet) -> None:
+        """Store a worksheet handle"""
+        with self._lock:
+            self._worksheets[(sheet_name, ws.title)] = ws
+
+    def changed_cells(
+        self, sheet_name: str, worksheet_name: str, cells: Dict[Tuple[int, int], Any]
+    ) -> Dict[Tuple[int, int], Any]:
+        """Compare cell values against the cached snapshot, keeping only those which differ. If
+        there is no snapshot, every cell is considered changed.
+
+        Args:
+            sheet_name (str): Google sheet name
+            worksheet_name (str): Name of the worksheet within the google sheet
+            cells (Dict[Tuple[int, int], Any]): Map from (row, col) indices to the target value
+
+        Returns:
+            Dict[Tuple[int, int], Any]: The subset of cells whose value differs from the snapshot
+        """
+        df = self.get(sheet_name, worksheet_name)
+        if df is None:
+            return dict(cells)
+        changed = {}
+        for (row, col), value in cells.items():
+            row_idx, col_idx = row - 2, col - 1  # Header is row 1, indices are 1-based
+            in_snapshot = 0 <= row_idx < len(df) and 0 <= col_idx < len(df.columns)
+            if not in_snapshot or not cell_values_equal(df.iat[row_idx, col_idx], value):
+                changed[(row, col)] = value
+        return changed
+
+    def update_cells(
+        self, sheet_name: str, worksheet_name: str, cells: Dict[Tuple[int, int], Any]
+    ) -> None:
+        """Apply written cell values to the cached snapshot. Writes outside the snapshot's records
+        (e.g. to the header row) drop the snapshot instead.
+
+        Args:
+            sheet_name (str): Google sheet name
+            worksheet_name (str): Name of the worksheet within the google sheet
+            cells (Dict[Tuple[int, int], Any]): Map from (row, col) indices to the written value
+        """
+        with self._lock:
+            cached = self._snapshots.get((sheet_name, worksheet_name))
+            if cached is None:
+                return
+            df = cached[0]
+            for (row, col), value in cells.items():
+                row_idx, col_idx = row - 2, col - 1  # Header is row 1, indices are 1-based
+                if not (0 <= row_idx < len(df) and 0 <= col_idx < len(df.columns)):
+                    del self._snapshots[(sheet_name, worksheet_name)]
+                    return
+                if df.dtypes.iloc[col_idx] != object:
+                    df.isetitem(col_idx, df.iloc[:, col_idx].astype(object))
+                df.iat[row_idx, col_idx] = value
+
+
+_worksheet_cache: ContextVar[Optional[WorksheetCache]] = ContextVar("worksheet_cache", default=None)
+
+
+@contextmanager
+def worksheet_cache_scope(ttl: Optional[float] = None) -> Iterator[WorksheetCache]:
+    """Cache worksheet reads for the duration of a job. Nested scopes share the outermost cache.
+    Can be used as a context manager or as a decorator on job functions.
+
+    Args:
+        ttl (Optional[float], optional): Seconds a snapshot stays valid. If None, snapshots are
+            valid for the whole scope. Defaults to None.
+
+    Yields:
+        WorksheetCache: The active worksheet cache
+    """
+    cache = _worksheet_cache.get()
+    if cache is not None:
+        yield cache
+        return
+    cache = WorksheetCache(ttl=ttl)
+    token = _worksheet_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _worksheet_cache.reset(token)
+
+
+@retry(
+    wait=wait_exponential(max=90),
+    before_sleep=before_sleep_log(logger, logging.INFO),
+    after=after_log(logger, logging.INFO),
+)
+def open_worksheet(
+    gspread_secret_path: str, sheet_name: str, worksheet_name: str
+) -> gspread.worksheet:
+    """Open a worksheet within the given spreadsheet, with retries to avoid rate limiting. Inside
+    a worksheet_cache_scope, the handle is reused for the rest of the job.
+
+    Args:
+        gspread_secret_path (str): Path to the spread secret file
+        sheet_name (str): Google sheet name to open
+        worksheet_name (str): Name of the worksheet within the google sheet
+
+    Returns:
+        gspread.worksheet: Gspread worksheet object
+    """
+    cache = _worksheet_cache.get()
+    if cache is not None:
+        ws = cache.get_worksheet(sheet_name, worksheet_name)
+        if ws is not None:
+            return ws
+    sh = open_sheet(
+        gspread_secret_path=gspread_secret_path,
+        sheet_name=sheet_name,
+    )
+    sheets_read_limiter.acquire()
+    ws = sh.worksheet(worksheet_name)
+    if cache is not None:
+        cache.put_worksheet(sheet_name, ws)
+    return ws
+
+
+@retry(
+    wait=wait_exponential(max=90),
+    before_sleep=before_sleep_log(logger, logging.INFO),
+    after=after_log(logger, logging.INFO),
+)
+def list_worksheet_names(gspread_secret_path: str, sheet_name: str) -> List[str]:
+    """List the names of a spreadsheet's worksheets, with retries to avoid rate limiting
+
+    Args:
+        gspread_secret_path (str): Path to the spread secret file
+        sheet_name (str): Google sheet name to open
+
+    Returns:
+        List[str]: Worksheet names, in tab order
+    """
+    sh = open_sheet(
+        gspread_secret_path=gspread_secret_path,
+        sheet_name=sheet_name,
+    )
+    sheets_read_limiter.acquire()
+    return [ws.title for ws in sh.worksheets()]
 
 
 @retry(
@@ -58,7 +486,8 @@ def open_sheet(gspread_secret_path: str, sheet_name: str) -> gspread.worksheet:
 def read_worksheet_as_df(
     gspread_secret_path: str, sheet_name: str, worksheet_name: str
 ) -> pd.DataFrame:
-    """Read a worksheet's contents into a pandas DataFrame, with retries to avoid rate limiting
+    """Read a worksheet's contents into a pandas DataFrame, with retries to avoid rate limiting.
+    Inside a worksheet_cache_scope, repeated reads are served from the job's snapshot.
 
     Args:
         gspread_secret_path (str): Path to the spread secret file
@@ -68,12 +497,144 @@ def read_worksheet_as_df(
     Returns:
         pd.DataFrame: A DataFrame containing the worksheet's content
     """
-    sh = open_sheet(
+    cache = _worksheet_cache.get()
+    if cache is not None:
+        df = cache.get(sheet_name, worksheet_name)
+        if df is not None:
+            return df
+    ws = open_worksheet(
         gspread_secret_path=gspread_secret_path,
         sheet_name=sheet_name,
+        worksheet_name=worksheet_name,
     )
-    ws = sh.worksheet(worksheet_name)
-    return pd.DataFrame(ws.get_all_records())
+    sheets_read_limiter.acquire()
+    df = pd.DataFrame(ws.get_all_records(value_render_option=ValueRenderOption.formatted))
+    if cache is not None:
+        cache.put(sheet_name, worksheet_name, df)
+    return df
+
+
+@retry(
+    wait=wait_exponential(max=90),
+    retry=retry_if_exception(is_retryable_error),
+    before_sleep=before_sleep_log(logger, logging.INFO),
+    after=after_log(logger, logging.INFO),
+)
+def read_columns(ws: gspread.worksheet, columns: List[str]) -> pd.DataFrame:
+    """Read only the given columns of a worksheet, with retries to avoid rate limiting. Values are
+    read formatted and then numericised, just like get_all_records, so they match a full read of
+    the worksheet (e.g. from the job's snapshot).
+
+    Args:
+        ws (gspread.worksheet): gspread worksheet object
+        columns (List[str]): Header names of the columns to read
+
+    Returns:
+        pd.DataFrame: A DataFrame with one column per requested header, padded with empty strings
+            to the length of the longest column
+    """
+    # Find the requested columns in the header row
+    sheets_read_limiter.acquire()
+    header = ws.row_values(1)
+    missing = [col for col in columns if col not in header]
+    if missing:
+        raise ValueError(f"Columns {missing} not found in worksheet '{ws.title}' header {header}")
+    letters = [rowcol_to_a1(1, header.index(col) + 1)[:-1] for col in columns]
+
+    # Read all of the columns in one request
+    sheets_read_limiter.acquire()
+    value_ranges = ws.batch_get(
+        [f"{letter}2:{letter}" for letter in letters],
+        value_render_option=ValueRenderOption.formatted,
+    )
+    values = [
+        [numericise(row[0]) if row else "" for row in value_range] for value_range in value_ranges
+    ]
+    n_rows = max([len(col_values) for col_values in values], default=0)
+    return pd.DataFrame(
+        {
+            col: col_values + [""] * (n_rows - len(col_values))
+            for col, col_values in zip(columns, values)
+        }
+    )
+
+
+def read_worksheet_columns(
+    gspread_secret_path: str, sheet_name: str, worksheet_name: str, columns: List[str]
+) -> pd.DataFrame:
+    """Read only the given columns of a worksheet. Inside a worksheet_cache_scope, the columns are
+    taken from the job's snapshot if the whole worksheet has already been read.
+
+    Args:
+        gspread_secret_path (str): Path to the spread secret file
+        sheet_name (str): Google sheet name to open
+        worksheet_name (str): Name of the worksheet within the google sheet
+        columns (List[str]): Header names of the columns to read
+
+    Returns:
+        pd.DataFrame: A DataFrame containing only the requested columns
+    """
+    cache = _worksheet_cache.get()
+    if cache is not None:
+        df = cache.get(sheet_name, worksheet_name)
+        if df is not None:
+            return df[columns]
+    ws = open_worksheet(
+        gspread_secret_path=gspread_secret_path,
+        sheet_name=sheet_name,
+        worksheet_name=worksheet_name,
+    )
+    return read_columns(ws, columns)
+
+
+def read_worksheets_as_dfs(
+    gspread_secret_path: str, sheet_names: List[str], worksheet_name: str, max_workers: int = 8
+) -> Dict[str, pd.DataFrame]:
+    """Read the same worksheet from many spreadsheets concurrently, using a bounded thread pool.
+    Reads share the calling job's worksheet cache scope, if any.
+
+    Args:
+        gspread_secret_path (str): Path to the spread secret file
+        sheet_names (List[str]): Google sheet names to open
+        worksheet_name (str): Name of the worksheet within each google sheet
+        max_workers (int, optional): Maximum number of concurrent reads. Defaults to 8.
+
+    Returns:
+        Dict[str, pd.DataFrame]: Map from sheet name to a DataFrame of the worksheet's content
+    """
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(sheet_names)))) as executor:
+        futures = {
+            sheet_name: executor.submit(
+                copy_context().run,
+                read_worksheet_as_df,
+                gspread_secret_path=gspread_secret_path,
+                sheet_name=sheet_name,
+                worksheet_name=worksheet_name,
+            )
+            for sheet_name in sheet_names
+        }
+        return {sheet_name: future.result() for sheet_name, future in futures.items()}
+
+
+def cell_values_equal(existing: Any, new: Any) -> bool:
+    """Whether a value read from a worksheet matches a value about to be written. Empty values
+    (None, "" or NaN) match each other and numbers are compared by value (e.g. 16 == "16.0").
+
+    Args:
+        existing (Any): Value read from the worksheet
+        new (Any): Value to be written
+
+    Returns:
+        bool: True if writing the new value would not change the cell
+    """
+    existing_empty = existing is None or existing == "" or pd.isna(existing)
+    new_empty = new is None or new == "" or pd.isna(new)
+    if existing_empty or new_empty:
+        return existing_empty and new_empty
+    try:
+        return float(existing) == float(new)
+    except (TypeError, ValueError):
+        return str(existing) == str(new)
 
 
 def read_config(config_path: str, config_class: BaseModel) -> BaseModel:
@@ -105,6 +666,7 @@ def get_valid_team_names() -> Set[str]:
     return set(name_map)
 
 
+@lru_cache(maxsize=1024)
 def convert_team_name(name: str) -> str:
     """Convert The Odds team name to standardized valid team name
 
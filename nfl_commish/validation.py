@@ -0,0 +1,161 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+from pydantic import BaseModel
+
+from nfl_commish.teams import classify_pick
+
+MAX_CONFIDENCE = 16
+PICK_COLUMNS = ["Game ID", "Home Team", "Away Team", "Predicted Winner", "Confidence Rank"]
+
+
+class PlayerPickReport(BaseModel):
+    player_name: str
+    missing_columns: List[str] = []  # Sheet columns needed to read the picks (e.g. empty sheet)
+    missing_game_ids: List[str] = []  # No pick or no confidence
+    unknown_team_game_ids: List[str] = []  # Pick is neither of the game's teams
+    invalid_confidence_game_ids: List[str] = []  # Confidence is not a whole number
+    out_of_range_game_ids: List[str] = []  # Confidence is outside 17 - n to 16
+    duplicate_ranks: List[int] = []  # Confidences used for more than one game
+    missing_ranks: List[int] = []  # Confidences from 17 - n to 16 not used for any game
+
+    @property
+    def is_valid(self) -> bool:
+        return not any(
+            [
+                self.missing_columns,
+                self.missing_game_ids,
+                self.unknown_team_game_ids,
+                self.invalid_confidence_game_ids,
+                self.out_of_range_game_ids,
+                self.duplicate_ranks,
+                self.missing_ranks,
+            ]
+        )
+
+
+class WeekPickReport(BaseModel):
+    n_games: int
+    min_rank: int
+    players: Dict[str, PlayerPickReport]
+
+    @property
+    def is_valid(self) -> bool:
+        return all(report.is_valid for report in self.players.values())
+
+    @property
+    def invalid_players(self) -> List[str]:
+        return [name for name, report in self.players.items() if not report.is_valid]
+
+    def log(self) -> None:
+        """Log a warning for each player with invalid picks"""
+        for name in self.invalid_players:
+            problems = self.players[name].model_dump(exclude={"player_name"}, exclude_defaults=True)
+            logger.warning(f"Player {name} has invalid picks: {problems}")
+        if self.is_valid:
+            logger.info(f"All picks valid for {len(self.players)} players and {self.n_games} games")
+
+
+def validate_week_picks(
+    user_dfs: Dict[str, pd.DataFrame],
+    game_ids: List[str],
+    required_game_ids: Optional[List[str]] = None,
+) -> WeekPickReport:
+    """Check every player's picks for a week at once: each game must have a pick of one of its two
+    teams, and confidences must be unique whole numbers from 17 - n to 16, for n games
+
+    Args:
+        user_dfs (Dict[str, pd.DataFrame]): Each player's week sheet, with "Game ID", "Home Team",
+            "Away Team", "Predicted Winner" and "Confidence Rank" columns
+        game_ids (List[str]): IDs of every game in the week
+        required_game_ids (Optional[List[str]], optional): Only report missing picks for these
+            games (e.g. the games about to be locked), and only report unused ranks if these are
+            every game. If None, every game needs a pick. Defaults to None.
+
+    Returns:
+        WeekPickReport: Problems found for each player
+    """
+    n_games = len(game_ids)
+    min_rank = MAX_CONFIDENCE + 1 - n_games
+    ids = np.array(game_ids, dtype=object)
+    required = np.isin(ids, game_ids if required_game_ids is None else required_game_ids)
+
+    all_player_names = list(user_dfs)
+
+    # Sheets without the pick columns cannot be checked - every required pick is missing
+    unreadable = {
+        name: PlayerPickReport(
+            player_name=name,
+            missing_columns=[col for col in PICK_COLUMNS if col not in user_df.columns],
+            missing_game_ids=ids[required].tolist(),
+        )
+        for name, user_df in user_dfs.items()
+        if not set(PICK_COLUMNS).issubset(user_df.columns)
+    }
+    user_dfs = {name: user_df for name, user_df in user_dfs.items() if name not in unreadable}
+    player_names = list(user_dfs)
+
+    # Align every player's picks with the week's games, as players x games matrices
+    aligned = {
+        name: user_df.drop_duplicates("Game ID").set_index("Game ID").reindex(game_ids)
+        for name, user_df in user_dfs.items()
+    }
+    raw_confs = np.array(
+        [aligned[name]["Confidence Rank"].to_numpy(dtype=object) for name in player_names],
+        dtype=object,
+    ).reshape(len(player_names), n_games)
+    preds = np.array(
+        [aligned[name]["Predicted Winner"].to_numpy(dtype=object) for name in player_names],
+        dtype=object,
+    ).reshape(len(player_names), n_games)
+    confs = pd.to_numeric(pd.Series(raw_confs.ravel()), errors="coerce").to_numpy(dtype=float)
+    confs = confs.reshape(raw_confs.shape)
+
+    # Vectorized confidence checks
+    is_blank = pd.isna(preds) | (preds == "") | pd.isna(raw_confs) | (raw_confs == "")
+    is_whole = ~np.isnan(confs) & (confs == np.round(confs))
+    is_invalid = ~is_blank & ~is_whole
+    in_range = is_whole & (confs >= min_rank) & (confs <= MAX_CONFIDENCE)
+    is_out_of_range = ~is_blank & is_whole & ~in_range
+
+    # Count how often each rank is used, per player
+    rank_counts = np.zeros((len(player_names), MAX_CONFIDENCE + 1), dtype=np.int64)
+    player_idx, game_idx = np.nonzero(in_range & ~is_blank)
+    np.add.at(rank_counts, (player_idx, confs[player_idx, game_idx].astype(np.int64)), 1)
+    ranks = np.arange(MAX_CONFIDENCE + 1)
+    is_duplicate = rank_counts > 1
+    is_missing_rank = (rank_counts == 0) & (ranks >= max(min_rank, 1))[np.newaxis, :]
+
+    # Unused ranks are only a problem once every game needs a pick, not at a partial lock
+    is_missing_rank &= required.all()
+
+    # Picks must be one of the game's two teams
+    is_unknown_team = np.zeros(preds.shape, dtype=bool)
+    for i, name in enumerate(player_names):
+        teams = aligned[name][["Home Team", "Away Team"]].to_numpy(dtype=object)
+        for j in np.flatnonzero(~is_blank[i]):
+            candidates = tuple(str(team) for team in teams[j] if not pd.isna(team))
+            is_unknown_team[i, j] = (
+                classify_pick(pick=str(preds[i, j]), candidates=candidates) is None
+            )
+
+    reports = {
+        name: PlayerPickReport(
+            player_name=name,
+            missing_game_ids=ids[is_blank[i] & required].tolist(),
+            unknown_team_game_ids=ids[is_unknown_team[i]].tolist(),
+            invalid_confidence_game_ids=ids[is_invalid[i]].tolist(),
+            out_of_range_game_ids=ids[is_out_of_range[i]].tolist(),
+            duplicate_ranks=ranks[is_duplicate[i]].tolist(),
+            missing_ranks=ranks[is_missing_rank[i]].tolist(),
+        )
+        for i, name in enumerate(player_names)
+    }
+    reports.update(unreadable)
+    return WeekPickReport(
+        n_games=n_games,
+        min_rank=min_rank,
+        players={name: reports[name] for name in all_player_names},
+    )
@@ -0,0 +1,93 @@
+"""Benchmark parsing the-odds JSON into Game objects and accessing their derived fields, using the
+272-game fixtures in tests/assets. The current nfl_commish.game is compared against its version at
+a baseline git ref (by default, before the bulk parse and cached derived fields).
+
+Usage, from the repo root:
+    python -m scripts.benchmark_parse --n_repeats 20
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import timeit
+from types import ModuleType
+
+from nfl_commish import game as current_game
+from nfl_commish.utils import convert_team_name
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_DIR = os.path.join(REPO_DIR, "tests", "assets")
+BASELINE_REF = "8053dd3^"  # Before the bulk parse and cached derived fields
+
+
+def load_baseline_game(ref: str) -> ModuleType:
+    """Load nfl_commish/game.py as it was at the given git ref, as a separate module. Team names
+    are converted without the memoization added alongside the bulk parse.
+
+    Args:
+        ref (str): Git ref of the baseline
+
+    Returns:
+        ModuleType: The baseline game module
+    """
+    source = subprocess.run(
+        ["git", "show", f"{ref}:nfl_commish/game.py"],
+        cwd=REPO_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    spec = importlib.util.spec_from_loader("baseline_game", loader=None)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    exec(compile(source, f"{ref}:nfl_commish/game.py", "exec"), module.__dict__)
+    module.convert_team_name = convert_team_name.__wrapped__
+    return module
+
+
+def access_derived_fields(games):
+    for game in games:
+        game.local_date, game.local_time, game.local_commence_time, game.winner
+
+
+def main(n_repeats: int, baseline_ref: str):
+    baseline_game = load_baseline_game(baseline_ref)
+    for endpoint in ["events", "scores"]:
+        with open(os.path.join(ASSETS_DIR, f"{endpoint}.json"), "r") as f:
+            the_odds_json = json.load(f)
+
+        # Parsing, baseline vs current
+        before = timeit.timeit(
+            lambda: baseline_game.parse_the_odds_json(the_odds_json), number=n_repeats
+        )
+        after = timeit.timeit(
+            lambda: current_game.parse_the_odds_json(the_odds_json), number=n_repeats
+        )
+        print(
+            f"{endpoint}: parse {len(the_odds_json)} games - baseline "
+            f"{1000 * before / n_repeats:.2f} ms, current {1000 * after / n_repeats:.2f} ms "
+            f"({before / after:.2f}x)"
+        )
+
+        # Derived fields, baseline vs current on first access and on repeated access
+        for name, module in [("baseline", baseline_game), ("current", current_game)]:
+            games = module.parse_the_odds_json(the_odds_json)
+            first = timeit.timeit(lambda: access_derived_fields(games), number=1)
+            repeated = timeit.timeit(lambda: access_derived_fields(games), number=n_repeats)
+            print(
+                f"{endpoint}: derived fields, {name} - first access {1000 * first:.2f} ms, "
+                f"repeated access {1000 * repeated / n_repeats:.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n_repeats", type=int, default=20, help="Number of timed repeats")
+    parser.add_argument(
+        "--baseline_ref", type=str, default=BASELINE_REF, help="Git ref to compare against"
+    )
+    args = parser.parse_args()
+    main(n_repeats=args.n_repeats, baseline_ref=args.baseline_ref)
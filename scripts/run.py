@@ -17,22 +17,28 @@ player_names = [
 admin_sheet_name = "NFL Confidence '24-'25"
 settings = Settings()
 
-# Create a scheduler
-scheduler = BackgroundScheduler()
-scheduler.start()
+# Guarded, as spawned worker processes (e.g. for the league simulation) re-import this module
+if __name__ == "__main__":
+    # Create a scheduler
+    scheduler = BackgroundScheduler()
+    scheduler.start()
 
-# Schedule the commish tasks
-schedule_commish_tasks(
-    scheduler=scheduler,
-    admin_sheet_name=admin_sheet_name,
-    player_names=player_names,
-    gspread_secret_path=settings.google_sheets_secret_path,
-    the_odds_api_key=settings.the_odds_api_key.get_secret_value(),
-    copy_timedelta=settings.copy_timedelta,
-    scoring_timedelta=settings.scoring_timedelta,
-    max_weeks=settings.max_weeks,
-)
+    # Schedule the commish tasks
+    schedule_commish_tasks(
+        scheduler=scheduler,
+        admin_sheet_name=admin_sheet_name,
+        player_names=player_names,
+        gspread_secret_path=settings.google_sheets_secret_path,
+        the_odds_api_key=settings.the_odds_api_key.get_secret_value(),
+        copy_timedelta=settings.copy_timedelta,
+        scoring_timedelta=settings.scoring_timedelta,
+        max_weeks=settings.max_weeks,
+        the_odds_budget_path=settings.the_odds_budget_path,
+        adaptive_scoring=settings.adaptive_scoring,
+        expected_game_duration=settings.expected_game_duration,
+        overtime_poll_interval=settings.overtime_poll_interval,
+    )
 
-# Wait for all jobs to complete
-while True:
-    time.sleep(1)
+    # Wait for all jobs to complete
+    while True:
+        time.sleep(1)
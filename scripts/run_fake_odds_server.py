@@ -0,0 +1,28 @@
+import argparse
+import time
+
+from nfl_commish.fake_odds_server import FakeOddsApiServer
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Serve the-odds API events and scores endpoints from fixture files. Point the "
+        "pipelines at it with THE_ODDS_BASE_URL=http://<host>:<port>"
+    )
+    parser.add_argument("--events_path", type=str, default="tests/assets/events.json")
+    parser.add_argument("--scores_path", type=str, default="tests/assets/scores.json")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--quota", type=int, default=500, help="Monthly request quota")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per response")
+    parser.add_argument(
+        "--error_rate", type=float, default=0.0, help="Fraction of requests answered with an error"
+    )
+    parser.add_argument(
+        "--error_status", type=int, default=500, help="Status of injected errors, e.g. 429 or 503"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the injected errors")
+    args = parser.parse_args()
+
+    with FakeOddsApiServer(**vars(args)):
+        while True:
+            time.sleep(1)
@@ -3,6 +3,12 @@ import os
 
 import pytest
 
+from nfl_commish.utils import TokenBucket
+
+# Settings needed to import the admin and scheduling modules
+os.environ.setdefault("THE_ODDS_API_KEY", "test-key")
+os.environ.setdefault("GOOGLE_SHEETS_SECRET_PATH", "test-secret.json")
+
 
 @pytest.fixture
 def the_odds_scores_file_path():
@@ -28,3 +34,11 @@ def the_odds_scores_resp_json(the_odds_scores_file_path):
 def the_odds_events_resp_json(the_odds_events_file_path):
     with open(the_odds_events_file_path, "r") as f:
         return json.load(f)
+
+
+@pytest.fixture(autouse=True)
+def no_sheets_rate_limit(mocker):
+    """Keep the shared Sheets rate limiters from sleeping during tests"""
+    for name in ["sheets_read_limiter", "sheets_write_limiter"]:
+        bucket = TokenBucket(requests_per_minute=60, sleep=lambda _: None)
+        mocker.patch(f"nfl_commish.utils.{name}", bucket)
@@ -0,0 +1,147 @@
+from datetime import datetime
+
+import pandas as pd
+
+from nfl_commish import admin, utils
+from nfl_commish.admin import InitStatus, init_week, try_init_sheet_week
+from nfl_commish.game import get_this_weeks_games, parse_the_odds_json
+
+GAME_IDS = ["a", "b"]
+TEAMS = [("kansas-city-chiefs", "baltimore-ravens"), ("philadelphia-eagles", "green-bay-packers")]
+
+
+def admin_df(player_names):
+    df = pd.DataFrame({"Game ID": GAME_IDS, "Winner": ""})
+    for name in player_names:
+        df[f"{name} Predicted"] = ""
+        df[f"{name} Confidence"] = ""
+        df[f"{name} Points"] = ""
+    return df
+
+
+def user_df(picks, confidences):
+    return pd.DataFrame(
+        {
+            "Game ID": GAME_IDS,
+            "Home Team": [home for home, _ in TEAMS],
+            "Away Team": [away for _, away in TEAMS],
+            "Predicted Winner": picks,
+            "Confidence Rank": confidences,
+        }
+    )
+
+
+def test_copy_predictions_to_admin_with_unreadable_sheet(mocker):
+    # Andrew's sheet is header-only - Luke's picks must still be locked in
+    mocker.patch("nfl_commish.admin.open_worksheet")
+    mocker.patch(
+        "nfl_commish.admin.read_worksheet_as_df", return_value=admin_df(["Luke", "Andrew"])
+    )
+    mocker.patch(
+        "nfl_commish.admin.read_worksheets_as_dfs",
+        return_value={
+            "Luke NFL Confidence '24-'25": user_df(["Chiefs", "Eagles"], [16, 15]),
+            "Andrew NFL Confidence '24-'25": pd.DataFrame([]),
+        },
+    )
+    mocker.patch("nfl_commish.admin.validate_week_picks", side_effect=KeyError("Game ID"))
+    buffer = mocker.patch("nfl_commish.admin.WriteBuffer").return_value
+
+    admin.copy_predictions_to_admin(
+        week_number=1,
+        admin_sheet_name="Admin",
+        player_names=["Luke", "Andrew"],
+        gspread_secret_path="secret.json",
+    )
+    values = [call.args[1:] for call in buffer.update_cell.call_args_list]
+    assert values == [
+        (2, 3, "kansas-city-chiefs"),
+        (2, 4, 16),
+        (3, 3, "philadelphia-eagles"),
+        (3, 4, 15),
+    ]
+    buffer.flush.assert_called_once()
+
+
+def test_try_init_sheet_week(mocker):
+    init_fn = mocker.Mock()
+    assert try_init_sheet_week(init_fn, "Admin", week_number=3, foo="bar") == InitStatus.SUCCESS
+    init_fn.assert_called_once_with(week_number=3, foo="bar")
+
+    # The week's worksheet already exists - skip the workbook
+    init_fn.side_effect = Exception('A sheet with the name "Week 3" already exists.')
+    assert try_init_sheet_week(init_fn, "Admin", week_number=3) == InitStatus.SKIPPED
+
+    # Any other failure is logged, not raised
+    init_fn.side_effect = Exception("Quota exceeded")
+    assert try_init_sheet_week(init_fn, "Admin", week_number=3) == InitStatus.FAILED
+
+
+def test_init_week_summary(the_odds_events_resp_json, mocker):
+    wednesday = datetime.fromisoformat("2024-09-04 20:06:00+00:00")
+    mocker.patch("nfl_commish.game.datetime").now.return_value = wednesday
+    games = parse_the_odds_json(the_odds_events_resp_json)
+    this_weeks_games = get_this_weeks_games(games=games)
+    mocker.patch("nfl_commish.admin.get_season_games", return_value=games)
+    mocker.patch("nfl_commish.admin.sync_league_state")
+    init_admin_week = mocker.patch("nfl_commish.admin.init_admin_week")
+
+    def init_user_week(week_number, user_sheet_name, **kwargs):
+        if user_sheet_name.startswith("Andrew"):
+            raise Exception(f'A sheet with the name "Week {week_number}" already exists.')
+        if user_sheet_name.startswith("Shivam"):
+            raise Exception("Quota exceeded")
+
+    init_user_week = mocker.patch("nfl_commish.admin.init_user_week", side_effect=init_user_week)
+    logger = mocker.patch("nfl_commish.admin.logger")
+
+    assert (
+        init_week(
+            week_number=3,
+            admin_sheet_name="Admin",
+            player_names=["Luke", "Andrew", "Shivam"],
+            gspread_secret_path="secret.json",
+            the_odds_api_key="key",
+        )
+        == this_weeks_games
+    )
+    init_admin_week.assert_called_once()
+    assert init_admin_week.call_args.kwargs["this_weeks_games"] == this_weeks_games
+    assert init_user_week.call_count == 3
+
+    # One line per workbook, with the count of each result
+    summary = [
+        call.args[0] for call in logger.info.call_args_list if "Initialized week" in call.args[0]
+    ]
+    assert summary == [
+        "Initialized week 3 - {'success': 2, 'skipped': 1, 'failed': 1}:\n"
+        "Admin: success\n"
+        "Luke NFL Confidence '24-'25: success\n"
+        "Andrew NFL Confidence '24-'25: skipped\n"
+        "Shivam NFL Confidence '24-'25: failed"
+    ]
+
+
+def test_get_current_week_num_paced(mocker):
+    # Listing the worksheets and opening the week both go through the shared read limiter
+    mocker.patch.object(admin.settings, "league_state_path", None)
+    sh = mocker.MagicMock()
+    sh.worksheets.return_value = [mocker.MagicMock(title=title) for title in ["Week 1", "Week 2"]]
+    sh.worksheet.return_value.row_values.return_value = ["Game ID", "Winner"]
+    sh.worksheet.return_value.batch_get.return_value = [[["a"], ["b"]], [["chiefs"], ["eagles"]]]
+    mocker.patch("nfl_commish.utils.open_sheet", return_value=sh)
+    acquire = mocker.spy(utils.sheets_read_limiter, "acquire")
+    week_number = admin.get_current_week_num(admin_sheet_name="Admin", gspread_secret_path="")
+    assert week_number == 3
+    sh.worksheet.assert_called_once_with("Week 2")
+    assert acquire.call_count == 4  # Worksheet list, worksheet, header row and columns
+
+
+def test_the_odds_calls_per_score_poll(mocker):
+    mocker.patch.object(admin.settings, "simulation_trials", 0)
+    mocker.patch.object(admin.settings, "simulation_use_odds", True)
+    assert admin.the_odds_calls_per_score_poll() == 1
+    mocker.patch.object(admin.settings, "simulation_trials", 1000)
+    assert admin.the_odds_calls_per_score_poll() == 2
+    mocker.patch.object(admin.settings, "simulation_use_odds", False)
+    assert admin.the_odds_calls_per_score_poll() == 1
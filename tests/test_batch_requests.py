@@ -0,0 +1,52 @@
+from nfl_commish.batch_requests import (
+    format_request,
+    grid_range,
+    sheet_id_for_title,
+    update_values_request,
+)
+
+
+def test_sheet_id_for_title():
+    assert sheet_id_for_title("Week 1") == sheet_id_for_title("Week 1")
+    assert sheet_id_for_title("Week 1") != sheet_id_for_title("Week 2")
+    assert 0 <= sheet_id_for_title("Week 1") < 2**31
+
+
+def test_grid_range():
+    assert grid_range(7, "A1:H1") == {
+        "sheetId": 7,
+        "startRowIndex": 0,
+        "endRowIndex": 1,
+        "startColumnIndex": 0,
+        "endColumnIndex": 8,
+    }
+    assert grid_range(7, "1:1") == {"sheetId": 7, "startRowIndex": 0, "endRowIndex": 1}
+    assert grid_range(7, "G2:G") == {
+        "sheetId": 7,
+        "startRowIndex": 1,
+        "startColumnIndex": 6,
+        "endColumnIndex": 7,
+    }
+    assert grid_range(7, "G1") == {
+        "sheetId": 7,
+        "startRowIndex": 0,
+        "endRowIndex": 1,
+        "startColumnIndex": 6,
+        "endColumnIndex": 7,
+    }
+
+
+def test_update_values_request():
+    request = update_values_request(7, [["Game ID", "Winner"], ["abc", None], ["def", 16]])
+    rows = request["updateCells"]["rows"]
+    assert rows[0]["values"][0] == {"userEnteredValue": {"stringValue": "Game ID"}}
+    assert rows[1]["values"][1] == {"userEnteredValue": {}}
+    assert rows[2]["values"][1] == {"userEnteredValue": {"numberValue": 16}}
+    assert request["updateCells"]["start"] == {"sheetId": 7, "rowIndex": 0, "columnIndex": 0}
+
+
+def test_format_request():
+    request = format_request(7, "1:1", {"textFormat": {"bold": True}, "borders": {}})
+    assert (
+        request["repeatCell"]["fields"] == "userEnteredFormat.textFormat,userEnteredFormat.borders"
+    )
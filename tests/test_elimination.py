@@ -0,0 +1,101 @@
+import itertools
+
+import numpy as np
+
+from nfl_commish.elimination import (
+    _race_status,
+    outcome_points,
+    race_status,
+    remaining_week_max_points,
+)
+from nfl_commish.game import parse_the_odds_json
+from nfl_commish.game_table import NO_TEAM, TEAM_CODES
+
+
+def team_codes(games):
+    home = np.array([TEAM_CODES[game.home_team.value] for game in games], dtype=np.int16)
+    away = np.array([TEAM_CODES[game.away_team.value] for game in games], dtype=np.int16)
+    return home, away
+
+
+def test_remaining_week_max_points():
+    assert remaining_week_max_points(n_games=16) == 136
+    assert remaining_week_max_points(n_games=14) == sum(range(3, 17))
+    assert remaining_week_max_points(n_games=16, used_ranks=[16, 15], n_open=2) == 14 + 13
+    assert remaining_week_max_points(n_games=16, used_ranks=range(1, 17), n_open=0) == 0
+
+
+def test_race_status_clinch(the_odds_scores_resp_json):
+    games = parse_the_odds_json(the_odds_scores_resp_json)[:1]
+    home, away = team_codes(games)
+    picks = np.array([[home[0]], [away[0]]])
+
+    # Luke is 10 ahead, and Andrew can only gain 5
+    status = race_status(["Luke", "Andrew"], [10, 0], games, picks, np.array([[5], [5]]))
+    assert status.clinched == ["Luke"]
+    assert status.eliminated == ["Andrew"]
+    assert status.alive == []
+
+    # Andrew can still catch up with a correct 16, or with points from later games
+    status = race_status(["Luke", "Andrew"], [10, 0], games, picks, np.array([[16], [16]]))
+    assert status.clinched == [] and status.eliminated == []
+    status = race_status(
+        ["Luke", "Andrew"], [10, 0], games, picks, np.array([[5], [5]]), max_extra_points=[0, 6]
+    )
+    assert status.clinched == [] and status.eliminated == []
+
+
+def test_race_status_needs_a_single_outcome(the_odds_scores_resp_json):
+    # Shivam can tie Luke if the away team wins, or Andrew if the home team wins, but not both
+    games = parse_the_odds_json(the_odds_scores_resp_json)[:1]
+    home, away = team_codes(games)
+    picks = np.array([[home[0]], [away[0]], [NO_TEAM]])
+    status = race_status(
+        ["Luke", "Andrew", "Shivam"], [0, 0, 0], games, picks, np.array([[5], [5], [0]])
+    )
+    assert status.eliminated == ["Shivam"]
+    assert status.alive == ["Luke", "Andrew"]
+
+
+def test_race_status_matches_enumeration(the_odds_scores_resp_json):
+    all_games = parse_the_odds_json(the_odds_scores_resp_json)
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        n_games, n_players = rng.integers(1, 8), rng.integers(2, 6)
+        games = all_games[:n_games]
+        home, away = team_codes(games)
+        picks = np.where(rng.random((n_players, n_games)) < 0.5, home, away).astype(np.int16)
+        picks[rng.random(picks.shape) < 0.1] = NO_TEAM
+        confidences = np.array(
+            [rng.permutation(np.arange(17 - n_games, 17)) for _ in range(n_players)]
+        )
+        current = rng.integers(0, 40, n_players)
+        extra = rng.integers(0, 10, n_players)
+        names = [f"Player {i}" for i in range(n_players)]
+        status = race_status(names, current, games, picks, confidences, max_extra_points=extra)
+
+        # Check every outcome, with the most extra points for the player and none for the others
+        home_points, away_points = outcome_points(games, picks, confidences)
+        totals = [
+            current + np.where(np.array(outcome), home_points, away_points).sum(axis=1)
+            for outcome in itertools.product([True, False], repeat=n_games)
+        ]
+        for i, name in enumerate(names):
+            can_win = any((total[i] + extra[i] >= np.delete(total, i)).all() for total in totals)
+            clinched = all((total[i] >= np.delete(total + extra, i)).all() for total in totals)
+            assert (name not in status.eliminated) == can_win
+            assert (name in status.clinched) == clinched
+
+
+def test_race_status_cached(the_odds_scores_resp_json):
+    games = parse_the_odds_json(the_odds_scores_resp_json)[:16]
+    home, away = team_codes(games)
+    rng = np.random.default_rng(1)
+    picks = np.where(rng.random((12, 16)) < 0.5, home, away).astype(np.int16)
+    confidences = np.array([rng.permutation(np.arange(1, 17)) for _ in range(12)])
+    names = [f"Player {i}" for i in range(12)]
+    first = race_status(names, list(range(12)), games, picks, confidences)
+    hits = _race_status.cache_info().hits
+    second = race_status(names, list(range(12)), games, picks, confidences)
+    assert first == second
+    assert _race_status.cache_info().hits == hits + 1
@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+import pytest
+import requests
+from tenacity import wait_none
+
+from nfl_commish.fake_odds_server import FakeOddsApiServer
+from nfl_commish.game import _request_the_odds, get_the_odds_json
+from nfl_commish.quota import the_odds_budget
+
+
+@pytest.fixture
+def fake_server(the_odds_events_file_path, the_odds_scores_file_path):
+    server = FakeOddsApiServer(
+        events_path=the_odds_events_file_path, scores_path=the_odds_scores_file_path, quota=10
+    )
+    with server:
+        yield server
+
+
+def test_fake_server_endpoints(
+    fake_server, the_odds_events_resp_json, the_odds_scores_resp_json, tmp_path
+):
+    base_url = fake_server.base_url
+    events = get_the_odds_json(api_key="test", endpoint="events", base_url=base_url)
+    assert events == the_odds_events_resp_json
+    scores = get_the_odds_json(api_key="test", endpoint="scores", base_url=base_url)
+    assert scores == the_odds_scores_resp_json
+
+    # Quota is charged like the real API, and recorded from the headers
+    assert fake_server.requests_used == 2
+    assert the_odds_budget.quota.requests_remaining == 8
+    assert the_odds_budget.quota.used_by_last_call == 2
+
+    # Conditional requests reuse the cached body
+    cache_dir = str(tmp_path / "cache")
+    get_the_odds_json(api_key="test", endpoint="scores", cache_dir=cache_dir, base_url=base_url)
+    cached = get_the_odds_json(
+        api_key="test",
+        endpoint="scores",
+        cache_dir=cache_dir,
+        max_age=timedelta(0),
+        base_url=base_url,
+    )
+    assert cached == the_odds_scores_resp_json
+    scores_url = f"{base_url}/v4/sports/americanfootball_nfl/scores/"
+    etag = requests.get(scores_url, params={"apiKey": "test"}).headers["ETag"]
+    resp = requests.get(scores_url, params={"apiKey": "test"}, headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+
+    # Unknown endpoints, missing keys and spent quota are rejected
+    assert requests.get(f"{base_url}/v4/sports/americanfootball_nfl/odds/").status_code == 404
+    assert requests.get(scores_url).status_code == 401
+    fake_server.requests_used = fake_server.quota
+    with pytest.raises(requests.exceptions.HTTPError):
+        get_the_odds_json(api_key="test", endpoint="scores", base_url=base_url)
+
+
+def test_fake_server_injected_errors(fake_server, the_odds_events_resp_json, mocker):
+    mocker.patch.object(_request_the_odds.retry, "wait", wait_none())
+
+    # Rate limits and server errors are retried
+    fake_server.fail_next(429, 503)
+    events = get_the_odds_json(api_key="test", endpoint="events", base_url=fake_server.base_url)
+    assert events == the_odds_events_resp_json
+    assert len(fake_server.request_log) == 3
+
+    # Random errors are injected at the given rate
+    fake_server.error_rate = 1.0
+    fake_server.error_status = 400
+    with pytest.raises(requests.exceptions.HTTPError):
+        get_the_odds_json(api_key="test", endpoint="events", base_url=fake_server.base_url)
+    assert len(fake_server.request_log) == 4
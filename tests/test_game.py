@@ -1,13 +1,16 @@
-from datetime import date, datetime, time
+import io
+from datetime import date, datetime, time, timedelta
 
 import pytest
+from pydantic import ValidationError
 
 from nfl_commish.game import (
+    Game,
     convert_team_name,
-    get_completed_games,
     get_the_odds_json,
     get_this_weeks_games,
     is_same_team,
+    iter_parse_the_odds_file,
     parse_the_odds_json,
     str_match_team_name,
 )
@@ -21,7 +24,48 @@ def test_convert_team_name():
 def test_get_the_odds_bad_endpoint():
     with pytest.raises(ValueError) as e:
         get_the_odds_json(api_key="test", endpoint="bad_endpoint")
-        assert str(e) == "Endpoint must be one of 'events' or 'scores', got 'bad_endpoint'"
+        assert str(e) == "Endpoint must be one of 'events', 'scores' or 'odds', got 'bad_endpoint'"
+
+
+def mock_the_odds_response(mocker, json_data, status_code=200, etag=None):
+    resp = mocker.MagicMock(status_code=status_code)
+    resp.json.return_value = json_data
+    resp.headers = {"x-requests-used": "1", "x-requests-remaining": "499", "x-requests-last": "1"}
+    if etag is not None:
+        resp.headers["etag"] = etag
+    return resp
+
+
+def test_get_the_odds_json_cache(the_odds_scores_resp_json, tmp_path, mocker):
+    session = mocker.patch("nfl_commish.game._the_odds_session")
+    session.get.return_value = mock_the_odds_response(
+        mocker, the_odds_scores_resp_json, etag='"v1"'
+    )
+
+    # Without a cache directory, every call hits the API
+    get_the_odds_json(api_key="test", endpoint="scores")
+    get_the_odds_json(api_key="test", endpoint="scores")
+    assert session.get.call_count == 2
+
+    # With a cache directory, fresh responses are reused
+    cache_dir = str(tmp_path / "cache")
+    first = get_the_odds_json(api_key="test", endpoint="scores", cache_dir=cache_dir)
+    second = get_the_odds_json(api_key="other-key", endpoint="scores", cache_dir=cache_dir)
+    assert first == second == the_odds_scores_resp_json
+    assert session.get.call_count == 3
+    assert session.get.call_args.kwargs["params"]["daysFrom"] == 3
+
+    # Different endpoints are cached separately
+    get_the_odds_json(api_key="test", endpoint="events", cache_dir=cache_dir)
+    assert session.get.call_count == 4
+
+    # Stale responses are revalidated, reusing the cached body if not modified
+    session.get.return_value = mock_the_odds_response(mocker, None, status_code=304)
+    stale = get_the_odds_json(
+        api_key="test", endpoint="scores", cache_dir=cache_dir, max_age=timedelta(0)
+    )
+    assert stale == the_odds_scores_resp_json
+    assert session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
 
 
 def test_parse_events(the_odds_events_resp_json):
@@ -131,14 +175,6 @@ def test_get_this_weeks_games_monday(the_odds_events_resp_json, mocker):
     assert len(this_weeks_games) == 1  # MNF is the only remaining game
 
 
-def test_get_completed_games(the_odds_scores_resp_json):
-    games = parse_the_odds_json(the_odds_scores_resp_json)
-    assert len(games) == 272
-    games = get_completed_games(games=games)
-    assert len(games) == 1
-    assert games[0].id == "612c2c3f6ca9e10d4b7ead21a2b0ff38"
-
-
 def test_is_same_team():
     assert is_same_team("new-orleans-saints", "new-orleans-saints")
     assert is_same_team("new-orleans-saints", "New-Orleans-SAINTS")  # Ignore case
@@ -199,3 +235,50 @@ def test_str_match_same_team_name():
         str_match_team_name("los angeles", ["los-angeles-chargers", "los-angeles-rams"])
     with pytest.raises(ValueError):
         str_match_team_name("new-york", ["new-york-jets", "new-york-giants"])
+
+
+def test_iter_parse_the_odds_file(the_odds_scores_file_path, the_odds_scores_resp_json):
+    games = parse_the_odds_json(the_odds_scores_resp_json)
+
+    # Small chunks split games across reads
+    streamed = iter_parse_the_odds_file(the_odds_scores_file_path, chunk_size=97, batch_size=10)
+    assert list(streamed) == games
+
+    # Binary streams are decoded too
+    with open(the_odds_scores_file_path, "rb") as f:
+        assert list(iter_parse_the_odds_file(f)) == games
+    assert list(iter_parse_the_odds_file(io.BytesIO(b" [ ] "))) == []
+
+    # Truncated or malformed files raise
+    with open(the_odds_scores_file_path, "r") as f:
+        truncated = f.read()[:5000]
+    with pytest.raises(ValueError):
+        list(iter_parse_the_odds_file(io.StringIO(truncated), chunk_size=97))
+    with pytest.raises(ValueError):
+        list(iter_parse_the_odds_file(io.StringIO('{"id": "abc"}')))
+
+
+def test_game_cached_fields_never_stale():
+    game = Game(
+        id="a",
+        commence_time="2024-09-06T00:15:00Z",
+        home_team="Kansas City Chiefs",
+        away_team="Baltimore Ravens",
+        completed=True,
+        scores=[
+            {"name": "Kansas City Chiefs", "score": 27},
+            {"name": "Baltimore Ravens", "score": 20},
+        ],
+    )
+    assert game.winner == "kansas-city-chiefs"
+
+    # Copies recompute derived fields from their own values
+    copied = game.model_copy(update={"completed": False})
+    assert copied.winner is None
+    assert copied.model_dump()["winner"] is None
+    moved = game.model_copy(update={"commence_time": game.commence_time + timedelta(days=1)})
+    assert moved.local_date == game.local_date + timedelta(days=1)
+
+    # Games cannot be changed in place
+    with pytest.raises(ValidationError):
+        game.completed = False
@@ -0,0 +1,41 @@
+from nfl_commish.game import parse_the_odds_json
+from nfl_commish.game_store import GameStore
+
+
+def test_game_store_round_trip(the_odds_events_resp_json, tmp_path):
+    store = GameStore(path=str(tmp_path / "games.db"))
+    assert store.age() is None
+    assert store.load() == []
+
+    games = parse_the_odds_json(the_odds_events_resp_json)
+    store.upsert(games=games)
+    assert store.age() >= 0
+
+    loaded = store.load()
+    assert len(loaded) == 272
+    by_id = {game.id: game for game in loaded}
+    for game in games:
+        stored = by_id[game.id]
+        assert stored.home_team == game.home_team
+        assert stored.away_team == game.away_team
+        assert stored.commence_time == game.commence_time
+        assert stored.local_date == game.local_date
+        assert stored.completed is None
+        assert stored.scores is None
+
+
+def test_game_store_upsert_scores(the_odds_events_resp_json, the_odds_scores_resp_json, tmp_path):
+    store = GameStore(path=str(tmp_path / "games.db"))
+    store.upsert(games=parse_the_odds_json(the_odds_events_resp_json))
+    store.upsert(games=parse_the_odds_json(the_odds_scores_resp_json))
+
+    loaded = {game.id: game for game in store.load()}
+    assert len(loaded) == 272
+    completed = loaded["612c2c3f6ca9e10d4b7ead21a2b0ff38"]
+    assert completed.completed
+    assert completed.scores[1].score == 9356
+    assert completed.winner.value == "baltimore-ravens"
+    not_completed = loaded["eca3b71919531e7ae0b4f3f501157e6c"]
+    assert not not_completed.completed
+    assert len(not_completed.scores) == 2
+    assert not_completed.winner is None
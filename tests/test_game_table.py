@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta
+
+from nfl_commish.game import (
+    filter_games_by_date,
+    get_this_weeks_games,
+    parse_the_odds_json,
+)
+from nfl_commish.game_table import NO_TEAM, TEAM_CODES, GameTable
+
+
+def test_game_table_columns(the_odds_scores_resp_json):
+    games = parse_the_odds_json(the_odds_scores_resp_json)
+    table = GameTable(games)
+    assert len(table) == 272
+    assert table.to_games() == games
+    row = table.df.iloc[0]
+    assert row["id"] == "612c2c3f6ca9e10d4b7ead21a2b0ff38"
+    assert row["completed"]
+    assert row["home_team"] == TEAM_CODES["kansas-city-chiefs"]
+    assert row["home_score"] == 5
+    assert row["away_score"] == 9356
+    assert row["winner"] == TEAM_CODES["baltimore-ravens"]
+    assert table.df.iloc[1]["winner"] == NO_TEAM
+
+
+def test_game_table_filters_match_list_filters(the_odds_scores_resp_json):
+    games = parse_the_odds_json(the_odds_scores_resp_json)
+    table = GameTable(games)
+
+    assert table.completed().to_games() == [game for game in games if game.completed]
+
+    after = datetime.fromisoformat("2024-09-08 00:00:00+00:00")
+    before = datetime.fromisoformat("2024-09-10 00:00:00+00:00")
+    filtered = table.filter_by_date(after=after, before=before)
+    assert filtered.to_games() == filter_games_by_date(games, after=after, before=before)
+    assert len(filtered) > 0
+    assert len(table.filter_by_date(after=after)) + len(
+        table.filter_by_date(before=after + timedelta(seconds=1))
+    ) == len(table)
+
+
+def test_game_table_select(the_odds_scores_resp_json):
+    games = parse_the_odds_json(the_odds_scores_resp_json)
+    table = GameTable(games)
+    selected = table.select([games[5].id, "unknown", games[2].id])
+    assert selected.to_games() == [games[2], games[5]]
+    assert len(table.completed().select([games[0].id, games[1].id])) == 1
+
+
+def test_game_table_this_week(the_odds_events_resp_json, mocker):
+    wednesday = datetime.fromisoformat("2024-09-04 20:06:00+00:00")
+    mock_datetime = mocker.patch("nfl_commish.game.datetime")
+    mock_datetime.now.return_value = wednesday
+
+    games = parse_the_odds_json(the_odds_events_resp_json)
+    assert GameTable(games).this_week().to_games() == get_this_weeks_games(games=games)
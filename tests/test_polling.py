@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta
+
+from pytz import utc
+
+from nfl_commish.game import Game
+from nfl_commish.polling import expected_end_groups, next_poll_time
+
+THURSDAY = datetime(2024, 9, 6, 0, 15, tzinfo=utc)
+SUNDAY_EARLY = datetime(2024, 9, 8, 17, 0, tzinfo=utc)
+SUNDAY_LATE = datetime(2024, 9, 8, 20, 25, tzinfo=utc)
+MONDAY = datetime(2024, 9, 10, 0, 15, tzinfo=utc)
+DURATION = timedelta(hours=3, minutes=15)
+
+
+def make_game(game_id, commence_time):
+    return Game(
+        id=game_id,
+        commence_time=commence_time.isoformat(),
+        home_team="Kansas City Chiefs",
+        away_team="Baltimore Ravens",
+    )
+
+
+def week_games():
+    return [
+        make_game("thu", THURSDAY),
+        make_game("sun-1", SUNDAY_EARLY),
+        make_game("sun-2", SUNDAY_EARLY),
+        make_game("sun-3", SUNDAY_LATE - timedelta(minutes=20)),
+        make_game("sun-4", SUNDAY_LATE),
+        make_game("mon", MONDAY),
+    ]
+
+
+def test_expected_end_groups():
+    games = week_games()
+    groups = expected_end_groups(games=games, now=THURSDAY)
+    assert groups == [
+        THURSDAY + DURATION,
+        SUNDAY_EARLY + DURATION,
+        SUNDAY_LATE + DURATION,  # 4:05 and 4:25 kickoffs share the later poll
+        MONDAY + DURATION,
+    ]
+    assert expected_end_groups(games=games, now=SUNDAY_EARLY + DURATION) == groups[2:]
+
+
+def test_next_poll_time_on_schedule():
+    games = week_games()
+
+    # Poll as soon as each group is expected to end, well before the fixed 5 hours, keeping one
+    # poll back for the end of the week
+    assert next_poll_time(games, now=THURSDAY, polls_left=5) == THURSDAY + DURATION
+    pending = games[1:]
+    now = THURSDAY + DURATION
+    assert next_poll_time(pending, now=now, polls_left=4) == SUNDAY_EARLY + DURATION
+
+    # Too few polls - the earliest groups are merged into later polls
+    assert next_poll_time(games, now=THURSDAY, polls_left=4) == SUNDAY_EARLY + DURATION
+    assert next_poll_time(games, now=THURSDAY, polls_left=3) == SUNDAY_LATE + DURATION
+
+    # Stop once every game has a winner, or once the budget is spent
+    assert next_poll_time([], now=now, polls_left=3) is None
+    assert next_poll_time(pending, now=now, polls_left=0) is None
+
+
+def test_next_poll_time_overtime():
+    games = week_games()
+    now = SUNDAY_EARLY + DURATION
+    pending = games[1:2] + games[3:]  # sun-1 is running long
+
+    # With polls to spare, re-poll the long game soon, backing off while it stays live
+    assert next_poll_time(pending, now=now, polls_left=4) == now + timedelta(minutes=15)
+    later = now + timedelta(minutes=30)
+    assert next_poll_time(pending, now=later, polls_left=4, n_overtime_polls=2) == later + (
+        timedelta(hours=1)
+    )
+
+    # Without spare polls, the long game is picked up by the next group's poll
+    assert next_poll_time(pending, now=now, polls_left=3) == SUNDAY_LATE + DURATION
+
+    # Only the long Monday game is left - back off, and make the last poll count
+    now = MONDAY + DURATION
+    pending = games[-1:]
+    assert next_poll_time(pending, now=now, polls_left=2) == now + timedelta(minutes=15)
+    assert next_poll_time(pending, now=now, polls_left=1) == MONDAY + timedelta(hours=5)
+    late = MONDAY + timedelta(hours=6)
+    assert next_poll_time(pending, now=late, polls_left=1) == late + timedelta(minutes=15)
+
+
+def test_next_poll_time_last_game_live_at_expected_end():
+    # The week's last game is still live when polled at its expected end - the poll kept back
+    # picks it up once it has surely ended
+    game = make_game("mon", MONDAY)
+    assert next_poll_time([game], now=MONDAY, polls_left=2) == MONDAY + DURATION
+    now = MONDAY + DURATION
+    assert next_poll_time([game], now=now, polls_left=1, n_overtime_polls=1) == (
+        MONDAY + timedelta(hours=5)
+    )
+
+    # With a single poll, it waits for the game to have surely ended
+    assert next_poll_time([game], now=MONDAY, polls_left=1) == MONDAY + timedelta(hours=5)
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta
+
+from pytz import utc
+
+from nfl_commish.quota import OddsApiBudget, plan_polls_within_budget
+
+
+def quota_headers(used, remaining, last):
+    return {
+        "x-requests-used": str(used),
+        "x-requests-remaining": str(remaining),
+        "x-requests-last": str(last),
+    }
+
+
+def test_record_quota(tmp_path):
+    budget = OddsApiBudget()
+    assert budget.quota is None
+    assert budget.record({}) is None
+
+    # Recording keeps the most expensive call seen
+    budget.record(quota_headers(used=10, remaining=490, last=2))
+    quota = budget.record(quota_headers(used=10, remaining=490, last=0))
+    assert quota.requests_remaining == 490
+    assert quota.used_by_last_call == 0
+    assert quota.max_cost_per_call == 2
+
+    # Persisted quotas are restored by a new process
+    state_path = str(tmp_path / "quota.json")
+    budget.load(state_path=state_path)
+    budget.record(quota_headers(used=12, remaining=488, last=2))
+    restored = OddsApiBudget()
+    restored.load(state_path=state_path)
+    assert restored.quota == budget.quota
+
+
+def test_project_spend():
+    now = datetime(2024, 9, 20, tzinfo=utc)
+    budget = OddsApiBudget()
+    call_times = [now - timedelta(days=1)] + [now + timedelta(days=4 * i) for i in range(5)]
+
+    # With nothing recorded, calls are assumed to cost 1 and the budget is never tight
+    projection = budget.project_spend(call_times=call_times, now=now)
+    assert projection.n_month_calls == 3  # 20th, 24th and 28th of September
+    assert projection.n_season_calls == 5
+    assert not projection.is_tight
+
+    budget.record(quota_headers(used=495, remaining=5, last=2))
+    projection = budget.project_spend(call_times=call_times, now=now)
+    assert projection.month_cost == 6
+    assert projection.season_cost == 10
+    assert projection.is_tight
+
+
+def test_plan_polls_within_budget():
+    now = datetime(2024, 9, 6, tzinfo=utc)
+    sunday = datetime(2024, 9, 8, tzinfo=utc)
+    poll_times = [
+        datetime(2024, 9, 6, 5, tzinfo=utc),  # Thursday night
+        sunday.replace(hour=22),
+        sunday.replace(hour=1),
+        sunday.replace(hour=18),
+        datetime(2024, 9, 10, 5, tzinfo=utc),  # Monday night
+    ]
+
+    # Plenty of quota - every poll is kept
+    budget = OddsApiBudget()
+    budget.record(quota_headers(used=0, remaining=500, last=2))
+    planned = plan_polls_within_budget(poll_times, n_future_weeks=10, budget=budget, now=now)
+    assert planned == sorted(poll_times)
+
+    # Tight quota - polls are merged into the latest poll of each day
+    budget.record(quota_headers(used=0, remaining=26, last=2))
+    planned = plan_polls_within_budget(poll_times, n_future_weeks=10, budget=budget, now=now)
+    assert planned == [poll_times[0], sunday.replace(hour=22), poll_times[-1]]
+
+    # Each poll also fetching odds for the league outlook doubles the spend
+    planned = plan_polls_within_budget(
+        poll_times, n_future_weeks=10, calls_per_poll=2, budget=budget, now=now
+    )
+    assert planned == [poll_times[-1]]
+
+    # Very tight quota - a single poll at the end of the week
+    budget.record(quota_headers(used=0, remaining=1, last=2))
+    planned = plan_polls_within_budget(poll_times, n_future_weeks=10, budget=budget, now=now)
+    assert planned == [poll_times[-1]]
@@ -0,0 +1,96 @@
+import copy
+import random
+
+import numpy as np
+import pandas as pd
+
+from nfl_commish.game import is_same_team, parse_the_odds_json, str_match_team_name
+from nfl_commish.game_table import NO_TEAM, TEAM_CODES
+from nfl_commish.scoring import game_rows, pick_matrix, score_picks, score_week
+
+PLAYERS = ["Luke", "Andrew", "Shivam"]
+
+
+def completed_games(the_odds_json, n_games, rng):
+    games_json = copy.deepcopy(the_odds_json[:n_games])
+    for game_json in games_json:
+        home_score = rng.randint(0, 40)
+        game_json["completed"] = True
+        game_json["scores"] = [
+            {"name": game_json["home_team"], "score": home_score},
+            {"name": game_json["away_team"], "score": home_score + rng.choice([-7, 3])},
+        ]
+    return parse_the_odds_json(games_json)
+
+
+def random_pick(game, rng):
+    team = rng.choice([game.home_team.value, game.away_team.value])
+    city, mascot = " ".join(team.split("-")[:-1]), team.split("-")[-1]
+    typo = mascot[:2] + mascot[3] + mascot[2] + mascot[4:]
+    return rng.choice([team, city, mascot.title(), typo, "", "no idea"])
+
+
+def week_sheet(games, rng):
+    df = pd.DataFrame({"Game ID": [game.id for game in reversed(games)], "Winner": ""})
+    for player in PLAYERS:
+        df[f"{player} Predicted"] = [random_pick(game, rng) for game in reversed(games)]
+        df[f"{player} Confidence"] = [rng.choice([1, 5, 16, ""]) for _ in games]
+        df[f"{player} Points"] = ""
+    return df
+
+
+def reference_points(df, games):
+    """Per-cell scoring, as update_admin_with_completed_games used to do it"""
+    points = {}
+    for game in games:
+        row_idx = df[df["Game ID"] == game.id].index[0]
+        for player in PLAYERS:
+            pred = df.iloc[row_idx][f"{player} Predicted"]
+            conf = df.iloc[row_idx][f"{player} Confidence"]
+            if not pred or not conf:
+                continue
+            try:
+                pred = str_match_team_name(pred, [game.home_team.value, game.away_team.value])
+            except ValueError:
+                continue
+            points[(game.id, player)] = int(conf) if is_same_team(pred, game.winner.value) else 0
+    return points
+
+
+def test_score_week_matches_per_cell_scoring(the_odds_scores_resp_json):
+    rng = random.Random(0)
+    games = completed_games(the_odds_scores_resp_json, n_games=40, rng=rng)
+    df = week_sheet(games, rng)
+
+    points = score_week(df=df, player_names=PLAYERS, games=games)
+    assert list(points.index) == [game.id for game in games]
+    assert list(points.columns) == PLAYERS
+    expected = reference_points(df, games)
+    for game in games:
+        for player in PLAYERS:
+            assert points.at[game.id, player] == expected.get((game.id, player), 0)
+    assert points.to_numpy().sum() > 0
+
+
+def test_score_picks():
+    chiefs, ravens = TEAM_CODES["kansas-city-chiefs"], TEAM_CODES["baltimore-ravens"]
+    picks = np.array([[chiefs, ravens, NO_TEAM], [ravens, ravens, NO_TEAM]])
+    confidences = np.array([[3, 2, 1], [3, 2, 1]])
+    winners = np.array([chiefs, ravens, NO_TEAM])
+    points = score_picks(picks=picks, confidences=confidences, winners=winners)
+    assert points.tolist() == [[3, 2, 0], [0, 2, 0]]
+
+
+def test_pick_matrix(the_odds_scores_resp_json):
+    games = parse_the_odds_json(the_odds_scores_resp_json[:2])
+    df = pd.DataFrame(
+        {
+            "Game ID": [games[1].id, games[0].id],
+            "Luke Predicted": ["", "KC"],
+            "Luke Confidence": [2, "16"],
+        }
+    )
+    assert game_rows(df=df, games=games).tolist() == [1, 0]
+    picks, confidences = pick_matrix(df=df, player_names=["Luke"], games=games)
+    assert picks.tolist() == [[TEAM_CODES["kansas-city-chiefs"], NO_TEAM]]
+    assert confidences.tolist() == [[16, 0]]
@@ -0,0 +1,244 @@
+import json
+import os
+import runpy
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from nfl_commish.game import parse_the_odds_json
+from nfl_commish.game_table import TEAM_CODES
+from nfl_commish.simulation import (
+    UNPICKED,
+    flat_home_win_probabilities,
+    h2h_home_win_probabilities,
+    simulate_league,
+    unpicked_confidences,
+    week_starts,
+)
+
+
+@pytest.fixture
+def the_odds_decimal_json():
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    with open(os.path.join(current_dir, "assets", "the_odds_decimal.json"), "r") as f:
+        return json.load(f)
+
+
+def test_h2h_home_win_probabilities(the_odds_decimal_json):
+    games = parse_the_odds_json(the_odds_decimal_json)
+    probabilities = h2h_home_win_probabilities(games=games, the_odds_json=the_odds_decimal_json)
+    assert probabilities.shape == (len(games),)
+    assert ((probabilities > 0) & (probabilities < 1)).all()
+
+    # Saints (home) were slight favorites over the Jaguars at every bookmaker
+    event = the_odds_decimal_json[0]
+    expected = []
+    for bookmaker in event["bookmakers"]:
+        prices = {o["name"]: o["price"] for o in bookmaker["markets"][0]["outcomes"]}
+        home, away = 1 / prices[event["home_team"]], 1 / prices[event["away_team"]]
+        expected.append(home / (home + away))
+    assert probabilities[0] == pytest.approx(np.mean(expected))
+    assert 0.5 < probabilities[0] < 0.6
+
+    # Games without odds fall back to the default
+    assert h2h_home_win_probabilities(games=games, the_odds_json=[]).tolist() == [0.5] * len(games)
+
+
+def test_unpicked_confidences(the_odds_decimal_json):
+    games = parse_the_odds_json(the_odds_decimal_json)
+    probabilities = h2h_home_win_probabilities(games=games, the_odds_json=the_odds_decimal_json)
+    confidences = unpicked_confidences(games=games, home_win_probabilities=probabilities)
+
+    # Each week uses the top n ranks once, with the most lopsided games ranked highest
+    weeks = np.array(week_starts(games), dtype=object)
+    for week in set(weeks.tolist()):
+        idx = np.flatnonzero(weeks == week)
+        assert sorted(confidences[idx].tolist()) == list(range(17 - len(idx), 17))
+        lopsided = idx[np.argmax(np.abs(probabilities[idx] - 0.5))]
+        assert confidences[lopsided] == 16
+
+
+def test_simulate_league_picked_games(the_odds_scores_resp_json):
+    game = parse_the_odds_json(the_odds_scores_resp_json)[0]
+    home, away = TEAM_CODES[game.home_team.value], TEAM_CODES[game.away_team.value]
+    picks = np.array([[home], [away], [home]], dtype=np.int16)
+    confidences = np.array([[10], [10], [3]])
+    result = simulate_league(
+        player_names=["Luke", "Andrew", "Shivam"],
+        current_points=[0, 0, 5],
+        games=[game],
+        home_win_probabilities=np.array([0.7]),
+        picks=picks,
+        confidences=confidences,
+        n_trials=100_000,
+        n_workers=1,
+        seed=0,
+    )
+
+    # Luke wins whenever the home team does, Andrew otherwise, and Shivam is always second
+    assert result.win_probabilities["Luke"] == pytest.approx(0.7, abs=0.01)
+    assert result.win_probabilities["Andrew"] == pytest.approx(0.3, abs=0.01)
+    assert result.win_probabilities["Shivam"] == 0
+    assert result.position_probabilities["Shivam"] == [0, 1, 0]
+    assert result.expected_points["Luke"] == pytest.approx(7, abs=0.1)
+    assert result.expected_points["Shivam"] == pytest.approx(5 + 0.7 * 3, abs=0.1)
+    for probabilities in result.position_probabilities.values():
+        assert sum(probabilities) == pytest.approx(1)
+
+
+def test_simulate_league_unpicked_games(the_odds_scores_resp_json):
+    # Two full weeks of coin flips: each week's confidences are 1 to 16, half of them correct
+    games = parse_the_odds_json(the_odds_scores_resp_json)[:32]
+    names = ["Luke", "Andrew", "Shivam", "Bud"]
+    result = simulate_league(
+        player_names=names,
+        current_points=[0, 0, 0, 0],
+        games=games,
+        home_win_probabilities=flat_home_win_probabilities(games),
+        n_trials=50_000,
+        n_workers=1,
+        seed=0,
+    )
+    for name in names:
+        assert result.expected_points[name] == pytest.approx(136, abs=1)
+        assert result.win_probabilities[name] == pytest.approx(0.25, abs=0.02)
+    assert result.summary().index.tolist() == sorted(
+        names, key=lambda name: -result.win_probabilities[name]
+    )
+
+    # A partly picked week: unpicked columns are simulated, picked columns are scored
+    picks = np.full((len(names), len(games)), UNPICKED, dtype=np.int16)
+    picks[0, 0] = TEAM_CODES[games[0].home_team.value]
+    picks[1:, 0] = TEAM_CODES[games[0].away_team.value]
+    confidences = np.zeros(picks.shape, dtype=np.int64)
+    confidences[:, 0] = 16
+    result = simulate_league(
+        player_names=names,
+        current_points=[50, 0, 0, 0],
+        games=games,
+        home_win_probabilities=flat_home_win_probabilities(games),
+        picks=picks,
+        confidences=confidences,
+        n_trials=50_000,
+        n_workers=1,
+        seed=0,
+    )
+    assert result.win_probabilities["Luke"] > 0.5
+
+
+def test_simulate_league_reproducible_across_workers(the_odds_scores_resp_json):
+    games = parse_the_odds_json(the_odds_scores_resp_json)[:20]
+    kwargs = dict(
+        player_names=["Luke", "Andrew"],
+        current_points=[10, 0],
+        games=games,
+        home_win_probabilities=flat_home_win_probabilities(games),
+        n_trials=10_000,
+        chunk_size=2_500,
+        seed=42,
+    )
+    in_process = simulate_league(n_workers=1, **kwargs)
+    pooled = simulate_league(n_workers=2, **kwargs)
+    assert in_process == pooled
+
+
+def test_simulate_league_partly_picked_week(the_odds_scores_resp_json):
+    # Ranks used on picked games are not reused for the rest of the week, so a coin flip week
+    # still scores half of 1 to 16 on average
+    games = parse_the_odds_json(the_odds_scores_resp_json)[:16]
+    picks = np.full((2, len(games)), UNPICKED, dtype=np.int16)
+    picks[:, :3] = [TEAM_CODES[game.home_team.value] for game in games[:3]]
+    confidences = np.zeros(picks.shape, dtype=np.int64)
+    confidences[:, :3] = [16, 15, 14]
+    result = simulate_league(
+        player_names=["Luke", "Andrew"],
+        current_points=[0, 0],
+        games=games,
+        home_win_probabilities=flat_home_win_probabilities(games),
+        picks=picks,
+        confidences=confidences,
+        n_trials=50_000,
+        n_workers=1,
+        seed=0,
+    )
+    assert result.expected_points["Luke"] == pytest.approx(68, abs=0.5)
+    assert result.expected_points["Andrew"] == pytest.approx(68, abs=0.5)
+
+
+def test_simulate_league_partly_played_week(the_odds_scores_resp_json):
+    # 12 of the week's 16 games are done, using ranks 5 to 16, and one of the 4 left is picked
+    # with rank 1 - so only ranks 2 to 4 are left for the other 3
+    games = parse_the_odds_json(the_odds_scores_resp_json)[12:16]
+    picks = np.full((1, len(games)), UNPICKED, dtype=np.int16)
+    picks[0, 0] = TEAM_CODES[games[0].home_team.value]
+    confidences = np.zeros(picks.shape, dtype=np.int64)
+    confidences[0, 0] = 1
+    kwargs = dict(
+        player_names=["Luke"],
+        current_points=[0],
+        games=games,
+        home_win_probabilities=flat_home_win_probabilities(games),
+        picks=picks,
+        confidences=confidences,
+        n_trials=50_000,
+        n_workers=1,
+        seed=0,
+    )
+    result = simulate_league(n_week_games=16, used_ranks=[list(range(5, 17))], **kwargs)
+    assert result.expected_points["Luke"] == pytest.approx(0.5 * (1 + 2 + 3 + 4), abs=0.1)
+
+    # Without them, the unpicked games would be assumed to get ranks 14 to 16
+    result = simulate_league(**kwargs)
+    assert result.expected_points["Luke"] == pytest.approx(0.5 * (1 + 14 + 15 + 16), abs=0.1)
+
+
+def test_simulate_league_workers_from_script(tmp_path):
+    # Spawned workers re-import the entry script, so its top level runs again in each of them
+    repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    pids_path = tmp_path / "pids.txt"
+    script_path = tmp_path / "entry.py"
+    script_path.write_text(f"""
+import json
+import os
+
+from nfl_commish.game import parse_the_odds_json
+from nfl_commish.simulation import flat_home_win_probabilities, simulate_league
+
+with open({str(pids_path)!r}, "a") as f:
+    f.write(f"{{os.getpid()}}\\n")
+
+if __name__ == "__main__":
+    with open({os.path.join(repo_dir, "tests", "assets", "scores.json")!r}) as f:
+        games = parse_the_odds_json(json.load(f))[:20]
+    result = simulate_league(
+        player_names=["Luke", "Andrew"],
+        current_points=[10, 0],
+        games=games,
+        home_win_probabilities=flat_home_win_probabilities(games),
+        n_trials=10_000,
+        n_workers=2,
+        chunk_size=2_500,
+        seed=0,
+    )
+    print(result.n_trials)
+""")
+    env = dict(os.environ, PYTHONPATH=repo_dir)
+    completed = subprocess.run(
+        [sys.executable, str(script_path)], capture_output=True, text=True, env=env, timeout=120
+    )
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.strip() == "10000"
+    assert len(set(pids_path.read_text().split())) > 1
+
+
+def test_run_script_guarded(mocker):
+    # Re-importing the scheduler script, as a spawned worker does, must not start the scheduler
+    scheduler = mocker.patch("apscheduler.schedulers.background.BackgroundScheduler")
+    schedule = mocker.patch("nfl_commish.scheduling.schedule_commish_tasks")
+    mocker.patch("time.sleep", side_effect=AssertionError("Entered the scheduler loop"))
+    repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    runpy.run_path(os.path.join(repo_dir, "scripts", "run.py"), run_name="__mp_main__")
+    scheduler.assert_not_called()
+    schedule.assert_not_called()
@@ -0,0 +1,77 @@
+import pandas as pd
+
+from nfl_commish.standings import (
+    SeasonStandings,
+    get_season_standings,
+    week_sheet_points,
+)
+
+PLAYERS = ["Luke", "Andrew", "Shivam"]
+
+
+def points_grid(rows):
+    return pd.DataFrame(
+        [points for _, points in rows],
+        index=pd.Index([game_id for game_id, _ in rows], name="Game ID"),
+        columns=PLAYERS,
+    )
+
+
+def test_apply_game_points():
+    standings = SeasonStandings(player_names=PLAYERS, n_weeks=3)
+    standings.load_week(1, points_grid([("a", [16, 0, 16]), ("b", [0, 15, 0])]))
+    assert standings.week_totals(1) == {"Luke": 16, "Andrew": 15, "Shivam": 16}
+
+    # Only the change from already applied games is added
+    delta = standings.apply_game_points(1, points_grid([("b", [0, 15, 15]), ("c", [1, 2, 0])]))
+    assert delta.tolist() == [1, 2, 15]
+    assert standings.week_totals(1) == {"Luke": 17, "Andrew": 17, "Shivam": 31}
+    standings.apply_game_points(1, points_grid([("c", [1, 2, 0])]))
+    assert standings.week_totals(1) == {"Luke": 17, "Andrew": 17, "Shivam": 31}
+
+    # Reloading a week replaces its points
+    standings.load_week(1, points_grid([("a", [16, 0, 16])]))
+    assert standings.week_totals(1) == {"Luke": 16, "Andrew": 0, "Shivam": 16}
+
+
+def test_standings_summary():
+    standings = SeasonStandings(player_names=PLAYERS, n_weeks=3)
+    scores_df = pd.DataFrame({"Week": [1, 2, 3], "Luke": [10, 5, ""], "Andrew": [8, 7, ""]})
+    scores_df["Shivam"] = [12, 3, ""]
+    standings.load_scores(scores_df)
+    assert standings.score_columns == {"Luke": 2, "Andrew": 3, "Shivam": 4}
+    assert not standings.row_changed(2)
+
+    # Weeks loaded game by game are not overwritten by the Scores sheet
+    standings.load_week(3, points_grid([("a", [4, 5, 0])]))
+    standings.load_scores(scores_df)
+    assert standings.row_changed(3)
+    standings.mark_written(3)
+    assert not standings.row_changed(3)
+
+    assert standings.season_totals.tolist() == [19, 20, 15]
+    assert standings.ranks.tolist() == [2, 1, 3]
+    assert standings.gaps_to_leader.tolist() == [1, 0, 5]
+    assert standings.weekly_highs.tolist() == [12, 7, 5]
+    assert standings.weekly_high_counts.tolist() == [0, 2, 1]
+    summary = standings.summary()
+    assert list(summary.index) == ["Andrew", "Luke", "Shivam"]
+
+    # Ties share the best rank
+    standings.apply_game_points(3, points_grid([("b", [1, 0, 0])]))
+    assert standings.ranks.tolist() == [1, 1, 3]
+
+
+def test_week_sheet_points():
+    df = pd.DataFrame({"Game ID": ["a", "b"], "Winner": ["x", ""]})
+    for name in PLAYERS:
+        df[f"{name} Points"] = [3, ""]
+    points = week_sheet_points(df=df, player_names=PLAYERS)
+    assert points.loc["a"].tolist() == [3, 3, 3]
+    assert points.loc["b"].tolist() == [0, 0, 0]
+
+
+def test_get_season_standings():
+    standings = get_season_standings("test-sheet", PLAYERS)
+    assert get_season_standings("test-sheet", PLAYERS) is standings
+    assert get_season_standings("test-sheet", PLAYERS[:2]) is not standings
@@ -0,0 +1,44 @@
+from nfl_commish.state import read_league_state, record_week_games
+
+
+def test_read_missing_league_state(tmp_path):
+    assert read_league_state(state_path=str(tmp_path / "state.json")) is None
+
+
+def test_read_invalid_league_state(tmp_path):
+    state_path = tmp_path / "state.json"
+    state_path.write_text("not json")
+    assert read_league_state(state_path=str(state_path)) is None
+
+
+def test_record_league_state(tmp_path):
+    state_path = str(tmp_path / "state.json")
+
+    # Initialize the week
+    state = record_week_games(
+        state_path=state_path, week_number=3, game_ids=["a", "b"], completed_game_ids=[]
+    )
+    assert state.current_week_number == 3
+    assert read_league_state(state_path=state_path) == state
+
+    # Re-initializing mid-week keeps the games which already started
+    state = record_week_games(
+        state_path=state_path, week_number=3, game_ids=["b", "c"], completed_game_ids=["a"]
+    )
+    assert state.game_ids == ["a", "b", "c"]
+    assert state.completed_game_ids == ["a"]
+    assert not state.is_week_complete
+
+    # Once every game is completed, the current week moves on
+    state = record_week_games(
+        state_path=state_path, week_number=3, game_ids=["b", "c"], completed_game_ids=["b", "c"]
+    )
+    assert state.is_week_complete
+    assert read_league_state(state_path=state_path).current_week_number == 4
+
+    # A new week replaces the old one
+    state = record_week_games(
+        state_path=state_path, week_number=4, game_ids=["d"], completed_game_ids=[]
+    )
+    assert state.game_ids == ["d"]
+    assert state.current_week_number == 4
@@ -0,0 +1,81 @@
+from nfl_commish.teams import (
+    BKTree,
+    TeamNameEnum,
+    best_matching_teams,
+    classify_pick,
+    levenshtein,
+    resolve_team,
+    team_match_counts,
+)
+
+
+def test_resolve_team():
+    assert resolve_team("new-orleans-saints") == TeamNameEnum("new-orleans-saints")
+    assert resolve_team("Saints!") == TeamNameEnum("new-orleans-saints")
+    assert resolve_team("KC") == TeamNameEnum("kansas-city-chiefs")
+    assert resolve_team("k.c.") == TeamNameEnum("kansas-city-chiefs")
+    assert resolve_team("Niners") == TeamNameEnum("san-francisco-49ers")
+    assert resolve_team("buccs") == TeamNameEnum("tampa-bay-buccaneers")
+    assert resolve_team("Philly") == TeamNameEnum("philadelphia-eagles")
+
+    # Ambiguous or unknown names do not resolve
+    assert resolve_team("los angeles") is None
+    assert resolve_team("new york") is None
+    assert resolve_team("missed") is None
+    assert team_match_counts("missed") == {}
+    assert best_matching_teams("new york") == {
+        TeamNameEnum("new-york-giants"),
+        TeamNameEnum("new-york-jets"),
+    }
+
+
+def test_classify_pick():
+    rams, chargers = "los-angeles-rams", "los-angeles-chargers"
+
+    # More matching words wins, regardless of candidate order
+    assert classify_pick("LA Rams", [rams, chargers]) == TeamNameEnum(rams)
+    assert classify_pick("LA Rams", [chargers, rams]) == TeamNameEnum(rams)
+    assert classify_pick("los angeles", [rams, chargers]) is None
+
+    # Only candidates can be picked
+    assert classify_pick("LAR", [chargers, "new-york-jets"]) is None
+    assert classify_pick("New York", [chargers, "new-york-jets"]) == TeamNameEnum("new-york-jets")
+
+    # Candidates can be free-text names too
+    assert classify_pick("pats", ["Patriots", "Jets"]) == TeamNameEnum("new-england-patriots")
+
+    # Abbreviations only match as the whole pick
+    assert classify_pick("no idea", ["new-orleans-saints", "atlanta-falcons"]) is None
+
+
+def test_bk_tree():
+    assert levenshtein("packres", "packers") == 2
+    assert levenshtein("steelrs", "steelers") == 1
+    assert levenshtein("", "abc") == 3
+
+    words = ["packers", "steelers", "saints", "jets", "bears", "bengals"]
+    tree = BKTree(words)
+    for query in ["packres", "steelrs", "bills", "jest"]:
+        for max_distance in range(4):
+            expected = sorted(
+                (levenshtein(query, word), word)
+                for word in words
+                if levenshtein(query, word) <= max_distance
+            )
+            assert tree.search(query, max_distance=max_distance) == expected
+
+
+def test_classify_pick_typos():
+    packers, steelers = "green-bay-packers", "pittsburgh-steelers"
+    assert classify_pick("Packres", [packers, steelers]) == TeamNameEnum(packers)
+    assert classify_pick("steelrs", [packers, steelers]) == TeamNameEnum(steelers)
+    assert classify_pick("Green Bay Packres", [packers, steelers]) == TeamNameEnum(packers)
+
+    # Typos only count towards the candidates, and short words are not guessed at
+    assert classify_pick("Packres", ["chicago-bears", steelers]) is None
+    assert classify_pick("Jest", ["new-york-jets", "new-england-patriots"]) is None
+
+    # Typos break ties between exact matches
+    rams, chargers = "los-angeles-rams", "los-angeles-chargers"
+    assert classify_pick("Los Angeles Rmas", [rams, chargers]) is None
+    assert classify_pick("Los Angeles Chargrs", [rams, chargers]) == TeamNameEnum(chargers)
@@ -1,6 +1,22 @@
+import gspread
+import pytest
+from gspread.utils import ValueRenderOption
 from pydantic import BaseModel
 
-from nfl_commish.utils import get_valid_team_names, read_config
+from nfl_commish import utils
+from nfl_commish.utils import (
+    TokenBucket,
+    WriteBuffer,
+    cell_values_equal,
+    get_valid_team_names,
+    open_sheet,
+    read_columns,
+    read_config,
+    read_worksheet_as_df,
+    read_worksheet_columns,
+    read_worksheets_as_dfs,
+    worksheet_cache_scope,
+)
 
 
 def test_read_config(tmp_path):
@@ -20,3 +36,221 @@ def test_get_valid_team_names():
     assert len(team_names) == 32
     assert "new-orleans-saints" in team_names
     assert "New Orleans Saints" not in team_names
+
+
+def test_write_buffer(mocker):
+    ws = mocker.MagicMock(spreadsheet_id="sheet", id=0, title="Week 1")
+    buffer = WriteBuffer()
+    buffer.update_cell(ws, 2, 3, "a")
+    buffer.update_cell(ws, 2, 4, 16)
+    buffer.update_cell(ws, 2, 3, "b")  # Overwrites the first write
+    assert len(buffer) == 2
+    ws.batch_update.assert_not_called()
+
+    # Flushing sends a single request and empties the buffer
+    buffer.flush()
+    ws.batch_update.assert_called_once()
+    data = ws.batch_update.call_args.args[0]
+    assert data == [{"range": "C2", "values": [["b"]]}, {"range": "D2", "values": [[16]]}]
+    assert len(buffer) == 0
+    buffer.flush()
+    ws.batch_update.assert_called_once()
+
+
+def test_open_sheet_reuses_client_and_spreadsheet(mocker):
+    for pool in ["_clients", "_spreadsheet_keys", "_spreadsheets"]:
+        mocker.patch.dict(getattr(utils, pool), clear=True)
+    gc = mocker.MagicMock()
+    gc.open.return_value.id = "sheet-key"
+    service_account = mocker.patch("nfl_commish.utils.gspread.service_account", return_value=gc)
+
+    # Opening the same sheet twice only authorizes and looks up by name once
+    sh = open_sheet(gspread_secret_path="pool-secret.json", sheet_name="Sheet")
+    assert open_sheet(gspread_secret_path="pool-secret.json", sheet_name="Sheet") is sh
+    service_account.assert_called_once_with(filename="pool-secret.json")
+    gc.open.assert_called_once_with("Sheet")
+
+    # Once the handle expires, the sheet is re-opened by key instead of by name
+    open_sheet(gspread_secret_path="pool-secret.json", sheet_name="Sheet", ttl=0)
+    gc.open_by_key.assert_called_once_with("sheet-key")
+    gc.open.assert_called_once()
+
+    # A deleted sheet falls back to the lookup by name
+    gc.open_by_key.side_effect = gspread.SpreadsheetNotFound(mocker.MagicMock())
+    open_sheet(gspread_secret_path="pool-secret.json", sheet_name="Sheet", ttl=0)
+    assert gc.open.call_count == 2
+    service_account.assert_called_once()
+
+
+def test_worksheet_cache_scope(mocker):
+    ws = mocker.MagicMock(spreadsheet_id="sheet", id=0, title="Week 1")
+    ws.spreadsheet.title = "Admin"
+    ws.get_all_records.return_value = [{"Game ID": "a", "Winner": ""}]
+    sh = mocker.MagicMock()
+    sh.worksheet.return_value = ws
+    mocker.patch("nfl_commish.utils.open_sheet", return_value=sh)
+    read_kwargs = {"gspread_secret_path": "", "sheet_name": "Admin", "worksheet_name": "Week 1"}
+
+    # Outside of a scope, every read hits the API
+    read_worksheet_as_df(**read_kwargs)
+    read_worksheet_as_df(**read_kwargs)
+    assert ws.get_all_records.call_count == 2
+
+    # Inside a scope, repeated (and nested) reads are served from the snapshot
+    with worksheet_cache_scope():
+        df = read_worksheet_as_df(**read_kwargs)
+        df.loc[0, "Winner"] = "mutated"  # Callers get a copy
+        with worksheet_cache_scope():
+            assert read_worksheet_as_df(**read_kwargs)["Winner"][0] == ""
+        assert ws.get_all_records.call_count == 3
+        assert sh.worksheet.call_count == 3
+
+        # Writes through the buffer update the snapshot instead of invalidating it
+        buffer = WriteBuffer()
+        buffer.update_cell(ws, 2, 2, "kansas-city-chiefs")
+        buffer.flush()
+        assert read_worksheet_as_df(**read_kwargs)["Winner"][0] == "kansas-city-chiefs"
+        assert ws.get_all_records.call_count == 3
+
+    # The cache is dropped at the end of the scope
+    read_worksheet_as_df(**read_kwargs)
+    assert ws.get_all_records.call_count == 4
+
+
+def test_worksheet_cache_ttl(mocker):
+    ws = mocker.MagicMock(title="Week 1")
+    ws.get_all_records.return_value = [{"Game ID": "a"}]
+    mocker.patch("nfl_commish.utils.open_sheet").return_value.worksheet.return_value = ws
+    read_kwargs = {"gspread_secret_path": "", "sheet_name": "Admin", "worksheet_name": "Week 1"}
+    with worksheet_cache_scope(ttl=0):
+        read_worksheet_as_df(**read_kwargs)
+        read_worksheet_as_df(**read_kwargs)
+    assert ws.get_all_records.call_count == 2
+
+
+def test_read_worksheets_as_dfs(mocker):
+    sheets = {}
+    for name in ["A", "B", "C"]:
+        sheets[name] = mocker.MagicMock()
+        sheets[name].worksheet.return_value.get_all_records.return_value = [{"Sheet": name}]
+    mocker.patch(
+        "nfl_commish.utils.open_sheet", side_effect=lambda sheet_name, **_: sheets[sheet_name]
+    )
+    with worksheet_cache_scope():
+        dfs = read_worksheets_as_dfs(
+            gspread_secret_path="", sheet_names=["A", "B", "C"], worksheet_name="Week 1"
+        )
+        assert {name: df["Sheet"][0] for name, df in dfs.items()} == {"A": "A", "B": "B", "C": "C"}
+
+        # The worker threads populate the caller's cache scope
+        read_worksheet_as_df(gspread_secret_path="", sheet_name="B", worksheet_name="Week 1")
+        sheets["B"].worksheet.return_value.get_all_records.assert_called_once()
+
+
+def test_token_bucket():
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(requests_per_minute=70, burst=10, clock=lambda: now[0], sleep=sleep)
+    assert bucket.refill_per_second == 1
+
+    # The burst goes through without waiting, then requests are paced at the refill rate
+    assert [bucket.acquire() for _ in range(10)] == [0] * 10
+    assert bucket.acquire() == pytest.approx(1)
+    assert bucket.acquire() == pytest.approx(1)
+
+    # Idle time refills the bucket, up to the burst size
+    now[0] += 1000
+    assert [bucket.acquire() for _ in range(10)] == [0] * 10
+    assert bucket.acquire(tokens=2) == pytest.approx(2)
+
+    # Never more than the quota within any one minute window
+    start, n_requests = now[0], 0
+    while now[0] - start < 60:
+        bucket.acquire()
+        n_requests += 1
+    assert n_requests <= 70
+
+
+def test_token_bucket_bad_burst():
+    with pytest.raises(ValueError):
+        TokenBucket(requests_per_minute=60, burst=60)
+
+
+def test_cell_values_equal():
+    assert cell_values_equal("", None)
+    assert cell_values_equal(float("nan"), "")
+    assert cell_values_equal(16, "16")
+    assert cell_values_equal(16, 16.0)
+    assert cell_values_equal("kansas-city-chiefs", "kansas-city-chiefs")
+    assert not cell_values_equal("", 0)
+    assert not cell_values_equal(16, 15)
+    assert not cell_values_equal("kansas-city-chiefs", "baltimore-ravens")
+
+
+def test_write_buffer_skips_unchanged_cells(mocker):
+    ws = mocker.MagicMock(spreadsheet_id="sheet", id=0, title="Week 1")
+    ws.spreadsheet.title = "Admin"
+    ws.get_all_records.return_value = [{"Game ID": "a", "Winner": "", "Luke Points": 16}]
+    mocker.patch("nfl_commish.utils.open_sheet").return_value.worksheet.return_value = ws
+    with worksheet_cache_scope():
+        read_worksheet_as_df(gspread_secret_path="", sheet_name="Admin", worksheet_name="Week 1")
+
+        # Only the changed cell is sent
+        buffer = WriteBuffer()
+        buffer.update_cell(ws, 2, 2, "baltimore-ravens")
+        buffer.update_cell(ws, 2, 3, 16)
+        buffer.flush()
+        ws.batch_update.assert_called_once()
+        assert ws.batch_update.call_args.args[0] == [
+            {"range": "B2", "values": [["baltimore-ravens"]]}
+        ]
+
+        # Rewriting the same values sends nothing
+        buffer.update_cell(ws, 2, 2, "baltimore-ravens")
+        buffer.update_cell(ws, 2, 3, 16)
+        buffer.flush()
+        ws.batch_update.assert_called_once()
+
+
+def test_read_columns(mocker):
+    ws = mocker.MagicMock()
+    ws.row_values.return_value = ["Game ID", "Home Team", "Winner", "Luke Points"]
+    ws.batch_get.return_value = [[["a"], ["b"], ["c"]], [["chiefs"], [], ["ravens"]], [["16"]]]
+    df = read_columns(ws, columns=["Game ID", "Winner", "Luke Points"])
+    assert ws.batch_get.call_args.args[0] == ["A2:A", "C2:C", "D2:D"]
+
+    # Formatted values are numericised, as in a full read with get_all_records
+    assert ws.batch_get.call_args.kwargs["value_render_option"] == ValueRenderOption.formatted
+    assert df["Game ID"].tolist() == ["a", "b", "c"]
+    assert df["Winner"].tolist() == ["chiefs", "", "ravens"]
+    assert df["Luke Points"].tolist() == [16, "", ""]
+
+    with pytest.raises(ValueError):
+        read_columns(ws, columns=["Andrew Points"])
+
+
+def test_read_worksheet_columns_matches_snapshot(mocker):
+    # The same cell reads the same whether it comes from the snapshot or a column read
+    ws = mocker.MagicMock(title="Week 1")
+    ws.get_all_records.return_value = [{"Game ID": "a", "Luke Points": 7}]
+    ws.row_values.return_value = ["Game ID", "Luke Points"]
+    ws.batch_get.return_value = [[["a"]], [["7"]]]
+    mocker.patch("nfl_commish.utils.open_sheet").return_value.worksheet.return_value = ws
+    read_kwargs = {"gspread_secret_path": "", "sheet_name": "Admin", "worksheet_name": "Week 1"}
+    columns = ["Game ID", "Luke Points"]
+
+    with worksheet_cache_scope():
+        missed = read_worksheet_columns(columns=columns, **read_kwargs)
+        read_worksheet_as_df(**read_kwargs)
+        hit = read_worksheet_columns(columns=columns, **read_kwargs)
+    assert (
+        missed.to_dict("records") == hit.to_dict("records") == [{"Game ID": "a", "Luke Points": 7}]
+    )
+    render_option = ValueRenderOption.formatted
+    assert ws.get_all_records.call_args.kwargs["value_render_option"] == render_option
+    assert ws.batch_get.call_args.kwargs["value_render_option"] == render_option
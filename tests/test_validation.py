@@ -0,0 +1,89 @@
+import pandas as pd
+
+from nfl_commish.validation import validate_week_picks
+
+TEAMS = [
+    ("kansas-city-chiefs", "baltimore-ravens"),
+    ("philadelphia-eagles", "green-bay-packers"),
+    ("atlanta-falcons", "pittsburgh-steelers"),
+    ("buffalo-bills", "arizona-cardinals"),
+]
+GAME_IDS = ["a", "b", "c", "d"]
+
+
+def user_df(picks, confidences):
+    return pd.DataFrame(
+        {
+            "Game ID": GAME_IDS,
+            "Home Team": [home for home, _ in TEAMS],
+            "Away Team": [away for _, away in TEAMS],
+            "Predicted Winner": picks,
+            "Confidence Rank": confidences,
+        }
+    )
+
+
+def test_validate_week_picks():
+    user_dfs = {
+        "Luke": user_df(["Chiefs", "Eagles", "Steelrs", "bills"], [16, 15, 14, 13]),
+        "Andrew": user_df(["Chiefs", "Jets", "", "Bills"], [16, 16, "", "12.5"]),
+        "Shivam": user_df(["KC", "GB", "ATL", "ARI"], [16, 3, 15, "x"]),
+        "Spuff": user_df(["Ravens", "Packers", "Falcons", "Bills"], [13, 14, 15, 16]).iloc[:3],
+    }
+    report = validate_week_picks(user_dfs=user_dfs, game_ids=GAME_IDS)
+    assert report.n_games == 4
+    assert report.min_rank == 13
+    assert report.invalid_players == ["Andrew", "Shivam", "Spuff"]
+    assert report.players["Luke"].is_valid
+
+    andrew = report.players["Andrew"]
+    assert andrew.missing_game_ids == ["c"]
+    assert andrew.unknown_team_game_ids == ["b"]
+    assert andrew.invalid_confidence_game_ids == ["d"]
+    assert andrew.duplicate_ranks == [16]
+    assert andrew.missing_ranks == [13, 14, 15]
+
+    shivam = report.players["Shivam"]
+    assert shivam.out_of_range_game_ids == ["b"]
+    assert shivam.invalid_confidence_game_ids == ["d"]
+    assert shivam.missing_ranks == [13, 14]
+    assert shivam.unknown_team_game_ids == []
+
+    # Rows missing from a player's sheet count as missing picks
+    assert report.players["Spuff"].missing_game_ids == ["d"]
+    assert report.players["Spuff"].missing_ranks == [16]
+
+
+def test_validate_week_picks_required_games():
+    # At a partial lock (e.g. Thursday night), the other games and their ranks can still be picked
+    user_dfs = {"Luke": user_df(["Chiefs", "", "", ""], [16, "", "", ""])}
+    report = validate_week_picks(user_dfs=user_dfs, game_ids=GAME_IDS, required_game_ids=["a"])
+    assert report.players["Luke"].missing_game_ids == []
+    assert report.players["Luke"].missing_ranks == []
+    assert report.is_valid
+
+    # Once every game is locked, they cannot
+    report = validate_week_picks(user_dfs=user_dfs, game_ids=GAME_IDS, required_game_ids=GAME_IDS)
+    assert report.players["Luke"].missing_game_ids == ["b", "c", "d"]
+    assert report.players["Luke"].missing_ranks == [13, 14, 15]
+
+
+def test_validate_week_picks_unreadable_sheet():
+    # A header-only sheet is read as an empty frame - report it rather than raising
+    user_dfs = {"Luke": pd.DataFrame([]), "Andrew": user_df(["Chiefs"] * 4, [16, 15, 14, 13])}
+    report = validate_week_picks(user_dfs=user_dfs, game_ids=GAME_IDS, required_game_ids=["a"])
+    assert list(report.players) == ["Luke", "Andrew"]
+    assert report.invalid_players == ["Luke", "Andrew"]
+    assert report.players["Luke"].missing_columns == [
+        "Game ID",
+        "Home Team",
+        "Away Team",
+        "Predicted Winner",
+        "Confidence Rank",
+    ]
+    assert report.players["Luke"].missing_game_ids == ["a"]
+    assert report.players["Andrew"].missing_columns == []
+
+    # Even with no readable sheets at all
+    report = validate_week_picks(user_dfs={"Luke": pd.DataFrame([])}, game_ids=GAME_IDS)
+    assert report.players["Luke"].missing_game_ids == GAME_IDS